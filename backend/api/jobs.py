@@ -4,7 +4,8 @@ from models import User, Job
 from services.resume_parser import ResumeParser
 from services.vector_service import VectorService
 from services.job_matcher import JobMatcher
-from utils.helpers import format_error_response, format_success_response, paginate_results
+from services.match_store import MatchStore
+from utils.helpers import format_error_response, format_success_response, paginate_results, enqueue_task
 from utils.decorators import role_required
 from datetime import datetime
 import os
@@ -24,6 +25,12 @@ def get_db():
     return current_app.mongo_db
 
 
+def _company_name(db, employer_id):
+    """Company name stored in a job's vector payload"""
+    user = User.from_mongo(db.users.find_one({'id': employer_id}))
+    return user.company_name if user else ''
+
+
 @jobs_bp.route('', methods=['POST'])
 @jwt_required()
 @role_required('employer', 'admin')
@@ -73,34 +80,15 @@ def create_job():
         # Create job object
         job = Job(job_data_dict)
 
-        # Generate job embedding
-        embedding_data = {
-            'title': job.title,
-            'description': job.description,
-            'required_skills': job.required_skills or [],
-            'preferred_skills': job.preferred_skills or [],
-            'experience_years': job.experience_years,
-            'location': job.location
-        }
-        job_embedding = job_matcher.generate_job_embedding(embedding_data)
+        # Generate job vectors (title, skills, full text) in one batched encode
+        job_vectors = job_matcher.generate_job_vectors(job.to_embedding_data())
 
         # Store vector in Qdrant
-        vector_metadata = {
-            'job_id': job.id,
-            'required_skills': job.required_skills or [],
-            'preferred_skills': job.preferred_skills or [],
-            'experience_years': job.experience_years,
-            'location': job.location,
-            'employment_type': job.employment_type or '',
-            'salary_min': job.salary_min or 0,
-            'salary_max': job.salary_max or 0,
-            'category': job.category or '',
-            'company': user.company_name or ''
-        }
+        vector_metadata = job.to_vector_metadata(company=user.company_name)
 
         vector_id = vector_service.store_job_vector(
             job_id=job.id,
-            embedding=job_embedding,
+            vectors=job_vectors,
             metadata=vector_metadata
         )
 
@@ -111,8 +99,13 @@ def create_job():
 
         # Store job in MongoDB
         job_mongo = job.to_mongo()
+        job_mongo.update(JobMatcher.job_skill_ids(job_mongo))
         result = db.jobs.insert_one(job_mongo)
 
+        # Precompute the job's candidate matches into the match store
+        if os.getenv('MATCH_STORE_PRECOMPUTE', 'False') == 'True':
+            enqueue_task('tasks.generate_job_matches', job.id)
+
         logger.info(f"Job created: {job.id} by employer: {current_user_id}")
 
         return format_success_response(
@@ -260,44 +253,48 @@ def update_job(job_id):
             'status'
         ]
 
+        # Only re-encode when the text that feeds the job vectors actually changes
+        old_vector_texts = JobMatcher.build_job_vector_texts(job.to_embedding_data())
+
         update_dict = {}
         for field in updatable_fields:
             if field in data:
                 setattr(job, field, data[field])
                 update_dict[field] = data[field]
 
-        # Regenerate embedding if key fields changed
-        if any(field in data for field in ['title', 'description', 'required_skills', 'preferred_skills']):
-            embedding_data = {
-                'title': job.title,
-                'description': job.description,
-                'required_skills': job.required_skills or [],
-                'preferred_skills': job.preferred_skills or [],
-                'experience_years': job.experience_years,
-                'location': job.location
-            }
-            new_embedding = job_matcher.generate_job_embedding(embedding_data)
-
-            # Update vector in Qdrant
-            user_doc = db.users.find_one({'id': job.employer_id})
-            user = User.from_mongo(user_doc)
-            vector_metadata = {
-                'job_id': job.id,
-                'required_skills': job.required_skills or [],
-                'preferred_skills': job.preferred_skills or [],
-                'experience_years': job.experience_years,
-                'location': job.location,
-                'employment_type': job.employment_type or '',
-                'salary_min': job.salary_min or 0,
-                'salary_max': job.salary_max or 0,
-                'category': job.category or '',
-                'company': user.company_name or ''
-            }
-
-            vector_service.store_job_vector(
+        if 'required_skills' in update_dict or 'preferred_skills' in update_dict:
+            update_dict.update(JobMatcher.job_skill_ids(job.to_embedding_data()))
+        if update_dict:
+            # Also marks the job's stored candidate matches stale
+            update_dict['updated_at'] = datetime.utcnow()
+
+        embedding_changed = JobMatcher.build_job_vector_texts(job.to_embedding_data()) != old_vector_texts
+        # Jobs created before deterministic IDs point at a legacy vector and need a full store
+        legacy_vector = job.vector_id != vector_service.job_vector_id(job.id)
+
+        if update_dict and (embedding_changed or legacy_vector):
+            new_vectors = job_matcher.generate_job_vectors(job.to_embedding_data())
+
+            # Update vector in Qdrant (same point ID, so this replaces it in place)
+            vector_id = vector_service.store_job_vector(
                 job_id=job.id,
-                embedding=new_embedding,
-                metadata=vector_metadata
+                vectors=new_vectors,
+                metadata=job.to_vector_metadata(company=_company_name(db, job.employer_id)),
+                replace=True
+            )
+
+            if vector_id and vector_id != job.vector_id:
+                if job.vector_id:
+                    vector_service.delete_job_vector(job.vector_id)
+                job.vector_id = vector_id
+                update_dict['vector_id'] = vector_id
+
+        elif update_dict:
+            # Salary, status, employment type, ... only touch the payload
+            vector_service.update_job_payload(
+                job.id,
+                job.to_vector_metadata(company=_company_name(db, job.employer_id)),
+                overwrite=True
             )
 
         # Update job in MongoDB
@@ -341,12 +338,14 @@ def delete_job(job_id):
         if role != 'admin' and job.employer_id != current_user_id:
             return format_error_response("Access denied", 403)
 
-        # Delete vector from Qdrant
-        if job.vector_id:
-            vector_service.delete_job_vector(job.vector_id)
+        # Delete vector from Qdrant (legacy random ID and deterministic ID)
+        for vector_id in {job.vector_id, vector_service.job_vector_id(job.id)}:
+            if vector_id:
+                vector_service.delete_job_vector(vector_id)
 
         # Delete from MongoDB
         db.jobs.delete_one({'id': job_id})
+        MatchStore(db).delete('job', [job_id])
 
         logger.info(f"Job deleted: {job_id}")
 
@@ -438,6 +437,9 @@ def close_job(job_id):
             }}
         )
 
+        # Keep the payload in sync so vector search stops returning the job
+        vector_service.update_job_payload(job_id, {'status': 'closed'})
+
         logger.info(f"Job closed: {job_id}")
 
         return format_success_response(None, "Job closed successfully")
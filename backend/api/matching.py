@@ -4,6 +4,7 @@ from models import User, Job, Application
 from services.resume_parser import ResumeParser
 from services.vector_service import VectorService
 from services.job_matcher import JobMatcher
+from services.match_store import MatchStore
 from utils.helpers import format_error_response, format_success_response
 from utils.decorators import role_required
 from datetime import datetime
@@ -47,7 +48,16 @@ def get_matched_jobs():
         location = request.args.get('location')
         employment_type = request.args.get('employment_type')
         min_salary = request.args.get('min_salary', type=int)
+        category = request.args.get('category')
+        remote = request.args.get('remote', 'false').lower() == 'true'
         limit = request.args.get('limit', 10, type=int)
+        cursor = request.args.get('cursor')
+        min_similarity = request.args.get('min_similarity', type=float)
+        min_score = request.args.get('min_score', type=float)
+        try:
+            vector = _parse_vector_param(request.args.get('vector', VectorService.DEFAULT_JOB_VECTOR))
+        except ValueError as e:
+            return format_error_response(str(e), 400)
 
         filters = {}
         if location:
@@ -56,40 +66,70 @@ def get_matched_jobs():
             filters['employment_type'] = employment_type
         if min_salary:
             filters['min_salary'] = min_salary
+        if category:
+            filters['category'] = category
+        if remote:
+            filters['remote'] = True
+
+        # Unfiltered queries are served from the match store while its entry is fresh
+        match_store = MatchStore(db)
+        default_query = (not filters and min_similarity is None and min_score is None
+                         and vector == VectorService.DEFAULT_JOB_VECTOR)
+        try:
+            page = _stored_page(match_store, 'resume', str(resume['_id']), resume.get('updated_at'),
+                                cursor, limit) if default_query else None
+        except ValueError as e:
+            return format_error_response(str(e), 400)
+
+        job_docs = {}
+        if page:
+            # Jobs closed, expired or deleted since the entry was stored are left out
+            job_docs.update(Job.open_jobs(db.jobs, {match['job_id'] for match in page['matches']}))
+            open_matches = [match for match in page['matches'] if match['job_id'] in job_docs]
+            page['stats']['dropped'] = len(page['matches']) - len(open_matches)
+            page['matches'] = open_matches
+        else:
+            # Use the resume vector already stored in Qdrant
+            resume_embedding = None
+            if resume.get('vector_id'):
+                resume_embedding = vector_service.get_resume_vector(resume['vector_id'])
+
+            # Point missing from Qdrant - fall back to encoding the text stored resume vectors come from
+            if not resume_embedding:
+                resume_embedding = resume_parser.generate_embedding(
+                    ResumeParser.build_embedding_text(resume['parsed_data'])
+                )
 
-        # Get resume embedding from Qdrant or regenerate
-        resume_embedding = None
-        if 'vector_id' in resume:
-            # In production, retrieve from Qdrant
-            # For now, regenerate
-            pass
+            # Closed/expired jobs are filtered out by Qdrant; Mongo has the final say in case a payload lags
+            def existing_jobs(hits):
+                job_docs.update(Job.open_jobs(db.jobs, {hit['job_id'] for hit in hits}))
+                return [hit for hit in hits if hit['job_id'] in job_docs]
+
+            # Get a page of matched jobs
+            try:
+                page = job_matcher.match_jobs_for_candidate_page(
+                    resume_data=ResumeParser.build_match_data(resume['parsed_data']),
+                    resume_embedding=resume_embedding,
+                    filters=filters,
+                    limit=limit,
+                    cursor=cursor,
+                    min_similarity=min_similarity,
+                    min_score=min_score,
+                    accept=existing_jobs,
+                    vector=vector
+                )
+            except ValueError as e:
+                return format_error_response(str(e), 400)
 
-        # Regenerate embedding
-        embedding_text = f"""
-        Skills: {', '.join(resume['parsed_data'].get('skills', []))}
-        """
-        resume_embedding = resume_parser.generate_embedding(embedding_text)
+            page['stats']['from_store'] = False
+            if default_query and not cursor:
+                match_store.save('resume', str(resume['_id']), page, user_id=current_user_id)
+        matches = page['matches']
 
-        # Prepare resume data
-        resume_data = {
-            'skills': resume['parsed_data'].get('skills', []),
-            'experience_years': len(resume['parsed_data'].get('experience', [])),
-            'location': resume['parsed_data'].get('personal_info', {}).get('location', '')
-        }
-
-        # Get matched jobs
-        matches = job_matcher.match_jobs_for_candidate(
-            resume_data=resume_data,
-            resume_embedding=resume_embedding,
-            filters=filters,
-            limit=limit
-        )
-
-        # Enrich with job details
         enriched_matches = []
         for match in matches:
-            job_doc = db.jobs.find_one({'id': match['job_id']})
-            if job_doc and job_doc.get('status') == 'active':
+            job_doc = job_docs.get(match['job_id'])
+            if job_doc:
                 job = Job.from_mongo(job_doc)
                 match_data = {
                     'job': job.to_dict(include_employer=True),
@@ -108,7 +148,9 @@ def get_matched_jobs():
 
         return format_success_response({
             'matches': enriched_matches,
-            'count': len(enriched_matches)
+            'count': len(enriched_matches),
+            'next_cursor': page['next_cursor'],
+            'stats': page['stats']
         })
 
     except Exception as e:
@@ -146,6 +188,13 @@ def get_matched_candidates():
         location = request.args.get('location')
         min_experience = request.args.get('min_experience', type=int)
         limit = request.args.get('limit', 20, type=int)
+        cursor = request.args.get('cursor')
+        min_similarity = request.args.get('min_similarity', type=float)
+        min_score = request.args.get('min_score', type=float)
+        # Which stored job vector to query with, e.g. 'skills' for a skill-centric search
+        vector = request.args.get('vector', VectorService.DEFAULT_JOB_VECTOR)
+        if vector not in VectorService.JOB_VECTORS:
+            return format_error_response(f"vector must be one of {', '.join(VectorService.JOB_VECTORS)}", 400)
 
         filters = {}
         if location:
@@ -153,60 +202,76 @@ def get_matched_candidates():
         if min_experience:
             filters['min_experience'] = min_experience
 
-        # Generate job embedding
-        job_data = {
-            'title': job.title,
-            'description': job.description,
-            'required_skills': job.required_skills or [],
-            'preferred_skills': job.preferred_skills or [],
-            'experience_years': job.experience_years,
-            'location': job.location
-        }
-        job_embedding = job_matcher.generate_job_embedding(job_data)
-
-        # Get matched candidates
-        matches = job_matcher.match_candidates_for_job(
-            job_data=job_data,
-            job_embedding=job_embedding,
-            filters=filters,
-            limit=limit
-        )
-
-        # Enrich with candidate details
-        enriched_matches = []
-        for match in matches:
-            user_doc = db.users.find_one({'id': match['user_id']})
-            if user_doc and user_doc.get('is_active'):
-                user = User.from_mongo(user_doc)
-                # Get candidate's resume
-                resume = db.resumes.find_one(
-                    {'user_id': match['user_id']},
-                    sort=[('created_at', -1)]
+        # Unfiltered queries are served from the match store while its entry is fresh
+        match_store = MatchStore(db)
+        default_query = (not filters and min_similarity is None and min_score is None
+                         and vector == VectorService.DEFAULT_JOB_VECTOR)
+        try:
+            page = _stored_page(match_store, 'job', job.id, job_doc.get('updated_at'),
+                                cursor, limit) if default_query else None
+        except ValueError as e:
+            return format_error_response(str(e), 400)
+
+        if page:
+            # Candidates deactivated, removed or left without a resume since the entry was stored are left out
+            users, resumes = candidates = _load_candidates(db, {match['user_id'] for match in page['matches']})
+            active_matches = [match for match in page['matches']
+                              if users.get(match['user_id'], {}).get('is_active') and match['user_id'] in resumes]
+            page['stats']['dropped'] = len(page['matches']) - len(active_matches)
+            page['matches'] = active_matches
+            enriched_matches = _enrich_candidate_matches(db, page['matches'], candidates)
+        else:
+            job_data = job.to_embedding_data()
+
+            # Use the job vector stored at create/update time
+            job_embedding = None
+            if job.vector_id:
+                job_embedding = vector_service.get_job_vector(job.vector_id, vector=vector)
+
+            # Point missing from Qdrant - fall back to encoding
+            if not job_embedding:
+                job_vectors = job_matcher.generate_job_vectors(job_data) or {}
+                job_embedding = job_vectors.get(vector)
+
+            # Drop hits whose user is missing or inactive before they take a slot
+            users, resumes = {}, {}
+
+            def active_candidates(hits):
+                found_users, found_resumes = _load_candidates(db, {hit['user_id'] for hit in hits})
+                users.update(found_users)
+                resumes.update(found_resumes)
+                return [hit for hit in hits if users.get(hit['user_id'], {}).get('is_active')]
+
+            # Get a page of matched candidates
+            try:
+                page = job_matcher.match_candidates_for_job_page(
+                    job_data=job_data,
+                    job_embedding=job_embedding,
+                    filters=filters,
+                    limit=limit,
+                    cursor=cursor,
+                    min_similarity=min_similarity,
+                    min_score=min_score,
+                    accept=active_candidates
                 )
+            except ValueError as e:
+                return format_error_response(str(e), 400)
 
-                candidate_data = {
-                    'candidate': user.to_dict(include_email=False),
-                    'resume_summary': {
-                        'skills': resume['parsed_data'].get('skills', []) if resume else [],
-                        'experience_years': len(resume['parsed_data'].get('experience', [])) if resume else 0,
-                        'education': resume['parsed_data'].get('education', []) if resume else []
-                    } if resume else None,
-                    'matching': {
-                        'similarity_score': match['similarity_score'],
-                        'overall_score': match['overall_score'],
-                        'skill_match_percentage': match['skill_match_percentage'],
-                        'experience_match': match['experience_match'],
-                        'location_match': match['location_match']
-                    }
-                }
-                enriched_matches.append(candidate_data)
+            page['stats']['from_store'] = False
+            if default_query and not cursor:
+                match_store.save('job', job.id, page)
+
+            # Enrich with candidate details
+            enriched_matches = _enrich_candidate_matches(db, page['matches'], (users, resumes))
 
         logger.info(f"Found {len(enriched_matches)} matched candidates for job: {job_id}")
 
         return format_success_response({
             'job': job.to_dict(),
             'matches': enriched_matches,
-            'count': len(enriched_matches)
+            'count': len(enriched_matches),
+            'next_cursor': page['next_cursor'],
+            'stats': page['stats']
         })
 
     except Exception as e:
@@ -214,6 +279,167 @@ def get_matched_candidates():
         return format_error_response("Failed to retrieve matched candidates", 500)
 
 
+@matching_bp.route('/candidates/my-jobs', methods=['GET'])
+@jwt_required()
+@role_required('employer', 'admin')
+def get_matched_candidates_for_my_jobs():
+    """Get matched candidates for all of the current employer's open jobs"""
+    try:
+        db = get_db()
+        current_user_id = get_jwt_identity()
+
+        # Get filters
+        location = request.args.get('location')
+        min_experience = request.args.get('min_experience', type=int)
+        limit = request.args.get('limit', 10, type=int)
+        max_jobs = request.args.get('max_jobs', 50, type=int)
+
+        filters = {}
+        if location:
+            filters['location'] = location
+        if min_experience:
+            filters['min_experience'] = min_experience
+
+        jobs = [Job.from_mongo(doc) for doc in
+                db.jobs.find({'employer_id': current_user_id, 'status': 'active'})
+                .sort('posted_at', -1)
+                .limit(max_jobs)]
+
+        # Stored job vectors in one retrieve; encode only the ones missing from Qdrant
+        stored_vectors = vector_service.get_job_vectors([job.vector_id for job in jobs if job.vector_id])
+        missing = [job for job in jobs if not stored_vectors.get(job.vector_id)]
+        encoded = dict(zip(
+            [job.id for job in missing],
+            job_matcher.generate_job_embeddings([job.to_embedding_data() for job in missing])
+        ))
+
+        queries = []
+        for job in jobs:
+            job_embedding = stored_vectors.get(job.vector_id) or encoded.get(job.id)
+            if job_embedding:
+                queries.append((job, {
+                    'job_data': job.to_embedding_data(),
+                    'job_embedding': job_embedding,
+                    'filters': filters
+                }))
+
+        # One batched vector search for every job
+        batch_matches = job_matcher.match_candidates_for_jobs(
+            [query for _, query in queries],
+            limit=limit
+        )
+
+        # Candidate profiles for every job loaded in one pass
+        candidates = _load_candidates(
+            db, {match['user_id'] for matches in batch_matches for match in matches}
+        )
+
+        results = []
+        for (job, _), matches in zip(queries, batch_matches):
+            job_matches = _enrich_candidate_matches(db, matches, candidates)
+            results.append({
+                'job': job.to_dict(),
+                'matches': job_matches,
+                'count': len(job_matches)
+            })
+
+        logger.info(f"Matched candidates for {len(results)} jobs of employer: {current_user_id}")
+
+        return format_success_response({
+            'jobs': results,
+            'count': len(results)
+        })
+
+    except Exception as e:
+        logger.error(f"Get matched candidates for employer jobs error: {e}")
+        return format_error_response("Failed to retrieve matched candidates", 500)
+
+
+def _stored_page(match_store, kind, owner_id, updated_at, cursor, limit):
+    """
+    Page from a fresh match-store entry, or None to compute it live
+    Raises ValueError for a malformed cursor
+    """
+    entry = match_store.get(kind, owner_id, updated_at)
+    page = match_store.page(entry, cursor, limit) if entry else None
+    if page:
+        page['stats'] = {'fetch_rounds': 0, 'fetched': 0, 'dropped': 0, 'from_store': True}
+    return page
+
+
+def _parse_vector_param(value):
+    """
+    'skills' -> 'skills'; 'skills:0.7,full:0.3' -> {'skills': 0.7, 'full': 0.3}
+    Raises ValueError for unknown vectors or bad weights
+    """
+    if ':' not in value and ',' not in value:
+        names = {value: None}
+    else:
+        names = {}
+        for part in value.split(','):
+            name, _, weight = part.partition(':')
+            try:
+                names[name.strip()] = float(weight) if weight else 1.0
+            except ValueError:
+                raise ValueError(f"Invalid vector weight: {part}")
+
+    unknown = [name for name in names if name not in VectorService.JOB_VECTORS]
+    if unknown:
+        raise ValueError(f"vector must be one of {', '.join(VectorService.JOB_VECTORS)}")
+    if any(weight is not None and weight <= 0 for weight in names.values()):
+        raise ValueError("Vector weights must be positive")
+
+    if len(names) == 1 and None in names.values():
+        return value
+    return names
+
+
+def _load_candidates(db, user_ids):
+    """Users and their latest resumes, keyed by user ID, with one query each"""
+    user_ids = list(user_ids)
+    users = {doc['id']: doc for doc in db.users.find({'id': {'$in': user_ids}})}
+
+    resumes = {}
+    for resume in db.resumes.find({'user_id': {'$in': user_ids}}).sort('created_at', -1):
+        resumes.setdefault(resume['user_id'], resume)
+
+    return users, resumes
+
+
+def _enrich_candidate_matches(db, matches, candidates=None):
+    """
+    Attach candidate profiles and latest resume summaries to matches
+    Inactive users are dropped
+    """
+    users, resumes = candidates or _load_candidates(db, {match['user_id'] for match in matches})
+
+    enriched_matches = []
+    for match in matches:
+        user_doc = users.get(match['user_id'])
+        if user_doc and user_doc.get('is_active'):
+            user = User.from_mongo(user_doc)
+            resume = resumes.get(match['user_id'])
+
+            candidate_data = {
+                'candidate': user.to_dict(include_email=False),
+                'resume_summary': {
+                    'skills': resume['parsed_data'].get('skills', []),
+                    'experience_years': len(resume['parsed_data'].get('experience', [])),
+                    'education': resume['parsed_data'].get('education', [])
+                } if resume else None,
+                'matching': {
+                    'similarity_score': match['similarity_score'],
+                    'overall_score': match['overall_score'],
+                    'skill_match_percentage': match['skill_match_percentage'],
+                    'experience_match': match['experience_match'],
+                    'location_match': match['location_match']
+                }
+            }
+            enriched_matches.append(candidate_data)
+
+    return enriched_matches
+
+
 @matching_bp.route('/apply', methods=['POST'])
 @jwt_required()
 @role_required('candidate')
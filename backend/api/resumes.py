@@ -4,8 +4,9 @@ from werkzeug.utils import secure_filename
 from models import User
 from services.resume_parser import ResumeParser
 from services.vector_service import VectorService
+from services.match_store import MatchStore
 from utils.validators import allowed_file
-from utils.helpers import format_error_response, format_success_response
+from utils.helpers import format_error_response, format_success_response, enqueue_task
 from utils.decorators import role_required
 from bson.objectid import ObjectId
 import os
@@ -65,35 +66,17 @@ def upload_resume():
         # Extract metadata for vector storage
         parsed_data = parsed_result['parsed_data']
 
-        # Calculate experience years from work history
-        experience_years = 0
-        if 'experience' in parsed_data and isinstance(parsed_data['experience'], list):
-            for exp in parsed_data['experience']:
-                if isinstance(exp, dict):
-                    # Simple calculation - can be enhanced
-                    experience_years += 1
+        metadata = ResumeParser.build_vector_metadata(current_user_id, parsed_data, user.location)
 
-        metadata = {
-            'user_id': current_user_id,
-            'skills': parsed_data.get('skills', []),
-            'experience_years': experience_years,
-            'location': parsed_data.get('personal_info', {}).get('location', user.location or ''),
-            'education_level': '',
-            'job_titles': [],
-            'industries': []
-        }
-
-        # Extract education level
-        if 'education' in parsed_data and isinstance(parsed_data['education'], list) and parsed_data['education']:
-            education = parsed_data['education'][0]
-            if isinstance(education, dict):
-                metadata['education_level'] = education.get('degree', '')
+        # Allocate the Mongo ID up front so the vector ID can be derived from it
+        resume_oid = ObjectId()
 
         # Store vector in Qdrant
         vector_id = vector_service.store_resume_vector(
             user_id=current_user_id,
             embedding=parsed_result['embedding'],
-            metadata=metadata
+            metadata=metadata,
+            resume_id=str(resume_oid)
         )
 
         if not vector_id:
@@ -101,6 +84,7 @@ def upload_resume():
 
         # Store in MongoDB
         resume_doc = {
+            '_id': resume_oid,
             'user_id': current_user_id,
             'raw_text': parsed_result['raw_text'],
             'parsed_data': parsed_data,
@@ -113,6 +97,10 @@ def upload_resume():
         result = db.resumes.insert_one(resume_doc)
         resume_id = str(result.inserted_id)
 
+        # Precompute the resume's job matches into the match store
+        if os.getenv('MATCH_STORE_PRECOMPUTE', 'False') == 'True':
+            enqueue_task('tasks.generate_resume_matches', resume_id)
+
         logger.info(f"Resume uploaded successfully for user: {current_user_id}")
 
         return format_success_response({
@@ -179,9 +167,13 @@ def update_resume(resume_id):
 
         data = request.get_json()
 
+        # Only re-encode when the text that feeds the embedding actually changes
+        old_embedding_text = ResumeParser.build_embedding_text(resume['parsed_data'])
+
         # Update parsed data
         if 'parsed_data' in data:
             resume['parsed_data'].update(data['parsed_data'])
+            ResumeParser.attach_skill_ids(resume['parsed_data'])
 
         resume['updated_at'] = datetime.utcnow()
 
@@ -191,30 +183,23 @@ def update_resume(resume_id):
             {'$set': resume}
         )
 
-        # Regenerate embedding if skills changed
-        if 'parsed_data' in data and 'skills' in data['parsed_data']:
-            # Generate new embedding
-            embedding_text = f"""
-            Skills: {', '.join(resume['parsed_data'].get('skills', []))}
-            """
-            new_embedding = resume_parser.generate_embedding(embedding_text)
-
-            # Update vector in Qdrant
-            metadata = {
-                'user_id': current_user_id,
-                'skills': resume['parsed_data'].get('skills', []),
-                'experience_years': len(resume['parsed_data'].get('experience', [])),
-                'location': resume['parsed_data'].get('personal_info', {}).get('location', ''),
-                'education_level': '',
-                'job_titles': [],
-                'industries': []
-            }
-
-            vector_service.update_resume_vector(
-                vector_id=resume['vector_id'],
-                embedding=new_embedding,
-                metadata=metadata
+        if 'parsed_data' in data and resume.get('vector_id'):
+            user = User.from_mongo(db.users.find_one({'id': current_user_id}))
+            metadata = ResumeParser.build_vector_metadata(
+                current_user_id, resume['parsed_data'], user.location if user else ''
             )
+            metadata['resume_id'] = resume_id
+
+            embedding_text = ResumeParser.build_embedding_text(resume['parsed_data'])
+            if embedding_text != old_embedding_text:
+                vector_service.update_resume_vector(
+                    vector_id=resume['vector_id'],
+                    embedding=resume_parser.generate_embedding(embedding_text),
+                    metadata=metadata
+                )
+            else:
+                # Location, personal info, ... only touch the payload
+                vector_service.update_resume_payload(resume['vector_id'], metadata, overwrite=True)
 
         logger.info(f"Resume updated: {resume_id}")
 
@@ -250,6 +235,7 @@ def delete_resume(resume_id):
 
         # Delete from MongoDB
         db.resumes.delete_one({'_id': ObjectId(resume_id)})
+        MatchStore(db).delete('resume', [resume_id])
 
         logger.info(f"Resume deleted: {resume_id}")
 
@@ -3,6 +3,8 @@ from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 from models import db, client
 from config import config
+from services.model_registry import model_registry
+from services.embedding_engine import embedding_engine
 import logging
 import os
 
@@ -51,13 +53,36 @@ def create_app(config_name=None):
     app.register_blueprint(resumes_bp, url_prefix='/api/resumes')
     app.register_blueprint(matching_bp, url_prefix='/api/matching')
 
+    # The in-process vector backend has no init_qdrant.py step - create its collections
+    # here; otherwise create/verify Qdrant payload indexes (both idempotent)
+    if app.config.get('VECTOR_BACKEND') == 'inprocess':
+        from services.vector_service import VectorService
+        VectorService().initialize_collections()
+    elif app.config.get('QDRANT_ENSURE_INDEXES'):
+        from services.vector_service import VectorService
+        VectorService().ensure_payload_indexes()
+
+    # Load ML models once per worker process, off the request path
+    if app.config.get('WARM_UP_MODELS'):
+        model_registry.warm_up(background=True)
+
     # Health check endpoint
     @app.route('/health', methods=['GET'])
     def health_check():
         return jsonify({
             'status': 'healthy',
             'service': 'SkillBridge API',
-            'version': '1.0.0'
+            'version': '1.0.0',
+            'models': model_registry.status()
+        }), 200
+
+    # Per-process performance counters
+    @app.route('/metrics', methods=['GET'])
+    def metrics():
+        return jsonify({
+            'pid': os.getpid(),
+            'embedding_engine': embedding_engine.metrics(),
+            'embedding_cache': embedding_engine.cache.stats() if embedding_engine.cache else None
         }), 200
 
     # Root endpoint
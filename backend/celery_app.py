@@ -1,4 +1,5 @@
 from celery import Celery
+from celery.signals import worker_process_init
 import os
 from dotenv import load_dotenv
 
@@ -21,10 +22,26 @@ celery.conf.update(
     task_track_started=True,
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
+    beat_schedule={
+        # Run with `celery -A celery_app beat`
+        'reconcile-vectors': {
+            'task': 'tasks.reconcile_vectors',
+            'schedule': float(os.getenv('RECONCILE_INTERVAL_SECONDS', 6 * 60 * 60)),
+        },
+    },
 )
 
+
+@worker_process_init.connect
+def warm_up_models(**kwargs):
+    """Load ML models once in each worker process before it takes tasks"""
+    if os.getenv('WARM_UP_MODELS', 'True') == 'True':
+        from services.model_registry import model_registry
+        model_registry.warm_up()
+
+
 # Import tasks
-from tasks import resume_tasks, job_tasks, notification_tasks
+from tasks import resume_tasks, job_tasks, notification_tasks, vector_tasks
 
 if __name__ == '__main__':
     celery.start()
@@ -29,8 +29,38 @@ class Config:
     QDRANT_HOST = os.getenv('QDRANT_HOST', 'localhost')
     QDRANT_PORT = int(os.getenv('QDRANT_PORT', 6333))
     QDRANT_API_KEY = os.getenv('QDRANT_API_KEY', None)
+    # Transport: 'rest' (HTTP, port 6333) or 'grpc' (one pooled channel per process, port 6334)
+    QDRANT_TRANSPORT = os.getenv('QDRANT_TRANSPORT', 'rest').lower()
+    QDRANT_GRPC_PORT = int(os.getenv('QDRANT_GRPC_PORT', 6334))
+    QDRANT_TIMEOUT = int(os.getenv('QDRANT_TIMEOUT', 30))
     QDRANT_COLLECTION_RESUMES = 'resumes'
     QDRANT_COLLECTION_JOBS = 'jobs'
+    QDRANT_ENSURE_INDEXES = os.getenv('QDRANT_ENSURE_INDEXES', 'True') == 'True'
+    QDRANT_RETRIEVE_BATCH_SIZE = int(os.getenv('QDRANT_RETRIEVE_BATCH_SIZE', 256))
+    QDRANT_UPSERT_BATCH_SIZE = int(os.getenv('QDRANT_UPSERT_BATCH_SIZE', 256))
+    QDRANT_UPSERT_PARALLEL = int(os.getenv('QDRANT_UPSERT_PARALLEL', 4))
+
+    # Collection storage/index settings: QDRANT_QUANTIZATION is none, scalar (int8) or binary
+    QDRANT_QUANTIZATION = os.getenv('QDRANT_QUANTIZATION', 'none').lower()
+    QDRANT_QUANTIZATION_ALWAYS_RAM = os.getenv('QDRANT_QUANTIZATION_ALWAYS_RAM', 'True') == 'True'
+    QDRANT_ON_DISK = os.getenv('QDRANT_ON_DISK', 'False') == 'True'
+    QDRANT_HNSW_M = int(os.getenv('QDRANT_HNSW_M', 16))
+    QDRANT_HNSW_EF_CONSTRUCT = int(os.getenv('QDRANT_HNSW_EF_CONSTRUCT', 100))
+    QDRANT_SEARCH_HNSW_EF = int(os.getenv('QDRANT_SEARCH_HNSW_EF', 0))
+    QDRANT_SEARCH_OVERSAMPLING = float(os.getenv('QDRANT_SEARCH_OVERSAMPLING', 0))
+    QDRANT_SEARCH_RESCORE = os.getenv('QDRANT_SEARCH_RESCORE', 'True') == 'True'
+
+    # Vector backend: 'qdrant' (networked server) or 'inprocess' (NumPy/HNSW in this process)
+    VECTOR_BACKEND = os.getenv('VECTOR_BACKEND', 'qdrant').lower()
+    VECTOR_STORE_PATH = os.getenv('VECTOR_STORE_PATH', '')
+    VECTOR_HNSW_THRESHOLD = int(os.getenv('VECTOR_HNSW_THRESHOLD', 20000))
+
+    # Sharding: split jobs/resumes into one collection per listed payload value (+ 'other')
+    JOB_SHARD_FIELD = os.getenv('JOB_SHARD_FIELD', '')
+    JOB_SHARDS = os.getenv('JOB_SHARDS', '')
+    RESUME_SHARD_FIELD = os.getenv('RESUME_SHARD_FIELD', '')
+    RESUME_SHARDS = os.getenv('RESUME_SHARDS', '')
+    VECTOR_SHARD_PARALLEL = int(os.getenv('VECTOR_SHARD_PARALLEL', 8))
 
     # Google Gemini Configuration
     GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY', '')
@@ -42,6 +72,39 @@ class Config:
     EMBEDDING_MODEL = os.getenv('EMBEDDING_MODEL', 'sentence-transformers/all-mpnet-base-v2')
     EMBEDDING_DIMENSION = int(os.getenv('EMBEDDING_DIMENSION', 768))
     MAX_SEQUENCE_LENGTH = int(os.getenv('MAX_SEQUENCE_LENGTH', 512))
+    EMBEDDING_BATCH_SIZE = int(os.getenv('EMBEDDING_BATCH_SIZE', 32))
+    EMBEDDING_MAX_WAIT_MS = float(os.getenv('EMBEDDING_MAX_WAIT_MS', 5))
+    EMBEDDING_TIMEOUT_SECONDS = float(os.getenv('EMBEDDING_TIMEOUT_SECONDS', 30))
+    EMBEDDING_CACHE_SIZE = int(os.getenv('EMBEDDING_CACHE_SIZE', 10000))
+    EMBEDDING_CACHE_TTL = int(os.getenv('EMBEDDING_CACHE_TTL', 7 * 24 * 3600))
+    EMBEDDING_CACHE_REDIS = os.getenv('EMBEDDING_CACHE_REDIS', 'True') == 'True'
+    SPACY_MODEL = os.getenv('SPACY_MODEL', 'en_core_web_sm')
+    WARM_UP_MODELS = os.getenv('WARM_UP_MODELS', 'False') == 'True'
+
+    # Paged matching: vector fetch rounds and total hits allowed to fill one page
+    MATCH_MAX_FETCH_ROUNDS = int(os.getenv('MATCH_MAX_FETCH_ROUNDS', 4))
+    MATCH_FETCH_BUDGET = int(os.getenv('MATCH_FETCH_BUDGET', 400))
+
+    # Skill taxonomy: alias -> canonical ID dictionary, and the per-process lookup cache size
+    SKILL_TAXONOMY_PATH = os.getenv('SKILL_TAXONOMY_PATH', os.path.join(os.path.dirname(__file__), 'data', 'skills.json'))
+    SKILL_ID_CACHE_SIZE = int(os.getenv('SKILL_ID_CACHE_SIZE', 100000))
+    # Semantic skill matching: memmapped skill-embedding matrix (scripts/build_skill_embeddings.py)
+    # and the cosine similarity at which two skills count as a match
+    SKILL_EMBEDDINGS_PATH = os.getenv('SKILL_EMBEDDINGS_PATH', os.path.join(os.path.dirname(__file__), 'data', 'skill_embeddings.npy'))
+    SKILL_MATCH_THRESHOLD = float(os.getenv('SKILL_MATCH_THRESHOLD', 0.75))
+
+    # Mongo <-> vector store reconciliation (scripts/reconcile_vectors.py, Celery beat)
+    RECONCILE_PAGE_SIZE = int(os.getenv('RECONCILE_PAGE_SIZE', 512))
+    RECONCILE_GRACE_SECONDS = float(os.getenv('RECONCILE_GRACE_SECONDS', 300))
+    RECONCILE_INTERVAL_SECONDS = float(os.getenv('RECONCILE_INTERVAL_SECONDS', 21600))
+    RECONCILE_REPAIR = os.getenv('RECONCILE_REPAIR', 'False') == 'True'
+
+    # Match store (Mongo job_matches): entry lifetime, matches precomputed per job/resume,
+    # version key (bump to invalidate every entry) and whether new jobs/resumes queue a precompute
+    MATCH_STORE_TTL_SECONDS = int(os.getenv('MATCH_STORE_TTL_SECONDS', 3600))
+    MATCH_STORE_SIZE = int(os.getenv('MATCH_STORE_SIZE', 100))
+    MATCH_STORE_VERSION = os.getenv('MATCH_STORE_VERSION', '1')
+    MATCH_STORE_PRECOMPUTE = os.getenv('MATCH_STORE_PRECOMPUTE', 'False') == 'True'
 
     # File Upload Configuration
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
@@ -76,12 +139,14 @@ class ProductionConfig(Config):
     """Production configuration"""
     DEBUG = False
     TESTING = False
+    WARM_UP_MODELS = os.getenv('WARM_UP_MODELS', 'True') == 'True'
 
 
 class TestingConfig(Config):
     """Testing configuration"""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    QDRANT_ENSURE_INDEXES = False
 
 
 config = {
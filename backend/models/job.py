@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
 
 
@@ -130,6 +130,62 @@ class Job:
 
         return doc
 
+    def to_embedding_data(self):
+        """Fields that feed the job embedding"""
+        return {
+            'title': self.title,
+            'description': self.description,
+            'required_skills': self.required_skills or [],
+            'preferred_skills': self.preferred_skills or [],
+            'experience_years': self.experience_years,
+            'location': self.location
+        }
+
+    def to_vector_metadata(self, company=''):
+        """Payload stored alongside the job vector in Qdrant"""
+        return {
+            'job_id': self.id,
+            'required_skills': self.required_skills or [],
+            'preferred_skills': self.preferred_skills or [],
+            'experience_years': self.experience_years,
+            'location': self.location,
+            'employment_type': self.employment_type or '',
+            'salary_min': self.salary_min or 0,
+            'salary_max': self.salary_max or 0,
+            'category': self.category or '',
+            'company': company or '',
+            'status': self.status or 'active',
+            'remote_allowed': bool(self.remote_allowed),
+            'application_deadline': self.deadline_timestamp()
+        }
+
+    def is_open(self, now=None):
+        """Still taking applications: active, with no deadline or one that hasn't passed (see build_job_filter)"""
+        if (self.status or 'active') != 'active':
+            return False
+        deadline = self.deadline_timestamp()
+        return deadline is None or deadline >= (now or datetime.now(timezone.utc).timestamp())
+
+    @staticmethod
+    def open_jobs(collection, job_ids):
+        """{id: document} of the given jobs that still exist and are open"""
+        docs = collection.find({'id': {'$in': list(job_ids)}, 'status': {'$in': ['active', None]}})
+        return {doc['id']: doc for doc in docs if Job.from_mongo(doc).is_open()}
+
+    def deadline_timestamp(self):
+        """Application deadline as a UTC epoch timestamp, or None when unset/unparseable"""
+        deadline = self.application_deadline
+        if isinstance(deadline, str):
+            try:
+                deadline = datetime.fromisoformat(deadline.replace('Z', '+00:00'))
+            except ValueError:
+                return None
+        if not isinstance(deadline, datetime):
+            return None
+        if deadline.tzinfo is None:
+            deadline = deadline.replace(tzinfo=timezone.utc)
+        return deadline.timestamp()
+
     @staticmethod
     def from_mongo(doc):
         """Create Job instance from MongoDB document"""
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark Qdrant transports (REST vs gRPC) for upsert and search throughput.
+
+Each transport gets its own scratch collection of random vectors (dropped
+afterwards), then runs sequential searches through VectorService and
+concurrent searches through AsyncVectorService. Point it at the same server
+the app uses (QDRANT_HOST/QDRANT_PORT/QDRANT_GRPC_PORT).
+
+Usage: python scripts/benchmark_transport.py [--points 20000] [--queries 500]
+                                             [--concurrency 16] [--transports rest grpc]
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+from dotenv import load_dotenv
+from services.vector_service import VectorService
+from services.async_vector_service import AsyncVectorService
+from services.vector_store import create_vector_store, create_async_vector_store
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+
+def percentile_ms(latencies, q):
+    return float(np.percentile(latencies, q) * 1000) if latencies else 0.0
+
+
+def benchmark_sync(service, vectors, queries, collection_name):
+    """Bulk upsert then sequential searches; returns (points/s, queries/s, latencies)"""
+    items = [{'job_id': f"bench-{i}", 'embedding': {name: vector for name in service.JOB_VECTORS},
+              'metadata': {'title': f"Job {i}"}}
+             for i, vector in enumerate(vectors.tolist())]
+
+    start = time.perf_counter()
+    results = service.store_job_vectors_bulk(items, collection_name=collection_name)
+    upsert_seconds = time.perf_counter() - start
+    failed = sum(1 for result in results if not result['success'])
+    if failed:
+        raise RuntimeError(f"{failed} points failed to upsert")
+
+    latencies = []
+    start = time.perf_counter()
+    for query in queries.tolist():
+        began = time.perf_counter()
+        service.search_similar_jobs(query, limit=10)
+        latencies.append(time.perf_counter() - began)
+    search_seconds = time.perf_counter() - start
+
+    return len(items) / upsert_seconds, len(queries) / search_seconds, latencies
+
+
+async def benchmark_async(service, queries, concurrency):
+    """Concurrent searches, at most `concurrency` in flight; returns (queries/s, latencies)"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(query):
+        async with semaphore:
+            began = time.perf_counter()
+            await service.search_similar_jobs(query, limit=10)
+            latencies.append(time.perf_counter() - began)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(query) for query in queries.tolist()))
+    seconds = time.perf_counter() - start
+    await service.close()
+
+    return len(queries) / seconds, latencies
+
+
+def run_transport(transport, vectors, queries, concurrency):
+    """Benchmark one transport against its own scratch collection"""
+    collection_name = f"bench_{transport}_{int(time.time())}"
+    service = VectorService(client=create_vector_store('qdrant', transport))
+    service.job_collection = collection_name
+    service.client.create_collection(
+        collection_name=collection_name,
+        vectors_config=service.vectors_config(collection_name)
+    )
+    service.ensure_payload_indexes({collection_name: service.JOB_PAYLOAD_INDEXES})
+
+    try:
+        upsert_rate, search_rate, latencies = benchmark_sync(service, vectors, queries, collection_name)
+
+        async_service = AsyncVectorService(client=create_async_vector_store('qdrant', transport))
+        async_service.job_collection = collection_name
+        async_rate, async_latencies = asyncio.run(benchmark_async(async_service, queries, concurrency))
+    finally:
+        service.client.delete_collection(collection_name)
+
+    logger.info(f"{transport}: upsert {upsert_rate:,.0f} points/s | "
+                f"search {search_rate:,.0f} q/s (p50 {percentile_ms(latencies, 50):.1f} ms, "
+                f"p95 {percentile_ms(latencies, 95):.1f} ms) | "
+                f"async x{concurrency} {async_rate:,.0f} q/s (p95 {percentile_ms(async_latencies, 95):.1f} ms)")
+
+
+def main():
+    """Run the benchmark for each requested transport"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--points', type=int, default=20000, help='Vectors to upsert per transport')
+    parser.add_argument('--queries', type=int, default=500, help='Searches per run')
+    parser.add_argument('--concurrency', type=int, default=16, help='In-flight async searches')
+    parser.add_argument('--transports', nargs='+', default=['rest', 'grpc'], choices=['rest', 'grpc'])
+    args = parser.parse_args()
+
+    try:
+        dimension = int(os.getenv('EMBEDDING_DIMENSION', 768))
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(args.points, dimension)).astype(np.float32)
+        queries = rng.normal(size=(args.queries, dimension)).astype(np.float32)
+
+        for transport in args.transports:
+            run_transport(transport, vectors, queries, args.concurrency)
+
+    except Exception as e:
+        logger.error(f"Error running transport benchmark: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
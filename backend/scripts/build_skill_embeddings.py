@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Build the skill-embedding matrix used for semantic skill matching.
+
+Embeds every skill name in the taxonomy (data/skills.json) with EMBEDDING_MODEL
+and writes an L2-normalised float32 matrix (SKILL_EMBEDDINGS_PATH, default
+data/skill_embeddings.npy) plus a .json manifest of the skill ID of each row.
+Re-run after editing the taxonomy; running workers pick the new file up on restart.
+
+Usage: python scripts/build_skill_embeddings.py [--path data/skill_embeddings.npy] [--batch-size 256]
+"""
+import sys
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+from services.embedding_engine import embedding_engine
+from services.skill_embeddings import SkillEmbeddingIndex
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+
+def main():
+    """Embed the taxonomy and write the matrix"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--path', help='Output .npy file (defaults to SKILL_EMBEDDINGS_PATH)')
+    parser.add_argument('--batch-size', type=int, default=256, help='Skill names embedded per batch')
+    args = parser.parse_args()
+
+    try:
+        index = SkillEmbeddingIndex(path=args.path)
+        report = index.build(embedding_engine.encode_many, batch_size=args.batch_size)
+        logger.info(f"✓ Embedded {report['skills']} skills ({report['dimension']} dims) into {report['path']}")
+
+    except Exception as e:
+        logger.error(f"Error building skill embeddings: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
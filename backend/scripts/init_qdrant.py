@@ -30,7 +30,12 @@ def main():
         success = vector_service.initialize_collections()
 
         if success:
-            logger.info("✓ Qdrant collections created successfully!")
+            logger.info("✓ Qdrant collections ready (existing data is kept)")
+
+            # Verify payload indexes (initialize_collections already created them)
+            vector_service.ensure_payload_indexes()
+            for collection_name, fields in vector_service.payload_index_schema().items():
+                logger.info(f"  - {collection_name} payload indexes: {', '.join(fields)}")
 
             # Get collection info
             resumes_info = vector_service.get_collection_info('resumes')
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+One-off migration to deterministic Qdrant point IDs.
+
+Older code stored every job/resume vector under a fresh uuid4, so each job edit
+left another point behind. This collapses those duplicates:
+  - Jobs are re-stored at their deterministic ID from the current Mongo document,
+    then every other point carrying the same job_id is deleted.
+  - Resume points are copied to their deterministic ID and the old point removed.
+  - Points no Mongo document refers to are deleted.
+A job or resume whose new point could not be stored keeps its old points and
+vector_id; these are counted as 'failed' so the migration can be re-run.
+
+Usage: python scripts/migrate_vector_ids.py [--dry-run] [--batch-size 64]
+"""
+import sys
+import argparse
+from collections import defaultdict
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+from models import db, Job, User
+from services.vector_service import VectorService
+from services.job_matcher import JobMatcher
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+
+def migrate_jobs(vector_service, job_matcher, dry_run=False, batch_size=64):
+    """Re-key job points; returns migration stats"""
+    stats = {'jobs': 0, 're_stored': 0, 'failed': 0, 'duplicates_deleted': 0, 'orphans_deleted': 0}
+
+    # Index existing points by the job they belong to
+    points_by_job = defaultdict(list)
+    for point in vector_service.iter_points(vector_service.job_collection):
+        points_by_job[(point.payload or {}).get('job_id')].append(str(point.id))
+
+    company_cache = {}
+
+    def company_for(employer_id):
+        if employer_id not in company_cache:
+            employer = User.from_mongo(db.users.find_one({'id': employer_id}))
+            company_cache[employer_id] = employer.company_name if employer else ''
+        return company_cache[employer_id]
+
+    def process(jobs):
+        # Only jobs without a point at their deterministic ID need a fresh embedding
+        to_embed = [job for job in jobs
+                    if vector_service.job_vector_id(job.id) not in points_by_job.get(job.id, [])]
+        stored = {job.id for job in to_embed} if dry_run else set()
+        if to_embed and not dry_run:
+            vectors = job_matcher.generate_job_vectors_many([job.to_embedding_data() for job in to_embed])
+            results = vector_service.store_job_vectors_bulk(
+                {
+                    'job_id': job.id,
+                    'embedding': vector,
+                    'metadata': job.to_vector_metadata(company=company_for(job.employer_id))
+                }
+                for job, vector in zip(to_embed, vectors) if vector
+            )
+            stored = {result['job_id'] for result in results if result['success']}
+        stats['re_stored'] += len(stored)
+        stats['failed'] += len(to_embed) - len(stored)
+
+        for job in jobs:
+            target_id = vector_service.job_vector_id(job.id)
+            point_ids = points_by_job.pop(job.id, [])
+            if target_id not in point_ids and job.id not in stored:
+                # Embedding or upsert failed - keep the old points and the Mongo reference
+                continue
+            stale_ids = [vid for vid in point_ids if vid != target_id]
+
+            stats['duplicates_deleted'] += len(stale_ids)
+            if not dry_run:
+                vector_service.delete_job_vectors(stale_ids)
+                if job.vector_id != target_id:
+                    db.jobs.update_one({'id': job.id}, {'$set': {'vector_id': target_id}})
+
+    batch = []
+    for doc in db.jobs.find({}):
+        batch.append(Job.from_mongo(doc))
+        stats['jobs'] += 1
+        if len(batch) >= batch_size:
+            process(batch)
+            batch = []
+    if batch:
+        process(batch)
+
+    # Whatever is left belongs to jobs that no longer exist
+    orphan_ids = [vid for vids in points_by_job.values() for vid in vids]
+    stats['orphans_deleted'] = len(orphan_ids)
+    if not dry_run:
+        vector_service.delete_job_vectors(orphan_ids)
+
+    return stats
+
+
+def migrate_resumes(vector_service, dry_run=False):
+    """Re-key resume points; returns migration stats"""
+    stats = {'resumes': 0, 're_keyed': 0, 'failed': 0, 'missing_vectors': 0, 'orphans_deleted': 0}
+
+    existing_ids = {str(point.id) for point in
+                    vector_service.iter_points(vector_service.resume_collection, with_payload=False)}
+    referenced_ids = set()
+
+    for resume in db.resumes.find({}, {'user_id': 1, 'vector_id': 1}):
+        stats['resumes'] += 1
+        resume_id = str(resume['_id'])
+        target_id = vector_service.resume_vector_id(resume['user_id'], resume_id)
+        old_id = resume.get('vector_id')
+        referenced_ids.add(target_id)
+
+        if target_id not in existing_ids:
+            if old_id not in existing_ids:
+                # Nothing to copy - the reconciler re-embeds these
+                stats['missing_vectors'] += 1
+                continue
+
+            if not dry_run:
+                point = vector_service.client.retrieve(
+                    collection_name=vector_service.resume_collection,
+                    ids=[old_id],
+                    with_payload=True,
+                    with_vectors=True
+                )[0]
+                stored_id = vector_service.store_resume_vector(
+                    user_id=resume['user_id'],
+                    embedding=point.vector,
+                    metadata=point.payload or {},
+                    resume_id=resume_id
+                )
+                if stored_id is None:
+                    # Copy failed - keep the old point and the Mongo reference to it
+                    stats['failed'] += 1
+                    referenced_ids.add(old_id)
+                    continue
+            stats['re_keyed'] += 1
+
+        if old_id != target_id and not dry_run:
+            db.resumes.update_one({'_id': resume['_id']}, {'$set': {'vector_id': target_id}})
+
+    orphan_ids = list(existing_ids - referenced_ids)
+    stats['orphans_deleted'] = len(orphan_ids)
+    if not dry_run:
+        vector_service.delete_resume_vectors(orphan_ids)
+
+    return stats
+
+
+def main():
+    """Collapse duplicate vectors onto deterministic IDs"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing')
+    parser.add_argument('--batch-size', type=int, default=64, help='Jobs embedded per batch')
+    args = parser.parse_args()
+
+    try:
+        vector_service = VectorService()
+        job_matcher = JobMatcher(vector_service)
+
+        logger.info(f"Migrating job vectors{' (dry run)' if args.dry_run else ''}...")
+        job_stats = migrate_jobs(vector_service, job_matcher, args.dry_run, args.batch_size)
+        logger.info(f"✓ Jobs: {job_stats}")
+
+        logger.info(f"Migrating resume vectors{' (dry run)' if args.dry_run else ''}...")
+        resume_stats = migrate_resumes(vector_service, args.dry_run)
+        logger.info(f"✓ Resumes: {resume_stats}")
+
+    except Exception as e:
+        logger.error(f"Error migrating vector IDs: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Check that MongoDB and the vector collections agree, and optionally repair them.
+
+Streams both stores page by page and diffs them by ID:
+- orphans: points whose job/resume no longer exists (or legacy random IDs)
+- missing: jobs/resumes with no point
+- stale: documents whose vector_id doesn't name their point
+
+Without --repair it only reports drift. With --repair it deletes orphans,
+re-embeds missing documents and rewrites stale vector_ids.
+
+Usage: python scripts/reconcile_vectors.py [--kinds jobs resumes] [--repair]
+                                           [--page-size 512] [--grace-seconds 300]
+"""
+import sys
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+from models import db
+from services.vector_service import VectorService
+from services.reconcile_service import ReconcileService
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+
+def main():
+    """Diff Mongo against the vector store and report (or repair) drift"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--kinds', nargs='+', choices=ReconcileService.KINDS, default=list(ReconcileService.KINDS))
+    parser.add_argument('--repair', action='store_true', help='Delete orphans, re-embed missing documents, fix refs')
+    parser.add_argument('--page-size', type=int, default=None, help='Points/documents per page')
+    parser.add_argument('--grace-seconds', type=float, default=None,
+                        help='Ignore points indexed more recently than this')
+    parser.add_argument('--batch-size', type=int, default=64, help='Documents embedded per batch when repairing')
+    args = parser.parse_args()
+
+    try:
+        reconcile_service = ReconcileService(VectorService(), db, page_size=args.page_size,
+                                             grace_seconds=args.grace_seconds, batch_size=args.batch_size)
+        report = reconcile_service.reconcile(kinds=args.kinds, repair=args.repair)
+
+        for kind, stats in report['kinds'].items():
+            logger.info(f"{'✓' if not stats['drift'] else '✗'} {kind}: drift {stats['drift']} "
+                        f"({stats['orphans']} orphans, {stats['missing']} missing, {stats['stale_refs']} stale)")
+            logger.info(f"  - Scanned {stats['points_scanned']} points ({stats['points_per_second']:.0f}/s), "
+                        f"{stats['documents_scanned']} documents ({stats['documents_per_second']:.0f}/s)")
+            if args.repair:
+                logger.info(f"  - Deleted {stats['deleted']}, re-embedded {stats['re_embedded']}, "
+                            f"fixed {stats['refs_fixed']} refs ({stats['failed']} failed)")
+
+        logger.info(f"Total drift: {report['drift']}")
+
+    except Exception as e:
+        logger.error(f"Error reconciling vectors: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Rebuild the jobs/resumes vector collections without downtime.
+
+Builds new versioned collections from MongoDB, then atomically switches the
+'jobs' and 'resumes' aliases to them. Use after changing EMBEDDING_MODEL or
+EMBEDDING_DIMENSION, or to recover from a corrupted collection.
+
+The aliases are only switched when every document was embedded and stored;
+--allow-partial switches anyway but keeps the old collections even with --drop-old.
+
+Usage: python scripts/reindex_vectors.py [--kinds jobs resumes] [--batch-size 64] [--drop-old] [--allow-partial]
+"""
+import sys
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+from models import db
+from services.vector_service import VectorService
+from services.reindex_service import ReindexService
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+
+def main():
+    """Rebuild collections and switch aliases"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--kinds', nargs='+', choices=ReindexService.KINDS, default=list(ReindexService.KINDS))
+    parser.add_argument('--batch-size', type=int, default=64, help='Documents embedded per batch')
+    parser.add_argument('--drop-old', action='store_true', help='Delete the previous collections after switching')
+    parser.add_argument('--allow-partial', action='store_true',
+                        help='Switch aliases even if some documents failed to embed/upsert')
+    args = parser.parse_args()
+
+    try:
+        reindex_service = ReindexService(VectorService(), db, batch_size=args.batch_size)
+        report = reindex_service.rebuild(kinds=args.kinds, drop_old=args.drop_old,
+                                         allow_partial=args.allow_partial)
+
+        for kind, progress in report['kinds'].items():
+            logger.info(f"{'✗' if progress['failed'] else '✓'} {kind}: {progress['processed']}/{progress['total']} "
+                        f"indexed into {progress['collection']} ({progress['failed']} failed, "
+                        f"{progress['docs_per_second']:.1f} docs/s, {progress.get('caught_up', 0)} caught up)")
+
+        if report['aborted']:
+            logger.error(f"Rebuild aborted: {report['failed']} documents failed; aliases were not switched "
+                         f"(re-run, or pass --allow-partial)")
+            sys.exit(1)
+
+        for alias, collection_name in report['switched'].items():
+            logger.info(f"  - {alias} -> {collection_name} (was {report['previous'].get(alias)})")
+
+        if report['dropped']:
+            logger.info(f"  - Dropped: {', '.join(report['dropped'])}")
+
+        if report['failed']:
+            logger.warning(f"Partial rebuild: {report['failed']} documents missing; old collections kept")
+            sys.exit(1)
+
+    except Exception as e:
+        logger.error(f"Error rebuilding collections: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
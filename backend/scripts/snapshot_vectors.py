@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Export vector collections to memory-mapped NumPy files, or load them back.
+
+export writes one directory per kind (<dir>/jobs, <dir>/resumes), each holding
+a float32 .npy per vector, payload.json (point IDs plus one column per payload
+field) and manifest.json. The .npy files open with np.load(..., mmap_mode='r')
+for offline analysis or benchmarks.
+
+import bulk-loads those directories back without re-embedding anything. It
+creates the jobs/resumes collections if they are missing.
+
+Usage: python scripts/snapshot_vectors.py export [--dir vector_exports] [--kinds jobs resumes]
+       python scripts/snapshot_vectors.py import [--dir vector_exports] [--kinds jobs resumes]
+"""
+import sys
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+from services.vector_service import VectorService
+from services.reindex_service import ReindexService
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+
+def main():
+    """Export or import the requested collections"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('mode', choices=['export', 'import'])
+    parser.add_argument('--dir', default='vector_exports', help='Export directory (one subdirectory per kind)')
+    parser.add_argument('--kinds', nargs='+', choices=ReindexService.KINDS, default=list(ReindexService.KINDS))
+    parser.add_argument('--page-size', type=int, default=None, help='Points per scroll page when exporting')
+    parser.add_argument('--batch-size', type=int, default=None, help='Points per upsert when importing')
+    args = parser.parse_args()
+
+    try:
+        vector_service = VectorService()
+        collections = {'jobs': vector_service.job_collection, 'resumes': vector_service.resume_collection}
+
+        for kind in args.kinds:
+            directory = Path(args.dir) / kind
+            if args.mode == 'export':
+                manifest = vector_service.export_collection(collections[kind], directory, page_size=args.page_size)
+                logger.info(f"✓ {kind}: {manifest['count']} points -> {directory}")
+            else:
+                result = vector_service.import_collection(directory, collections[kind], batch_size=args.batch_size)
+                logger.info(f"✓ {kind}: {result['imported']} points imported into {result['collection']} "
+                            f"({result['failed']} failed)")
+
+    except Exception as e:
+        logger.error(f"Error running vector {args.mode}: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
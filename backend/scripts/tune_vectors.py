@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Apply vector storage settings and measure their recall cost.
+
+New collections pick up QDRANT_QUANTIZATION, QDRANT_ON_DISK and QDRANT_HNSW_*
+automatically; --apply pushes them to the existing collections as well.
+Recall@k of the configured search is measured against exact search, using
+stored vectors as queries.
+
+Usage: python scripts/tune_vectors.py [--apply] [--samples 50] [--limit 10]
+                                      [--oversampling 2.0] [--no-rescore]
+"""
+import sys
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+from services.vector_service import VectorService
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+
+def main():
+    """Apply settings and report recall/latency per collection"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--apply', action='store_true', help='Update existing collections to the current settings')
+    parser.add_argument('--samples', type=int, default=50, help='Stored vectors used as queries')
+    parser.add_argument('--limit', type=int, default=10, help='k for recall@k')
+    parser.add_argument('--oversampling', type=float, default=None, help='Override QDRANT_SEARCH_OVERSAMPLING')
+    parser.add_argument('--no-rescore', action='store_true', help='Skip rescoring with the original vectors')
+    args = parser.parse_args()
+
+    try:
+        vector_service = VectorService()
+        logger.info(f"Settings: quantization={vector_service.quantization}, on_disk={vector_service.on_disk}, "
+                    f"hnsw m={vector_service.hnsw_m} ef_construct={vector_service.hnsw_ef_construct}")
+
+        if args.apply:
+            for collection_name, success in vector_service.apply_collection_config().items():
+                logger.info(f"{'✓' if success else '✗'} Applied settings to {collection_name}")
+
+        for collection_name in (vector_service.resume_collection, vector_service.job_collection):
+            report = vector_service.measure_recall(
+                collection_name,
+                sample_size=args.samples,
+                limit=args.limit,
+                oversampling=args.oversampling,
+                rescore=False if args.no_rescore else None
+            )
+            if report['recall'] is None:
+                logger.info(f"{collection_name}: no vectors to sample")
+                continue
+            logger.info(f"{collection_name}: recall@{report['limit']} = {report['recall']:.3f} over "
+                        f"{report['samples']} queries ({report['approximate_ms']:.1f} ms vs "
+                        f"{report['exact_ms']:.1f} ms exact)")
+
+    except Exception as e:
+        logger.error(f"Error tuning vector collections: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
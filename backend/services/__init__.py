@@ -1,6 +1,19 @@
 from .resume_parser import ResumeParser
 from .job_matcher import JobMatcher
 from .vector_service import VectorService
+from .async_vector_service import AsyncVectorService
 from .auth_service import AuthService
+from .model_registry import ModelRegistry, model_registry
+from .embedding_cache import EmbeddingCache
+from .embedding_engine import EmbeddingEngine, embedding_engine
+from .skill_taxonomy import SkillTaxonomy, skill_taxonomy
+from .skill_extractor import SkillExtractor, skill_extractor
+from .skill_embeddings import SkillEmbeddingIndex, skill_embeddings
+from .match_store import MatchStore
 
-__all__ = ['ResumeParser', 'JobMatcher', 'VectorService', 'AuthService']
+__all__ = [
+    'ResumeParser', 'JobMatcher', 'VectorService', 'AsyncVectorService', 'AuthService',
+    'ModelRegistry', 'model_registry', 'EmbeddingCache', 'EmbeddingEngine', 'embedding_engine',
+    'SkillTaxonomy', 'skill_taxonomy', 'SkillExtractor', 'skill_extractor',
+    'SkillEmbeddingIndex', 'skill_embeddings', 'MatchStore'
+]
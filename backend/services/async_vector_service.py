@@ -0,0 +1,323 @@
+import os
+import asyncio
+import logging
+from typing import List, Dict, Optional, Iterable, Tuple, Union
+from qdrant_client.models import NamedVector, SearchRequest
+from .vector_service import VectorService
+from .vector_store import create_async_vector_store
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncVectorService(VectorService):
+    """
+    VectorService for asyncio callers, backed by AsyncQdrantClient
+    Shares payload/filter/point builders and settings with VectorService;
+    collection management (create, aliases, indexes) stays on the sync service
+    """
+
+    def __init__(self, client=None):
+        super().__init__(client=client if client is not None else create_async_vector_store(
+            os.getenv('VECTOR_BACKEND', 'qdrant').lower(),
+            os.getenv('QDRANT_TRANSPORT', 'rest').lower()
+        ))
+
+    async def close(self):
+        """Close the underlying connections/channel"""
+        await self.client.close()
+
+    async def store_resume_vector(self, user_id: str, embedding: List[float],
+                                  metadata: Dict, resume_id: str) -> Optional[str]:
+        """Store resume embedding (idempotent per user/resume); returns vector ID"""
+        try:
+            point = self.build_resume_point(user_id, resume_id, embedding, metadata)
+            await self.client.upsert(collection_name=self.resume_collection, points=[point])
+
+            logger.info(f"Stored resume vector: {point.id} for user: {user_id}")
+            return point.id
+
+        except Exception as e:
+            logger.error(f"Error storing resume vector: {e}")
+            return None
+
+    async def store_job_vector(self, job_id: str, vectors: Dict[str, List[float]],
+                               metadata: Dict) -> Optional[str]:
+        """Store a job's named vectors (idempotent per job); returns vector ID"""
+        try:
+            point = self.build_job_point(job_id, vectors, metadata)
+            await self.client.upsert(collection_name=self.job_collection, points=[point])
+
+            logger.info(f"Stored job vector: {point.id} for job: {job_id}")
+            return point.id
+
+        except Exception as e:
+            logger.error(f"Error storing job vector: {e}")
+            return None
+
+    async def store_resume_vectors_bulk(self, items: Iterable[Dict], batch_size: Optional[int] = None,
+                                        parallel: Optional[int] = None,
+                                        collection_name: Optional[str] = None) -> List[Dict]:
+        """Async counterpart of VectorService.store_resume_vectors_bulk"""
+        def to_point(item):
+            return self.build_resume_point(item['user_id'], item['resume_id'],
+                                           item['embedding'], item.get('metadata', {}))
+
+        def to_result(item):
+            return {'user_id': item.get('user_id'), 'resume_id': item.get('resume_id')}
+
+        return await self._store_bulk(collection_name or self.resume_collection, items, to_point,
+                                      to_result, batch_size, parallel)
+
+    async def store_job_vectors_bulk(self, items: Iterable[Dict], batch_size: Optional[int] = None,
+                                     parallel: Optional[int] = None,
+                                     collection_name: Optional[str] = None) -> List[Dict]:
+        """Async counterpart of VectorService.store_job_vectors_bulk"""
+        def to_point(item):
+            return self.build_job_point(item['job_id'], item['embedding'], item.get('metadata', {}))
+
+        def to_result(item):
+            return {'job_id': item.get('job_id')}
+
+        return await self._store_bulk(collection_name or self.job_collection, items, to_point,
+                                      to_result, batch_size, parallel)
+
+    async def _store_bulk(self, collection_name: str, items: Iterable[Dict], to_point, to_result,
+                          batch_size: Optional[int], parallel: Optional[int]) -> List[Dict]:
+        batch_size = batch_size or self.upsert_batch_size
+        semaphore = asyncio.Semaphore(max(1, parallel or self.upsert_parallel))
+        results, chunks, chunk = [], [], []
+
+        for item in items:
+            result = to_result(item)
+            result.update({'vector_id': None, 'success': False, 'error': None})
+            results.append(result)
+            try:
+                self.check_embedding(item.get('embedding'))
+                chunk.append((result, to_point(item)))
+            except Exception as e:
+                result['error'] = str(e)
+            if len(chunk) >= batch_size:
+                chunks.append(chunk)
+                chunk = []
+        if chunk:
+            chunks.append(chunk)
+
+        async def upload(chunk):
+            async with semaphore:
+                try:
+                    await self.client.upsert(
+                        collection_name=collection_name,
+                        points=[point for _, point in chunk],
+                        wait=True
+                    )
+                    for result, point in chunk:
+                        result.update({'vector_id': str(point.id), 'success': True, 'error': None})
+                except Exception as e:
+                    logger.error(f"Error bulk upserting {len(chunk)} points into {collection_name}: {e}")
+                    for result, _ in chunk:
+                        result.update({'success': False, 'error': str(e)})
+
+        await asyncio.gather(*(upload(chunk) for chunk in chunks))
+
+        stored = sum(1 for result in results if result['success'])
+        logger.info(f"Bulk stored {stored}/{len(results)} vectors in {collection_name}")
+
+        return results
+
+    async def search_similar_jobs(self, resume_vector: List[float],
+                                  filters: Optional[Dict] = None,
+                                  limit: int = 10, oversampling: Optional[float] = None,
+                                  rescore: Optional[bool] = None, offset: int = 0,
+                                  score_threshold: Optional[float] = None,
+                                  vector: Union[str, Dict[str, float]] = VectorService.DEFAULT_JOB_VECTOR) -> List[Dict]:
+        """Search for open jobs similar to a resume, on one named job vector or a weighted fusion"""
+        try:
+            search_filter = self.build_job_filter(filters)
+            params = self.search_params(oversampling, rescore)
+
+            if isinstance(vector, dict):
+                batch_results = await self.client.search_batch(
+                    collection_name=self.job_collection,
+                    requests=self._fusion_requests(resume_vector, vector, search_filter, params,
+                                                   (offset + limit) * self.FUSION_OVERFETCH)
+                )
+                results = self.fuse_job_hits(resume_vector, vector, batch_results,
+                                             limit, offset, score_threshold)
+            else:
+                results = await self.client.search(
+                    collection_name=self.job_collection,
+                    query_vector=NamedVector(name=vector, vector=resume_vector),
+                    query_filter=search_filter,
+                    search_params=params,
+                    limit=limit,
+                    offset=offset,
+                    score_threshold=score_threshold,
+                    with_payload=True
+                )
+            return [self._format_job_hit(result) for result in results]
+
+        except Exception as e:
+            logger.error(f"Error searching similar jobs: {e}")
+            return []
+
+    async def search_similar_jobs_batch(self, queries: List[Tuple[List[float], Optional[Dict]]],
+                                        limit: int = 10, oversampling: Optional[float] = None,
+                                        rescore: Optional[bool] = None,
+                                        vector: str = VectorService.DEFAULT_JOB_VECTOR) -> List[List[Dict]]:
+        """Run several job searches in one request; one result list per query, in order"""
+        if not queries:
+            return []
+
+        try:
+            params = self.search_params(oversampling, rescore)
+            batch_results = await self.client.search_batch(
+                collection_name=self.job_collection,
+                requests=[
+                    SearchRequest(vector=NamedVector(name=vector, vector=resume_vector),
+                                  filter=self.build_job_filter(filters),
+                                  params=params, limit=limit, with_payload=True)
+                    for resume_vector, filters in queries
+                ]
+            )
+            return [[self._format_job_hit(result) for result in results] for results in batch_results]
+
+        except Exception as e:
+            logger.error(f"Error batch searching similar jobs: {e}")
+            return [[] for _ in queries]
+
+    async def search_similar_candidates(self, job_vector: List[float],
+                                        filters: Optional[Dict] = None,
+                                        limit: int = 20, oversampling: Optional[float] = None,
+                                        rescore: Optional[bool] = None, offset: int = 0,
+                                        score_threshold: Optional[float] = None) -> List[Dict]:
+        """Search for candidates similar to a job, one hit per user_id"""
+        try:
+            results = await self.client.search_groups(
+                collection_name=self.resume_collection,
+                query_vector=job_vector,
+                group_by='user_id',
+                group_size=1,
+                query_filter=self.build_candidate_filter(filters),
+                search_params=self.search_params(oversampling, rescore),
+                limit=offset + limit,
+                score_threshold=score_threshold,
+                with_payload=True
+            )
+            return [self._format_candidate_hit(group.hits[0])
+                    for group in results.groups[offset:] if group.hits]
+
+        except Exception as e:
+            logger.error(f"Error searching similar candidates: {e}")
+            return []
+
+    async def search_similar_candidates_batch(self, queries: List[Tuple[List[float], Optional[Dict]]],
+                                              limit: int = 20, oversampling: Optional[float] = None,
+                                              rescore: Optional[bool] = None) -> List[List[Dict]]:
+        """Run several candidate searches in one request; distinct candidates per query, in order"""
+        if not queries:
+            return []
+
+        try:
+            params = self.search_params(oversampling, rescore)
+            batch_results = await self.client.search_batch(
+                collection_name=self.resume_collection,
+                requests=[
+                    SearchRequest(vector=job_vector, filter=self.build_candidate_filter(filters),
+                                  params=params, limit=limit * self.CANDIDATE_BATCH_OVERFETCH,
+                                  with_payload=True)
+                    for job_vector, filters in queries
+                ]
+            )
+            return [self._best_hit_per_candidate(results, limit) for results in batch_results]
+
+        except Exception as e:
+            logger.error(f"Error batch searching similar candidates: {e}")
+            return [[] for _ in queries]
+
+    async def _retrieve_vectors(self, collection_name: str, vector_ids: List[str],
+                                batch_size: Optional[int] = None,
+                                vector_name: Optional[str] = None) -> Dict[str, List[float]]:
+        """Fetch stored vectors by point ID; batches are fetched concurrently"""
+        batch_size = batch_size or self.retrieve_batch_size
+        ids = list(dict.fromkeys(vid for vid in vector_ids if vid))
+        vectors = {}
+
+        try:
+            batches = await asyncio.gather(*(
+                self.client.retrieve(collection_name=collection_name, ids=ids[start:start + batch_size],
+                                     with_payload=False,
+                                     with_vectors=[vector_name] if vector_name else True)
+                for start in range(0, len(ids), batch_size)
+            ))
+            for points in batches:
+                for point in points:
+                    vectors[str(point.id)] = point.vector[vector_name] if vector_name else point.vector
+
+        except Exception as e:
+            logger.error(f"Error retrieving vectors from {collection_name}: {e}")
+
+        return vectors
+
+    async def get_resume_vectors(self, vector_ids: List[str],
+                                 batch_size: Optional[int] = None) -> Dict[str, List[float]]:
+        """Fetch stored resume vectors by vector ID"""
+        return await self._retrieve_vectors(self.resume_collection, vector_ids, batch_size)
+
+    async def get_job_vectors(self, vector_ids: List[str], batch_size: Optional[int] = None,
+                              vector: str = VectorService.DEFAULT_JOB_VECTOR) -> Dict[str, List[float]]:
+        """Fetch one named vector of stored jobs by vector ID"""
+        return await self._retrieve_vectors(self.job_collection, vector_ids, batch_size, vector)
+
+    async def get_resume_vector(self, vector_id: str) -> Optional[List[float]]:
+        """Fetch a single stored resume vector, or None if the point is missing"""
+        return (await self.get_resume_vectors([vector_id])).get(str(vector_id))
+
+    async def get_job_vector(self, vector_id: str,
+                             vector: str = VectorService.DEFAULT_JOB_VECTOR) -> Optional[List[float]]:
+        """Fetch a single stored job vector, or None if the point is missing"""
+        return (await self.get_job_vectors([vector_id], vector=vector)).get(str(vector_id))
+
+    async def update_job_payload(self, job_id: str, metadata: Dict, overwrite: bool = False) -> bool:
+        """Update a job's payload without re-sending its vector"""
+        try:
+            vector_id = self.job_vector_id(job_id)
+            if overwrite:
+                await self.client.overwrite_payload(collection_name=self.job_collection,
+                                                    payload=self.build_job_payload(job_id, metadata),
+                                                    points=[vector_id])
+            else:
+                await self.client.set_payload(collection_name=self.job_collection,
+                                              payload=metadata, points=[vector_id])
+            return True
+
+        except Exception as e:
+            logger.error(f"Error updating payload for job {job_id}: {e}")
+            return False
+
+    async def delete_resume_vector(self, vector_id: str) -> bool:
+        """Delete a resume vector"""
+        return await self._delete_points(self.resume_collection, [vector_id])
+
+    async def delete_job_vector(self, vector_id: str) -> bool:
+        """Delete a job vector"""
+        return await self._delete_points(self.job_collection, [vector_id])
+
+    async def delete_resume_vectors(self, vector_ids: List[str]) -> bool:
+        """Delete several resume vectors in one request"""
+        return await self._delete_points(self.resume_collection, vector_ids)
+
+    async def delete_job_vectors(self, vector_ids: List[str]) -> bool:
+        """Delete several job vectors in one request"""
+        return await self._delete_points(self.job_collection, vector_ids)
+
+    async def _delete_points(self, collection_name: str, vector_ids: List[str]) -> bool:
+        if not vector_ids:
+            return True
+        try:
+            await self.client.delete(collection_name=collection_name,
+                                     points_selector=list(vector_ids))
+            return True
+
+        except Exception as e:
+            logger.error(f"Error deleting vectors from {collection_name}: {e}")
+            return False
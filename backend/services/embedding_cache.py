@@ -0,0 +1,152 @@
+import os
+import time
+import hashlib
+import logging
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Optional
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """
+    Two-tier, content-addressed cache for embeddings.
+
+    Keys are the model name plus a SHA-256 of the normalised text, so the same
+    text always maps to the same entry regardless of which service asked for it.
+    L1 is a bounded in-process LRU; L2 is Redis, shared by every worker, holding
+    raw float32 bytes (768 dims = 3 KB) instead of JSON lists.
+    """
+
+    KEY_PREFIX = 'emb'
+
+    def __init__(self, model_name: Optional[str] = None, max_entries: Optional[int] = None,
+                 redis_url: Optional[str] = None, ttl: Optional[int] = None,
+                 use_redis: Optional[bool] = None):
+        self.model_name = model_name or os.getenv('EMBEDDING_MODEL', 'sentence-transformers/all-mpnet-base-v2')
+        self.max_entries = max_entries if max_entries is not None else int(os.getenv('EMBEDDING_CACHE_SIZE', 10000))
+        self.ttl = ttl if ttl is not None else int(os.getenv('EMBEDDING_CACHE_TTL', 7 * 24 * 3600))
+        self.redis_url = redis_url or os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+        if use_redis is None:
+            use_redis = os.getenv('EMBEDDING_CACHE_REDIS', 'True') == 'True'
+        self.use_redis = use_redis
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self._redis = None
+        self._redis_retry_at = 0.0
+        self._stats = {
+            'l1_hits': 0,
+            'l2_hits': 0,
+            'misses': 0,
+            'puts': 0,
+            'evictions': 0,
+            'l2_errors': 0
+        }
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Canonical form used for hashing: NFC, collapsed whitespace, trimmed"""
+        return ' '.join(unicodedata.normalize('NFC', text or '').split())
+
+    def key(self, text: str) -> str:
+        digest = hashlib.sha256(self.normalize(text).encode('utf-8')).hexdigest()
+        return f"{self.KEY_PREFIX}:{self.model_name}:{digest}"
+
+    def _get_redis(self):
+        """Lazily connect to Redis; after a failure, back off before retrying"""
+        if not self.use_redis or time.monotonic() < self._redis_retry_at:
+            return None
+        if self._redis is None:
+            try:
+                import redis
+                self._redis = redis.Redis.from_url(self.redis_url, socket_timeout=0.5,
+                                                   socket_connect_timeout=0.5)
+            except Exception as e:
+                self._redis_failed(e)
+                return None
+        return self._redis
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def _redis_failed(self, error: Exception):
+        with self._lock:
+            self._stats['l2_errors'] += 1
+            self._redis = None
+            self._redis_retry_at = time.monotonic() + 30
+        logger.warning(f"Embedding cache Redis tier unavailable: {error}")
+
+    def _l1_put(self, key: str, vector: np.ndarray):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """Return the cached float32 vector for text, or None"""
+        key = self.key(text)
+
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                self._stats['l1_hits'] += 1
+                return vector
+
+        client = self._get_redis()
+        if client is not None:
+            try:
+                raw = client.get(key)
+            except Exception as e:
+                self._redis_failed(e)
+                raw = None
+            if raw:
+                vector = np.frombuffer(raw, dtype=np.float32)
+                self._l1_put(key, vector)
+                self._count('l2_hits')
+                return vector
+
+        self._count('misses')
+        return None
+
+    def put(self, text: str, vector) -> None:
+        """Store a vector in both tiers"""
+        key = self.key(text)
+        vector = np.asarray(vector, dtype=np.float32)
+        self._l1_put(key, vector)
+        self._count('puts')
+
+        client = self._get_redis()
+        if client is not None:
+            try:
+                client.set(key, vector.tobytes(), ex=self.ttl or None)
+            except Exception as e:
+                self._redis_failed(e)
+
+    def clear(self):
+        """Drop the in-process tier (Redis entries expire on their own)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """Hit/miss counters for measuring how many encodes the cache saves"""
+        with self._lock:
+            s = dict(self._stats)
+            size = len(self._entries)
+        lookups = s['l1_hits'] + s['l2_hits'] + s['misses']
+        s.update({
+            'size': size,
+            'max_entries': self.max_entries,
+            'redis_enabled': self.use_redis,
+            'hit_rate': (s['l1_hits'] + s['l2_hits']) / lookups if lookups else 0.0
+        })
+        return s
@@ -0,0 +1,216 @@
+import os
+import time
+import queue
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+import numpy as np
+from .model_registry import model_registry
+from .embedding_cache import EmbeddingCache
+
+logger = logging.getLogger(__name__)
+
+
+class _EncodeRequest:
+    """A single queued text waiting to be encoded"""
+    __slots__ = ('text', 'future', 'enqueued_at')
+
+    def __init__(self, text: str):
+        self.text = text
+        self.future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class EmbeddingEngine:
+    """
+    Micro-batching front end for SentenceTransformer.encode.
+
+    Concurrent callers submit single texts and get futures back; a background
+    worker collects requests until either max_batch_size is reached or the oldest
+    request has waited max_wait_ms, sorts the batch by token length (so padding
+    is minimal) and encodes it in one forward pass. Texts already in the
+    embedding cache never reach the queue.
+    """
+
+    def __init__(self, model_loader: Optional[Callable] = None,
+                 max_batch_size: Optional[int] = None,
+                 max_wait_ms: Optional[float] = None,
+                 cache: Optional[EmbeddingCache] = None,
+                 timeout: Optional[float] = None):
+        self._model_loader = model_loader or model_registry.get_embedding_model
+        self.cache = cache
+        self.max_batch_size = max_batch_size or int(os.getenv('EMBEDDING_BATCH_SIZE', 32))
+        self.max_wait_ms = max_wait_ms if max_wait_ms is not None else float(os.getenv('EMBEDDING_MAX_WAIT_MS', 5))
+        # Seconds encode()/encode_many() wait for a result before giving up on it
+        self.timeout = timeout or float(os.getenv('EMBEDDING_TIMEOUT_SECONDS', 30))
+
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._pid = os.getpid()
+        # Guards _metrics, which the worker updates while metrics() reads from request threads
+        self._metrics_lock = threading.Lock()
+        self._reset_metrics()
+
+    def _reset_metrics(self):
+        self._metrics = {
+            'cancelled_texts': 0,
+            'batches': 0,
+            'encoded_texts': 0,
+            'failed_batches': 0,
+            'failed_texts': 0,
+            'last_batch_size': 0,
+            'max_batch_size_seen': 0,
+            'encode_seconds_total': 0.0,
+            'wait_seconds_total': 0.0
+        }
+
+    def _ensure_worker(self):
+        """Start the batching thread (again, if we are in a freshly forked process)"""
+        if self._worker is not None and self._worker.is_alive() and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                # Threads and queued futures don't survive fork - start clean
+                self._pid = os.getpid()
+                self._queue = queue.Queue()
+                self._metrics_lock = threading.Lock()
+                self._reset_metrics()
+                self._worker = None
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name='embedding-engine', daemon=True)
+                self._worker.start()
+
+    def submit(self, text: str) -> Future:
+        """Queue a text for encoding; the future resolves to a float32 numpy vector"""
+        if self.cache is not None:
+            cached = self.cache.get(text)
+            if cached is not None:
+                future = Future()
+                future.set_result(cached)
+                return future
+
+        self._ensure_worker()
+        request = _EncodeRequest(text)
+        self._queue.put(request)
+        return request.future
+
+    def submit_many(self, texts: List[str]) -> List[Future]:
+        """Queue several texts at once"""
+        return [self.submit(text) for text in texts]
+
+    def encode(self, text: str, timeout: Optional[float] = None) -> List[float]:
+        """Blocking helper returning a plain list, or [] on failure or timeout"""
+        return self.encode_many([text], timeout=timeout)[0]
+
+    def encode_many(self, texts: List[str], timeout: Optional[float] = None) -> List[List[float]]:
+        """
+        Blocking helper for bulk callers; failed items come back as []
+        All results share one deadline; requests still queued when it passes are cancelled
+        """
+        deadline = time.monotonic() + (timeout or self.timeout)
+        results = []
+        for future in self.submit_many(texts):
+            try:
+                results.append(future.result(timeout=max(deadline - time.monotonic(), 0)).tolist())
+            except Exception as e:
+                future.cancel()
+                logger.error(f"Error generating embedding: {e!r}")
+                results.append([])
+        return results
+
+    def _collect_batch(self) -> List[_EncodeRequest]:
+        """Block for the first request, then gather more until the batch is full or the wait expires"""
+        batch = [self._queue.get()]
+        deadline = batch[0].enqueued_at + self.max_wait_ms / 1000.0
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                if remaining <= 0:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect_batch()
+            self._process(batch)
+
+    def _process(self, batch: List[_EncodeRequest]):
+        # Drop requests whose caller gave up; the rest can no longer be cancelled
+        live = [request for request in batch if request.future.set_running_or_notify_cancel()]
+        if len(live) < len(batch):
+            with self._metrics_lock:
+                self._metrics['cancelled_texts'] += len(batch) - len(live)
+        batch = live
+        if not batch:
+            return
+
+        # Sort by (approximate) token length so each forward pass pads as little as possible
+        batch.sort(key=lambda request: len(request.text.split()))
+        started = time.perf_counter()
+
+        try:
+            model = self._model_loader()
+            embeddings = model.encode(
+                [request.text for request in batch],
+                batch_size=self.max_batch_size,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            )
+            embeddings = np.asarray(embeddings, dtype=np.float32)
+            if len(embeddings) != len(batch):
+                raise ValueError(f"Model returned {len(embeddings)} embeddings for {len(batch)} texts")
+        except Exception as e:
+            with self._metrics_lock:
+                self._metrics['failed_batches'] += 1
+                self._metrics['failed_texts'] += len(batch)
+            for request in batch:
+                request.future.set_exception(e)
+            return
+
+        finished = time.perf_counter()
+        for request, embedding in zip(batch, embeddings):
+            if self.cache is not None:
+                try:
+                    self.cache.put(request.text, embedding)
+                except Exception as e:
+                    logger.warning(f"Error caching embedding: {e}")
+            request.future.set_result(embedding)
+
+        with self._metrics_lock:
+            self._metrics['wait_seconds_total'] += sum(started - request.enqueued_at for request in batch)
+            self._metrics['batches'] += 1
+            self._metrics['encoded_texts'] += len(batch)
+            self._metrics['last_batch_size'] = len(batch)
+            self._metrics['max_batch_size_seen'] = max(self._metrics['max_batch_size_seen'], len(batch))
+            self._metrics['encode_seconds_total'] += finished - started
+
+    def metrics(self) -> Dict:
+        """Queue depth, batch size and timing figures for capacity planning"""
+        with self._metrics_lock:
+            m = dict(self._metrics)
+        batches = m['batches'] or 1
+        encoded = m['encoded_texts'] or 1
+        m.update({
+            'queue_depth': self._queue.qsize(),
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait_ms,
+            'timeout_seconds': self.timeout,
+            'avg_batch_size': m['encoded_texts'] / batches,
+            'avg_encode_ms': m['encode_seconds_total'] * 1000 / batches,
+            'avg_wait_ms': m['wait_seconds_total'] * 1000 / encoded
+        })
+        return m
+
+
+# Shared instance - every embedding call in the process goes through this engine
+embedding_engine = EmbeddingEngine(
+    cache=EmbeddingCache(model_name=model_registry.embedding_model_name)
+)
@@ -1,10 +1,15 @@
 import os
+import json
+import base64
 import logging
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple, Union
 import google.generativeai as genai
-from sentence_transformers import SentenceTransformer
 import numpy as np
 from sklearn.metrics.pairwise import cosine_similarity
+from .model_registry import model_registry
+from .embedding_engine import embedding_engine
+from .skill_taxonomy import skill_taxonomy
+from .skill_embeddings import skill_embeddings
 
 logger = logging.getLogger(__name__)
 
@@ -17,10 +22,21 @@ class JobMatcher:
     - Google Gemini for semantic understanding
     """
 
+    # Weights of the reranking score; similarity only decides which hits are scored
+    MATCH_WEIGHTS = {
+        'skills': 0.5,
+        'experience': 0.3,
+        'location': 0.2
+    }
+
     def __init__(self, vector_service, api_key: Optional[str] = None):
         self.vector_service = vector_service
         self.api_key = api_key or os.getenv('GOOGLE_API_KEY')
 
+        # Paged matching: fetch rounds and vector hits allowed per page
+        self.max_fetch_rounds = int(os.getenv('MATCH_MAX_FETCH_ROUNDS', 4))
+        self.fetch_budget = int(os.getenv('MATCH_FETCH_BUDGET', 400))
+
         if self.api_key:
             genai.configure(api_key=self.api_key)
             self.gemini_model = genai.GenerativeModel(os.getenv('GEMINI_MODEL', 'gemini-1.5-pro'))
@@ -28,12 +44,14 @@ class JobMatcher:
             logger.warning("Gemini API key not found. Advanced matching features limited.")
             self.gemini_model = None
 
-        # Load embedding model
-        embedding_model_name = os.getenv('EMBEDDING_MODEL', 'sentence-transformers/all-mpnet-base-v2')
-        self.embedding_model = SentenceTransformer(embedding_model_name)
+    @property
+    def embedding_model(self):
+        """Shared embedding model from the process-wide registry"""
+        return model_registry.get_embedding_model()
 
-    def generate_job_embedding(self, job_data: Dict) -> List[float]:
-        """Generate embedding for job posting"""
+    @staticmethod
+    def build_job_embedding_text(job_data: Dict) -> str:
+        """Text that is encoded to produce a job's embedding"""
         embedding_text = f"""
         Title: {job_data.get('title', '')}
         Description: {job_data.get('description', '')}
@@ -42,34 +60,245 @@ class JobMatcher:
         Experience: {job_data.get('experience_years', 0)} years
         Location: {job_data.get('location', '')}
         """
+        return embedding_text.strip()
 
-        try:
-            embedding = self.embedding_model.encode(embedding_text.strip(), convert_to_tensor=False)
-            return embedding.tolist()
-        except Exception as e:
-            logger.error(f"Error generating job embedding: {e}")
-            return []
+    @classmethod
+    def build_job_vector_texts(cls, job_data: Dict) -> Dict[str, str]:
+        """Text encoded for each named job vector: title, skills and full text"""
+        skills = job_data.get('required_skills', []) + job_data.get('preferred_skills', [])
+        return {
+            'title': job_data.get('title', ''),
+            'skills': ', '.join(skills),
+            'full': cls.build_job_embedding_text(job_data)
+        }
+
+    def generate_job_embedding(self, job_data: Dict) -> List[float]:
+        """Generate embedding for job posting"""
+        return embedding_engine.encode(self.build_job_embedding_text(job_data))
+
+    def generate_job_embeddings(self, job_data_list: List[Dict]) -> List[List[float]]:
+        """Generate embeddings for several jobs in one batched call"""
+        return embedding_engine.encode_many([self.build_job_embedding_text(job_data)
+                                             for job_data in job_data_list])
+
+    def generate_job_vectors(self, job_data: Dict) -> Optional[Dict[str, List[float]]]:
+        """Named vectors (title, skills, full) for a job posting, from one batched encode"""
+        return self.generate_job_vectors_many([job_data])[0]
+
+    @classmethod
+    def generate_job_vectors_many(cls, job_data_list: List[Dict]) -> List[Optional[Dict[str, List[float]]]]:
+        """
+        Named vectors for several jobs, all texts encoded in one batched call
+        A job whose encode failed gets None
+        """
+        texts = [cls.build_job_vector_texts(job_data) for job_data in job_data_list]
+        flat = [(index, name, text) for index, job_texts in enumerate(texts) for name, text in job_texts.items()]
+        embeddings = embedding_engine.encode_many([text for _, _, text in flat])
+
+        vectors = [{} for _ in job_data_list]
+        for (index, name, _), embedding in zip(flat, embeddings):
+            if vectors[index] is not None and embedding:
+                vectors[index][name] = embedding
+            else:
+                vectors[index] = None
+        return vectors
 
     def match_jobs_for_candidate(self, resume_data: Dict, resume_embedding: List[float],
-                                 filters: Optional[Dict] = None, limit: int = 10) -> List[Dict]:
+                                 filters: Optional[Dict] = None, limit: int = 10,
+                                 vector: Union[str, Dict[str, float]] = 'full') -> List[Dict]:
         """
         Find best matching jobs for a candidate
+        vector: job vector to search ('title', 'skills', 'full') or {name: weight} to fuse
         """
         # Search similar jobs using vector similarity
         similar_jobs = self.vector_service.search_similar_jobs(
             resume_vector=resume_embedding,
             filters=filters,
+            limit=limit * 2,  # Get more for reranking
+            vector=vector
+        )
+
+        return self._rank_job_matches(resume_data, similar_jobs, limit)
+
+    def match_jobs_for_candidates(self, candidates: List[Dict], limit: int = 10,
+                                  vector: str = 'full') -> List[List[Dict]]:
+        """
+        Find best matching jobs for several candidates with a single batched search
+        candidates: [{'resume_data', 'resume_embedding', 'filters'}, ...]
+        Returns one ranked match list per candidate, in order
+        """
+        batch_results = self.vector_service.search_similar_jobs_batch(
+            [(candidate['resume_embedding'], candidate.get('filters')) for candidate in candidates],
+            limit=limit * 2,  # Get more for reranking
+            vector=vector
+        )
+
+        return [
+            self._rank_job_matches(candidate['resume_data'], similar_jobs, limit)
+            for candidate, similar_jobs in zip(candidates, batch_results)
+        ]
+
+    def match_candidates_for_job(self, job_data: Dict, job_embedding: List[float],
+                                filters: Optional[Dict] = None, limit: int = 20) -> List[Dict]:
+        """
+        Find best matching candidates for a job
+        """
+        # Search similar candidates using vector similarity
+        similar_candidates = self.vector_service.search_similar_candidates(
+            job_vector=job_embedding,
+            filters=filters,
             limit=limit * 2  # Get more for reranking
         )
 
-        # Enhance with detailed matching
-        enhanced_matches = []
-        for job_match in similar_jobs:
-            match_details = self._calculate_detailed_match(
-                resume_data,
-                job_match['payload']
+        return self._rank_candidate_matches(job_data, similar_candidates, limit)
+
+    def match_candidates_for_jobs(self, jobs: List[Dict], limit: int = 20) -> List[List[Dict]]:
+        """
+        Find best matching candidates for several jobs with a single batched search
+        jobs: [{'job_data', 'job_embedding', 'filters'}, ...]
+        Returns one ranked match list per job, in order
+        """
+        batch_results = self.vector_service.search_similar_candidates_batch(
+            [(job['job_embedding'], job.get('filters')) for job in jobs],
+            limit=limit * 2  # Get more for reranking
+        )
+
+        return [
+            self._rank_candidate_matches(job['job_data'], similar_candidates, limit)
+            for job, similar_candidates in zip(jobs, batch_results)
+        ]
+
+    def match_jobs_for_candidate_page(self, resume_data: Dict, resume_embedding: List[float],
+                                      filters: Optional[Dict] = None, limit: int = 10,
+                                      cursor: Optional[str] = None, min_similarity: Optional[float] = None,
+                                      min_score: Optional[float] = None,
+                                      accept: Optional[Callable[[List[Dict]], List[Dict]]] = None,
+                                      vector: Union[str, Dict[str, float]] = 'full') -> Dict:
+        """
+        One page of job matches for a candidate, continuing from `cursor`
+        Returns {'matches', 'next_cursor', 'stats'}; see _match_page
+        """
+        def search(offset, size, score_threshold):
+            return self.vector_service.search_similar_jobs(
+                resume_vector=resume_embedding,
+                filters=filters,
+                limit=size,
+                offset=offset,
+                score_threshold=score_threshold,
+                vector=vector
             )
 
+        def score(hits):
+            return self._rank_job_matches(resume_data, hits, len(hits), sort=False)
+
+        return self._match_page(search, score, limit, cursor, min_similarity, min_score, accept)
+
+    def match_candidates_for_job_page(self, job_data: Dict, job_embedding: List[float],
+                                      filters: Optional[Dict] = None, limit: int = 20,
+                                      cursor: Optional[str] = None, min_similarity: Optional[float] = None,
+                                      min_score: Optional[float] = None,
+                                      accept: Optional[Callable[[List[Dict]], List[Dict]]] = None) -> Dict:
+        """
+        One page of candidate matches for a job, continuing from `cursor`
+        Returns {'matches', 'next_cursor', 'stats'}; see _match_page
+        """
+        def search(offset, size, score_threshold):
+            return self.vector_service.search_similar_candidates(
+                job_vector=job_embedding,
+                filters=filters,
+                limit=size,
+                offset=offset,
+                score_threshold=score_threshold
+            )
+
+        def score(hits):
+            return self._rank_candidate_matches(job_data, hits, len(hits), sort=False)
+
+        return self._match_page(search, score, limit, cursor, min_similarity, min_score, accept)
+
+    def _match_page(self, search, score, limit: int, cursor: Optional[str],
+                    min_similarity: Optional[float], min_score: Optional[float],
+                    accept: Optional[Callable[[List[Dict]], List[Dict]]]) -> Dict:
+        """
+        Fill a page of `limit` matches with iterative deepening
+        Vector hits are consumed in similarity order; `accept` (e.g. a Mongo existence check)
+        and `min_score` (reranker cut-off) drop hits. While the page is short, the next
+        window (twice as large) is fetched, up to max_fetch_rounds / fetch_budget hits.
+        The cursor records how many hits were consumed plus the similarity floor, so pages
+        never overlap or skip; each page is sorted by overall score. Every match records
+        that count at the point it was taken as 'hit_offset' (see MatchStore.page).
+        """
+        offset, score_threshold = self.decode_cursor(cursor) if cursor else (0, min_similarity)
+
+        matches = []
+        stats = {'fetch_rounds': 0, 'fetched': 0, 'dropped': 0}
+        window = limit * 2
+        exhausted = False
+
+        while len(matches) < limit and stats['fetch_rounds'] < self.max_fetch_rounds and not exhausted:
+            size = min(window, self.fetch_budget - stats['fetched'])
+            if size <= 0:
+                break
+
+            hits = search(offset, size, score_threshold)
+            stats['fetch_rounds'] += 1
+            stats['fetched'] += len(hits)
+            exhausted = len(hits) < size
+            accepted = accept(hits) if accept else hits
+            # The whole window is reranked in one batch
+            scored = {id(hit): match for hit, match in zip(accepted, score(accepted))}
+
+            for hit in hits:
+                if len(matches) >= limit:
+                    # Unconsumed hits of this window start the next page
+                    exhausted = False
+                    break
+                offset += 1
+
+                match = scored.get(id(hit))
+                if match is None or (min_score is not None and match['overall_score'] < min_score):
+                    stats['dropped'] += 1
+                    continue
+                match['hit_offset'] = offset
+                matches.append(match)
+
+            window *= 2
+
+        matches.sort(key=lambda x: x['overall_score'], reverse=True)
+        logger.info(f"Match page: {len(matches)} matches after {stats['fetch_rounds']} fetch rounds "
+                    f"({stats['fetched']} fetched, {stats['dropped']} dropped)")
+
+        return {
+            'matches': matches,
+            'next_cursor': None if exhausted else self.encode_cursor(offset, score_threshold),
+            'stats': stats
+        }
+
+    @staticmethod
+    def encode_cursor(offset: int, score_threshold: Optional[float] = None) -> str:
+        """Opaque page cursor"""
+        raw = json.dumps({'o': offset, 't': score_threshold}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    @staticmethod
+    def decode_cursor(cursor: str):
+        """(offset, score_threshold) from a cursor; raises ValueError if it is malformed"""
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+            offset, score_threshold = int(data['o']), data.get('t')
+        except Exception:
+            raise ValueError("Invalid cursor")
+        if offset < 0:
+            raise ValueError("Invalid cursor")
+        return offset, score_threshold
+
+    def _rank_job_matches(self, resume_data: Dict, similar_jobs: List[Dict], limit: int,
+                          sort: bool = True) -> List[Dict]:
+        """Score vector hits for a candidate and keep the best `limit` (in hit order when not sorting)"""
+        # Enhance with detailed matching
+        enhanced_matches = []
+        details = self.score_jobs_batch(resume_data, [job_match['payload'] for job_match in similar_jobs])
+        for job_match, match_details in zip(similar_jobs, details):
             enhanced_matches.append({
                 'job_id': job_match['job_id'],
                 'similarity_score': job_match['score'],
@@ -81,30 +310,18 @@ class JobMatcher:
             })
 
         # Sort by overall score
-        enhanced_matches.sort(key=lambda x: x['overall_score'], reverse=True)
+        if sort:
+            enhanced_matches.sort(key=lambda x: x['overall_score'], reverse=True)
 
         return enhanced_matches[:limit]
 
-    def match_candidates_for_job(self, job_data: Dict, job_embedding: List[float],
-                                filters: Optional[Dict] = None, limit: int = 20) -> List[Dict]:
-        """
-        Find best matching candidates for a job
-        """
-        # Search similar candidates using vector similarity
-        similar_candidates = self.vector_service.search_similar_candidates(
-            job_vector=job_embedding,
-            filters=filters,
-            limit=limit * 2  # Get more for reranking
-        )
-
+    def _rank_candidate_matches(self, job_data: Dict, similar_candidates: List[Dict],
+                                limit: int, sort: bool = True) -> List[Dict]:
+        """Score vector hits for a job and keep the best `limit` (in hit order when not sorting)"""
         # Enhance with detailed matching
         enhanced_matches = []
-        for candidate_match in similar_candidates:
-            match_details = self._calculate_candidate_job_match(
-                candidate_match['payload'],
-                job_data
-            )
-
+        details = self.score_candidates_batch(job_data, [match['payload'] for match in similar_candidates])
+        for candidate_match, match_details in zip(similar_candidates, details):
             enhanced_matches.append({
                 'user_id': candidate_match['user_id'],
                 'similarity_score': candidate_match['score'],
@@ -116,18 +333,147 @@ class JobMatcher:
             })
 
         # Sort by overall score
-        enhanced_matches.sort(key=lambda x: x['overall_score'], reverse=True)
+        if sort:
+            enhanced_matches.sort(key=lambda x: x['overall_score'], reverse=True)
 
         return enhanced_matches[:limit]
 
+    @classmethod
+    def score_jobs_batch(cls, resume_data: Dict, job_payloads: List[Dict]) -> List[Dict]:
+        """
+        _calculate_detailed_match for one resume against many job payloads
+        The candidate's skill ID set (expanded with semantically matching skills) and
+        the weights are built once; overlap counts, experience gaps and location flags
+        are scored as arrays
+        """
+        candidate_skills = skill_embeddings.expand(cls._skill_names(resume_data, 'skills'))
+        candidate_experience = resume_data.get('experience_years', 0)
+        candidate_location = (resume_data.get('location') or '').lower()
+
+        required_sets = [cls._skill_names(job, 'required_skills') for job in job_payloads]
+        matched_required = [required.keys() & candidate_skills for required in required_sets]
+        required_experience = [job.get('experience_years', 0) for job in job_payloads]
+        job_locations = [(job.get('location') or '').lower() for job in job_payloads]
+
+        columns = cls._score_arrays(
+            np.fromiter(map(len, matched_required), dtype=np.int64, count=len(job_payloads)),
+            np.fromiter(map(len, required_sets), dtype=np.int64, count=len(job_payloads)),
+            np.full(len(job_payloads), candidate_experience, dtype=float),
+            np.asarray(required_experience, dtype=float),
+            [not location or location == candidate_location for location in job_locations]
+        )
+
+        return [
+            {
+                'overall_score': overall,
+                'skill_match_percentage': percentage,
+                'matched_required_skills': [name for skill_id, name in required.items() if skill_id in matched],
+                'matched_preferred_skills': [name for skill_id, name
+                                             in cls._skill_names(job, 'preferred_skills').items()
+                                             if skill_id in candidate_skills],
+                'missing_skills': [name for skill_id, name in required.items() if skill_id not in matched],
+                'experience_match': experience_match,
+                'candidate_experience': candidate_experience,
+                'required_experience': experience,
+                'location_match': location
+            }
+            for (overall, percentage, experience_match, location), job, required, matched, experience
+            in zip(zip(*columns), job_payloads, required_sets, matched_required, required_experience)
+        ]
+
+    @classmethod
+    def score_candidates_batch(cls, job_data: Dict, candidate_payloads: List[Dict]) -> List[Dict]:
+        """_calculate_candidate_job_match for one job against many candidate payloads, scored as arrays"""
+        required_skills = skill_embeddings.neighbours(cls._skill_names(job_data, 'required_skills'))
+        job_location = (job_data.get('location') or '').lower()
+
+        candidate_sets = [cls._skill_names(candidate, 'skills') for candidate in candidate_payloads]
+
+        columns = cls._score_arrays(
+            np.fromiter((sum(not matches.isdisjoint(skills) for matches in required_skills.values())
+                         for skills in candidate_sets),
+                        dtype=np.int64, count=len(candidate_payloads)),
+            np.full(len(candidate_payloads), len(required_skills), dtype=np.int64),
+            np.asarray([candidate.get('experience_years', 0) for candidate in candidate_payloads], dtype=float),
+            np.full(len(candidate_payloads), job_data.get('experience_years', 0), dtype=float),
+            [not job_location or (candidate.get('location') or '').lower() == job_location
+             for candidate in candidate_payloads]
+        )
+
+        return [
+            {
+                'overall_score': overall,
+                'skill_match_percentage': percentage,
+                'experience_match': experience_match,
+                'location_match': location
+            }
+            for overall, percentage, experience_match, location in zip(*columns)
+        ]
+
+    @classmethod
+    def job_skill_ids(cls, job_data: Dict) -> Dict[str, List[int]]:
+        """Skill ID arrays stored alongside a job's skill lists (aligned with them, one ID per skill)"""
+        return {
+            'required_skill_ids': skill_taxonomy.ids_for(job_data.get('required_skills', [])),
+            'preferred_skill_ids': skill_taxonomy.ids_for(job_data.get('preferred_skills', []))
+        }
+
+    @staticmethod
+    def _skill_names(data: Dict, field: str) -> Dict[int, str]:
+        """
+        {skill ID: lowercased skill} for a skill list, first spelling per ID
+        Uses the stored '<field>_ids' array when it lines up with the list, so payloads
+        written after the taxonomy existed skip normalisation entirely
+        """
+        skills = data.get(field) or []
+        skill_ids = data.get(f"{field[:-1]}_ids")
+        if skill_ids is None or len(skill_ids) != len(skills):
+            skill_ids = skill_taxonomy.ids_for(skills)
+
+        names = {}
+        for skill_id, skill in zip(skill_ids, skills):
+            names.setdefault(skill_id, skill.lower())
+        return names
+
+    @classmethod
+    def _score_arrays(cls, matched_counts: np.ndarray, required_counts: np.ndarray,
+                      candidate_experience: np.ndarray, required_experience: np.ndarray,
+                      location_match: List[bool]) -> Tuple[List, List, List, List]:
+        """
+        (overall_score, skill_match_percentage, experience_match, location_match) columns,
+        with the same arithmetic as the per-pair functions
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            skill_match_percentage = np.where(required_counts > 0,
+                                              (matched_counts / required_counts) * 100, 100.0)
+
+        experience_match = candidate_experience >= required_experience
+        experience_score = np.where(
+            experience_match, 1.0, np.maximum(0, 1 - (required_experience - candidate_experience) / 10)
+        )
+
+        location_match = np.asarray(location_match, dtype=bool)
+        location_score = np.where(location_match, 1.0, 0.5)
+
+        weights = cls.MATCH_WEIGHTS
+        overall_score = (
+            weights['skills'] * (skill_match_percentage / 100) +
+            weights['experience'] * experience_score +
+            weights['location'] * location_score
+        )
+
+        return (overall_score.tolist(), skill_match_percentage.tolist(),
+                experience_match.tolist(), location_match.tolist())
+
     def _calculate_detailed_match(self, resume_data: Dict, job_payload: Dict) -> Dict:
         """
         Calculate detailed matching metrics between resume and job
         """
-        # Extract data
-        candidate_skills = set([s.lower() for s in resume_data.get('skills', [])])
-        required_skills = set([s.lower() for s in job_payload.get('required_skills', [])])
-        preferred_skills = set([s.lower() for s in job_payload.get('preferred_skills', [])])
+        # Extract data (skills keyed by taxonomy ID, so aliases match; the candidate's
+        # set also holds every skill that semantically matches one of theirs)
+        candidate_skills = skill_embeddings.expand(self._skill_names(resume_data, 'skills'))
+        required_skills = self._skill_names(job_payload, 'required_skills')
+        preferred_skills = self._skill_names(job_payload, 'preferred_skills')
 
         candidate_experience = resume_data.get('experience_years', 0)
         required_experience = job_payload.get('experience_years', 0)
@@ -137,12 +483,12 @@ class JobMatcher:
 
         # Skill matching
         if required_skills:
-            matched_required = candidate_skills.intersection(required_skills)
+            matched_required = [name for skill_id, name in required_skills.items() if skill_id in candidate_skills]
             skill_match_percentage = (len(matched_required) / len(required_skills)) * 100
         else:
             skill_match_percentage = 100
 
-        matched_preferred = candidate_skills.intersection(preferred_skills) if preferred_skills else set()
+        matched_preferred = [name for skill_id, name in preferred_skills.items() if skill_id in candidate_skills]
 
         # Experience matching
         experience_match = candidate_experience >= required_experience
@@ -151,11 +497,7 @@ class JobMatcher:
         location_match = (candidate_location == job_location) if job_location else True
 
         # Calculate overall score (weighted)
-        weights = {
-            'skills': 0.5,
-            'experience': 0.3,
-            'location': 0.2
-        }
+        weights = self.MATCH_WEIGHTS
 
         skill_score = skill_match_percentage / 100
         experience_score = 1.0 if experience_match else max(0, 1 - (required_experience - candidate_experience) / 10)
@@ -170,9 +512,9 @@ class JobMatcher:
         return {
             'overall_score': overall_score,
             'skill_match_percentage': skill_match_percentage,
-            'matched_required_skills': list(matched_required) if required_skills else [],
-            'matched_preferred_skills': list(matched_preferred),
-            'missing_skills': list(required_skills - candidate_skills) if required_skills else [],
+            'matched_required_skills': matched_required if required_skills else [],
+            'matched_preferred_skills': matched_preferred,
+            'missing_skills': [name for skill_id, name in required_skills.items() if skill_id not in candidate_skills],
             'experience_match': experience_match,
             'candidate_experience': candidate_experience,
             'required_experience': required_experience,
@@ -184,9 +526,8 @@ class JobMatcher:
         Calculate match between candidate and job (reverse of above)
         """
         # Extract data
-        candidate_skills = set([s.lower() for s in candidate_payload.get('skills', [])])
-        required_skills = set([s.lower() for s in job_data.get('required_skills', [])])
-        preferred_skills = set([s.lower() for s in job_data.get('preferred_skills', [])])
+        candidate_skills = self._skill_names(candidate_payload, 'skills')
+        required_skills = skill_embeddings.neighbours(self._skill_names(job_data, 'required_skills'))
 
         candidate_experience = candidate_payload.get('experience_years', 0)
         required_experience = job_data.get('experience_years', 0)
@@ -196,7 +537,8 @@ class JobMatcher:
 
         # Skill matching
         if required_skills:
-            matched_required = candidate_skills.intersection(required_skills)
+            matched_required = [skill_id for skill_id, matches in required_skills.items()
+                                if not matches.isdisjoint(candidate_skills)]
             skill_match_percentage = (len(matched_required) / len(required_skills)) * 100
         else:
             skill_match_percentage = 100
@@ -208,11 +550,7 @@ class JobMatcher:
         location_match = (candidate_location == job_location) if job_location else True
 
         # Calculate overall score
-        weights = {
-            'skills': 0.5,
-            'experience': 0.3,
-            'location': 0.2
-        }
+        weights = self.MATCH_WEIGHTS
 
         skill_score = skill_match_percentage / 100
         experience_score = 1.0 if experience_match else max(0, 1 - (required_experience - candidate_experience) / 10)
@@ -0,0 +1,156 @@
+import os
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+from pymongo import ReplaceOne
+from .job_matcher import JobMatcher
+from .skill_taxonomy import skill_taxonomy
+
+logger = logging.getLogger(__name__)
+
+
+class MatchStore:
+    """
+    Materialised match lists in the Mongo `job_matches` collection.
+
+    One document per owner: kind 'job' holds the ranked candidates for a job,
+    kind 'resume' the ranked jobs for a resume. Reads are a single _id lookup.
+    Each stored match keeps `hit_offset`, the number of vector hits consumed when
+    it was accepted, so any page of the default (unfiltered) query can be cut from
+    the list with the same boundaries and cursors as live paging. Entries expire
+    through a TTL index on created_at. They are also stale when their version key
+    (MATCH_STORE_VERSION plus the skill taxonomy version) changed, or when the job
+    or resume was updated after they were computed.
+    """
+
+    KINDS = ('job', 'resume')
+    # Collections whose TTL index was already ensured by this process
+    _indexed = set()
+
+    def __init__(self, db, ttl_seconds: Optional[int] = None, size: Optional[int] = None):
+        self.db = db
+        self.collection = db.job_matches
+        self.ttl_seconds = ttl_seconds or int(os.getenv('MATCH_STORE_TTL_SECONDS', 3600))
+        # Matches precomputed per owner by the Celery tasks
+        self.size = size or int(os.getenv('MATCH_STORE_SIZE', 100))
+
+    @property
+    def version(self) -> str:
+        return f"{os.getenv('MATCH_STORE_VERSION', '1')}:t{skill_taxonomy.version}"
+
+    @staticmethod
+    def key(kind: str, owner_id: str) -> str:
+        return f"{kind}:{owner_id}"
+
+    def ensure_indexes(self):
+        """TTL index on created_at; Mongo drops entries ttl_seconds after they were written. A changed TTL is applied with collMod"""
+        if self.collection.full_name in self._indexed:
+            return
+        try:
+            existing = self.collection.index_information().get('created_at_1')
+            if existing is None:
+                self.collection.create_index('created_at', expireAfterSeconds=self.ttl_seconds)
+            elif existing.get('expireAfterSeconds') != self.ttl_seconds:
+                # create_index would fail with IndexOptionsConflict; change the TTL in place
+                self.db.command(
+                    'collMod', self.collection.name,
+                    index={'keyPattern': {'created_at': 1}, 'expireAfterSeconds': self.ttl_seconds}
+                )
+                logger.info(
+                    f"Changed job_matches TTL from {existing.get('expireAfterSeconds')}s to {self.ttl_seconds}s"
+                )
+        except Exception as e:
+            logger.error(f"Could not apply job_matches TTL index ({self.ttl_seconds}s): {e}")
+        self._indexed.add(self.collection.full_name)
+
+    def build_entry(self, kind: str, owner_id: str, page: Dict, **fields) -> Dict:
+        """
+        Entry for a match page (see JobMatcher._match_page)
+        A page without next_cursor scanned every hit, so it answers any later page too
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"kind must be one of {', '.join(self.KINDS)}")
+
+        entry = {
+            '_id': self.key(kind, owner_id),
+            'kind': kind,
+            'owner_id': owner_id,
+            'version': self.version,
+            'matches': sorted(page['matches'], key=lambda match: match['hit_offset']),
+            'complete': page['next_cursor'] is None,
+            'created_at': datetime.utcnow()
+        }
+        entry.update(fields)
+        return entry
+
+    def save_many(self, entries: List[Dict]) -> int:
+        """Upsert entries with one bulk write; returns how many were written"""
+        if not entries:
+            return 0
+        self.ensure_indexes()
+        try:
+            self.collection.bulk_write(
+                [ReplaceOne({'_id': entry['_id']}, entry, upsert=True) for entry in entries],
+                ordered=False
+            )
+            return len(entries)
+        except Exception as e:
+            logger.error(f"Error saving match entries: {e}")
+            return 0
+
+    def save(self, kind: str, owner_id: str, page: Dict, **fields) -> bool:
+        return self.save_many([self.build_entry(kind, owner_id, page, **fields)]) == 1
+
+    def get(self, kind: str, owner_id: str, updated_at: Optional[datetime] = None) -> Optional[Dict]:
+        """The stored entry, or None when it is missing or stale"""
+        try:
+            entry = self.collection.find_one({'_id': self.key(kind, owner_id)})
+        except Exception as e:
+            logger.error(f"Error reading match entry: {e}")
+            return None
+
+        if not entry or entry.get('version') != self.version:
+            return None
+        # The TTL monitor only runs once a minute, so check the age as well
+        if entry['created_at'] < datetime.utcnow() - timedelta(seconds=self.ttl_seconds):
+            return None
+        if isinstance(updated_at, datetime) and updated_at > entry['created_at']:
+            return None
+        return entry
+
+    def page(self, entry: Dict, cursor: Optional[str], limit: int) -> Optional[Dict]:
+        """
+        {'matches', 'next_cursor'} for the page of the default query starting at `cursor`,
+        or None when the entry does not reach far enough (or the cursor carries a
+        similarity floor) and the page has to be computed live
+        """
+        offset, score_threshold = JobMatcher.decode_cursor(cursor) if cursor else (0, None)
+        if score_threshold is not None or limit <= 0:
+            return None
+
+        remaining = [match for match in entry['matches'] if match['hit_offset'] > offset]
+        if len(remaining) > limit or (len(remaining) == limit and not entry.get('complete')):
+            matches = remaining[:limit]
+            next_cursor = JobMatcher.encode_cursor(matches[-1]['hit_offset'])
+        elif entry.get('complete'):
+            # Unlike live paging, the last page never hands out a cursor to an empty page
+            matches = remaining
+            next_cursor = None
+        else:
+            return None
+
+        return {
+            'matches': sorted(matches, key=lambda match: match['overall_score'], reverse=True),
+            'next_cursor': next_cursor
+        }
+
+    def delete(self, kind: str, owner_ids: Iterable[str]) -> int:
+        """Drop entries, e.g. for deleted jobs"""
+        try:
+            result = self.collection.delete_many(
+                {'_id': {'$in': [self.key(kind, owner_id) for owner_id in owner_ids]}}
+            )
+            return result.deleted_count
+        except Exception as e:
+            logger.error(f"Error deleting match entries: {e}")
+            return 0
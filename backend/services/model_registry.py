@@ -0,0 +1,113 @@
+import os
+import time
+import logging
+import threading
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ModelRegistry:
+    """
+    Process-wide registry for the heavy ML models (sentence-transformers, spaCy).
+    Models are loaded lazily on first use, exactly once per process, and shared by
+    every service instance and Celery task running in that process.
+    """
+
+    def __init__(self):
+        self.embedding_model_name = os.getenv('EMBEDDING_MODEL', 'sentence-transformers/all-mpnet-base-v2')
+        self.spacy_model_name = os.getenv('SPACY_MODEL', 'en_core_web_sm')
+
+        self._lock = threading.RLock()
+        self._embedding_model = None
+        self._nlp = None
+        self._nlp_loaded = False
+        self._load_times: Dict[str, float] = {}
+        self._errors: Dict[str, str] = {}
+        self._warm_up_thread: Optional[threading.Thread] = None
+
+    def get_embedding_model(self):
+        """Return the shared SentenceTransformer, loading it on first call"""
+        if self._embedding_model is None:
+            with self._lock:
+                if self._embedding_model is None:
+                    from sentence_transformers import SentenceTransformer
+
+                    start = time.perf_counter()
+                    try:
+                        self._embedding_model = SentenceTransformer(self.embedding_model_name)
+                    except Exception as e:
+                        self._errors['embedding_model'] = str(e)
+                        raise
+                    self._load_times['embedding_model'] = time.perf_counter() - start
+                    self._errors.pop('embedding_model', None)
+                    logger.info(f"Loaded embedding model {self.embedding_model_name} "
+                                f"in {self._load_times['embedding_model']:.2f}s (pid {os.getpid()})")
+        return self._embedding_model
+
+    def get_nlp(self):
+        """Return the shared spaCy pipeline, or None if the model is not installed"""
+        if not self._nlp_loaded:
+            with self._lock:
+                if not self._nlp_loaded:
+                    import spacy
+
+                    start = time.perf_counter()
+                    try:
+                        self._nlp = spacy.load(self.spacy_model_name)
+                        self._load_times['nlp'] = time.perf_counter() - start
+                        logger.info(f"Loaded spaCy model {self.spacy_model_name} "
+                                    f"in {self._load_times['nlp']:.2f}s (pid {os.getpid()})")
+                    except OSError:
+                        logger.warning("spaCy model not found. Some features may be limited.")
+                        self._nlp = None
+                    self._nlp_loaded = True
+        return self._nlp
+
+    def warm_up(self, background: bool = False) -> bool:
+        """
+        Load every model up front so the first request doesn't pay for it.
+        With background=True the load runs in a daemon thread and this returns immediately.
+        """
+        if background:
+            with self._lock:
+                if self._warm_up_thread is None or not self._warm_up_thread.is_alive():
+                    self._warm_up_thread = threading.Thread(
+                        target=self.warm_up, name='model-warm-up', daemon=True
+                    )
+                    self._warm_up_thread.start()
+            return self.is_ready()
+
+        try:
+            self.get_embedding_model()
+            self.get_nlp()
+        except Exception as e:
+            logger.error(f"Model warm-up failed: {e}")
+        return self.is_ready()
+
+    def is_ready(self) -> bool:
+        """True once the embedding model is loaded (spaCy is optional)"""
+        return self._embedding_model is not None and self._nlp_loaded
+
+    def status(self) -> Dict:
+        """Readiness report for health checks"""
+        return {
+            'ready': self.is_ready(),
+            'pid': os.getpid(),
+            'embedding_model': {
+                'name': self.embedding_model_name,
+                'loaded': self._embedding_model is not None,
+                'load_seconds': self._load_times.get('embedding_model'),
+                'error': self._errors.get('embedding_model')
+            },
+            'nlp': {
+                'name': self.spacy_model_name,
+                'loaded': self._nlp is not None,
+                'available': self._nlp is not None or not self._nlp_loaded,
+                'load_seconds': self._load_times.get('nlp')
+            }
+        }
+
+
+# Shared instance - import this rather than constructing a new registry
+model_registry = ModelRegistry()
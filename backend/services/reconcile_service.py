@@ -0,0 +1,197 @@
+import os
+import time
+import logging
+from itertools import islice
+from typing import Dict, Iterable, List, Optional
+from bson import ObjectId
+from pymongo import UpdateOne
+from .reindex_service import ReindexService
+
+logger = logging.getLogger(__name__)
+
+
+class ReconcileService:
+    """
+    Keeps MongoDB and the vector store consistent.
+
+    Two streaming passes per kind, one page at a time, so memory stays flat:
+    - points -> Mongo: scroll the collection and look each page's owners up with
+      one $in query. Points whose job/resume is gone, or that sit at a legacy
+      (non-deterministic) ID, are orphans.
+    - Mongo -> points: page through the documents and retrieve their expected
+      point IDs in one call. Documents without a point are missing; documents
+      whose vector_id doesn't name that point are stale.
+
+    Report mode only counts drift. Repair mode deletes orphans, re-embeds missing
+    documents and rewrites stale vector_ids. Points written within grace_seconds
+    are never treated as orphans, since API writes store the vector before the
+    Mongo document.
+    """
+
+    KINDS = ReindexService.KINDS
+
+    def __init__(self, vector_service, db, page_size: Optional[int] = None,
+                 grace_seconds: Optional[float] = None, batch_size: int = 64):
+        self.vector_service = vector_service
+        self.db = db
+        self.page_size = page_size or int(os.getenv('RECONCILE_PAGE_SIZE', 512))
+        self.grace_seconds = (float(os.getenv('RECONCILE_GRACE_SECONDS', 300))
+                              if grace_seconds is None else grace_seconds)
+        self.reindex_service = ReindexService(vector_service, db, batch_size=batch_size)
+
+    def reconcile(self, kinds: Iterable[str] = KINDS, repair: bool = False) -> Dict:
+        """
+        Diff each kind and optionally repair it
+        Returns {'kinds': {kind: stats}, 'drift': total, 'repair': bool}
+        """
+        report = {'kinds': {}, 'drift': 0, 'repair': repair}
+
+        for kind in kinds:
+            if kind not in self.KINDS:
+                continue
+            stats = {
+                'kind': kind,
+                'points_scanned': 0,
+                'documents_scanned': 0,
+                'orphans': 0,
+                'missing': 0,
+                'stale_refs': 0,
+                'deleted': 0,
+                're_embedded': 0,
+                'refs_fixed': 0,
+                'failed': 0,
+                'elapsed_seconds': 0.0,
+                'points_per_second': 0.0,
+                'documents_per_second': 0.0
+            }
+            started = time.perf_counter()
+
+            self._reconcile_points(kind, stats, repair)
+            self._reconcile_documents(kind, stats, repair)
+
+            elapsed = time.perf_counter() - started
+            stats['drift'] = stats['orphans'] + stats['missing'] + stats['stale_refs']
+            stats['elapsed_seconds'] = elapsed
+            stats['points_per_second'] = stats['points_scanned'] / elapsed if elapsed else 0.0
+            stats['documents_per_second'] = stats['documents_scanned'] / elapsed if elapsed else 0.0
+
+            logger.info(f"Reconciled {kind}: drift {stats['drift']} (orphans {stats['orphans']}, "
+                        f"missing {stats['missing']}, stale {stats['stale_refs']}) over "
+                        f"{stats['points_scanned']} points / {stats['documents_scanned']} documents "
+                        f"in {elapsed:.1f}s")
+
+            report['kinds'][kind] = stats
+            report['drift'] += stats['drift']
+
+        return report
+
+    def _collection(self, kind: str) -> str:
+        if kind == 'jobs':
+            return self.vector_service.job_collection
+        return self.vector_service.resume_collection
+
+    def _reconcile_points(self, kind: str, stats: Dict, repair: bool):
+        """Scroll the vector collection and find points with no matching Mongo document"""
+        fields = ['job_id', 'indexed_at'] if kind == 'jobs' else ['user_id', 'resume_id', 'indexed_at']
+        points = self.vector_service.iter_points(self._collection(kind), with_payload=fields,
+                                                 page_size=self.page_size)
+        cutoff = time.time() - self.grace_seconds
+
+        while True:
+            page = list(islice(points, self.page_size))
+            if not page:
+                return
+            stats['points_scanned'] += len(page)
+
+            expected = self._expected_ids_for_points(kind, page)
+            orphans = [str(point.id) for point in page
+                       if expected.get(str(point.id)) != str(point.id)
+                       and (point.payload or {}).get('indexed_at', 0) < cutoff]
+            stats['orphans'] += len(orphans)
+
+            if repair and orphans:
+                if kind == 'jobs':
+                    deleted = self.vector_service.delete_job_vectors(orphans)
+                else:
+                    deleted = self.vector_service.delete_resume_vectors(orphans)
+                if deleted:
+                    stats['deleted'] += len(orphans)
+                else:
+                    stats['failed'] += len(orphans)
+
+    def _expected_ids_for_points(self, kind: str, page: List) -> Dict[str, Optional[str]]:
+        """
+        {point_id: deterministic ID of the live document owning it}
+        None when the owner no longer exists
+        """
+        if kind == 'jobs':
+            job_ids = {(point.payload or {}).get('job_id') for point in page} - {None}
+            live = {doc['id'] for doc in self.db.jobs.find({'id': {'$in': list(job_ids)}}, {'id': 1})}
+            return {
+                str(point.id): self.vector_service.job_vector_id(point.payload['job_id'])
+                if (point.payload or {}).get('job_id') in live else None
+                for point in page
+            }
+
+        resume_ids = {}
+        for point in page:
+            resume_id = (point.payload or {}).get('resume_id')
+            if resume_id and ObjectId.is_valid(resume_id):
+                resume_ids[str(point.id)] = ObjectId(resume_id)
+
+        live = {
+            str(doc['_id']): doc['user_id']
+            for doc in self.db.resumes.find({'_id': {'$in': list(set(resume_ids.values()))}},
+                                            {'user_id': 1})
+        }
+
+        expected = {}
+        for point in page:
+            resume_oid = resume_ids.get(str(point.id))
+            user_id = live.get(str(resume_oid)) if resume_oid else None
+            if user_id and user_id == point.payload.get('user_id'):
+                expected[str(point.id)] = self.vector_service.resume_vector_id(user_id, str(resume_oid))
+            else:
+                expected[str(point.id)] = None
+        return expected
+
+    def _reconcile_documents(self, kind: str, stats: Dict, repair: bool):
+        """Page through Mongo and find documents whose point is missing or mis-referenced"""
+        source = self.db.jobs if kind == 'jobs' else self.db.resumes
+        cursor = source.find({})
+
+        while True:
+            docs = list(islice(cursor, self.page_size))
+            if not docs:
+                return
+            stats['documents_scanned'] += len(docs)
+
+            expected = {id(doc): self._expected_id(kind, doc) for doc in docs}
+            present = self.vector_service.existing_point_ids(self._collection(kind), list(expected.values()))
+
+            missing = [doc for doc in docs if expected[id(doc)] not in present]
+            stale = [doc for doc in docs
+                     if expected[id(doc)] in present and doc.get('vector_id') != expected[id(doc)]]
+            stats['missing'] += len(missing)
+            stats['stale_refs'] += len(stale)
+
+            if not repair:
+                continue
+
+            if missing:
+                stored = self.reindex_service.store_documents(kind, missing)
+                stats['re_embedded'] += len(stored)
+                stats['failed'] += len(missing) - len(stored)
+
+            if stale:
+                selector = 'id' if kind == 'jobs' else '_id'
+                source.bulk_write([
+                    UpdateOne({selector: doc[selector]}, {'$set': {'vector_id': expected[id(doc)]}})
+                    for doc in stale
+                ], ordered=False)
+                stats['refs_fixed'] += len(stale)
+
+    def _expected_id(self, kind: str, doc: Dict) -> str:
+        if kind == 'jobs':
+            return self.vector_service.job_vector_id(doc['id'])
+        return self.vector_service.resume_vector_id(doc['user_id'], str(doc['_id']))
@@ -0,0 +1,243 @@
+import time
+import logging
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Set
+from pymongo import UpdateOne
+from models import Job, User
+from .embedding_engine import embedding_engine
+from .job_matcher import JobMatcher
+from .resume_parser import ResumeParser
+
+logger = logging.getLogger(__name__)
+
+
+class ReindexService:
+    """
+    Zero-downtime rebuild of the jobs and resumes vector collections.
+
+    Each rebuild creates fresh versioned collections (e.g. jobs_v20240101120000),
+    streams every job and resume from MongoDB through the batched embedding engine
+    into them, and only then switches the 'jobs' and 'resumes' aliases over in a
+    single atomic alias update. Searches keep hitting the old collections until
+    the switch, so a model or EMBEDDING_DIMENSION change never takes search down.
+    Jobs and resumes written while the rebuild streams are re-stored after the switch.
+    """
+
+    KINDS = ('jobs', 'resumes')
+
+    def __init__(self, vector_service, db, batch_size: int = 64,
+                 progress_callback: Optional[Callable[[Dict], None]] = None):
+        self.vector_service = vector_service
+        self.db = db
+        self.batch_size = batch_size
+        self.progress_callback = progress_callback
+        self._company_cache: Dict[str, str] = {}
+        self._location_cache: Dict[str, str] = {}
+
+    def rebuild(self, kinds: Iterable[str] = KINDS, version: Optional[str] = None,
+                drop_old: bool = False, allow_partial: bool = False) -> Dict:
+        """
+        Build new collections for the given kinds and switch their aliases
+        A rebuild where any document failed to embed/upsert is aborted before the
+        switch unless allow_partial is set, and never drops the old collections.
+        Documents written while the rebuild streamed are re-stored after the switch.
+        Returns a report with per-kind counts, throughput and the alias changes
+        """
+        kinds = [kind for kind in kinds if kind in self.KINDS]
+        report = {'kinds': {}, 'switched': {}, 'previous': {}, 'dropped': [], 'failed': 0, 'aborted': False}
+        targets = {}
+        started_at = datetime.utcnow()
+
+        for kind in kinds:
+            alias = self._alias_for(kind)
+            collection_name = self.vector_service.create_versioned_collection(alias, version)
+            logger.info(f"Rebuilding {alias} into {collection_name}")
+            targets[alias] = collection_name
+
+            progress = self._build(kind, collection_name)
+            report['kinds'][kind] = progress
+            report['failed'] += progress['failed']
+
+            schema = self.vector_service.payload_index_schema()[alias]
+            self.vector_service.ensure_payload_indexes({collection_name: schema})
+
+        if report['failed'] and not allow_partial:
+            logger.error(f"{report['failed']} documents failed to embed/upsert - keeping the current "
+                         f"collections and dropping {', '.join(targets.values())}")
+            for collection_name in targets.values():
+                self.vector_service.client.delete_collection(collection_name)
+            report['aborted'] = True
+            return report
+
+        # Every collection is built - switch all aliases at once
+        report['previous'] = self.vector_service.switch_aliases(targets)
+        report['switched'] = targets
+
+        # Writes during the rebuild went to the old collections; replay them into the new ones
+        for kind in kinds:
+            self._catch_up(kind, started_at, report['kinds'][kind])
+
+        if report['failed']:
+            logger.warning(f"Partial rebuild: {report['failed']} documents are missing from the new "
+                           f"collections; keeping the old ones")
+        elif drop_old:
+            for old_collection in report['previous'].values():
+                if old_collection and old_collection not in targets.values():
+                    self.vector_service.client.delete_collection(old_collection)
+                    report['dropped'].append(old_collection)
+
+        return report
+
+    def _catch_up(self, kind: str, since: datetime, progress: Dict):
+        """Re-store documents posted, updated or closed since the rebuild started, through the switched alias"""
+        source = self.db.jobs if kind == 'jobs' else self.db.resumes
+        progress['caught_up'] = 0
+        progress['catch_up_failed'] = 0
+
+        written = {'$or': [{field: {'$gte': since}}
+                           for field in ('created_at', 'posted_at', 'updated_at', 'closed_at')]}
+
+        batch = []
+        for doc in source.find(written):
+            batch.append(doc)
+            if len(batch) >= self.batch_size:
+                self._store_catch_up(kind, batch, progress)
+                batch = []
+        if batch:
+            self._store_catch_up(kind, batch, progress)
+
+        if progress['catch_up_failed']:
+            logger.warning(f"{progress['catch_up_failed']} {kind} written during the rebuild could not be "
+                           f"re-stored; run the reconciler with --repair")
+
+    def _store_catch_up(self, kind: str, docs: List[Dict], progress: Dict):
+        stored_ids = self.store_documents(kind, docs)
+        progress['caught_up'] += len(stored_ids)
+        progress['catch_up_failed'] += len(docs) - len(stored_ids)
+
+    def _alias_for(self, kind: str) -> str:
+        if kind == 'jobs':
+            return self.vector_service.job_collection
+        return self.vector_service.resume_collection
+
+    def _build(self, kind: str, collection_name: str) -> Dict:
+        """Stream one kind from Mongo into a collection, reporting progress per batch"""
+        source = self.db.jobs if kind == 'jobs' else self.db.resumes
+        progress = {
+            'kind': kind,
+            'collection': collection_name,
+            'total': source.count_documents({}),
+            'processed': 0,
+            'failed': 0,
+            'elapsed_seconds': 0.0,
+            'docs_per_second': 0.0
+        }
+        started = time.perf_counter()
+
+        batch = []
+        for doc in source.find({}):
+            batch.append(doc)
+            if len(batch) >= self.batch_size:
+                self._process_batch(kind, collection_name, batch, progress, started)
+                batch = []
+        if batch:
+            self._process_batch(kind, collection_name, batch, progress, started)
+
+        return progress
+
+    def _process_batch(self, kind: str, collection_name: str, docs: List[Dict],
+                       progress: Dict, started: float):
+        stored_ids = self.store_documents(kind, docs, collection_name)
+        progress['processed'] += len(stored_ids)
+        progress['failed'] += len(docs) - len(stored_ids)
+
+        elapsed = time.perf_counter() - started
+        progress['elapsed_seconds'] = elapsed
+        progress['docs_per_second'] = progress['processed'] / elapsed if elapsed else 0.0
+
+        logger.info(f"Reindex {kind}: {progress['processed'] + progress['failed']}/{progress['total']} "
+                    f"({progress['docs_per_second']:.1f} docs/s)")
+        if self.progress_callback:
+            self.progress_callback(dict(progress))
+
+    def store_documents(self, kind: str, docs: List[Dict], collection_name: Optional[str] = None) -> Set[str]:
+        """
+        Embed and store a batch of Mongo job/resume documents, then point their
+        vector_id at the stored points. Returns the IDs of the points stored
+        """
+        if kind == 'jobs':
+            items = self._job_items(docs)
+            results = self.vector_service.store_job_vectors_bulk(items, collection_name=collection_name)
+        else:
+            items = self._resume_items(docs)
+            results = self.vector_service.store_resume_vectors_bulk(items, collection_name=collection_name)
+
+        stored_ids = {result['vector_id'] for result in results if result['success']}
+
+        try:
+            self._sync_vector_ids(kind, docs, stored_ids)
+        except Exception as e:
+            logger.error(f"Error syncing {kind} vector IDs: {e}")
+
+        return stored_ids
+
+    def _sync_vector_ids(self, kind: str, docs: List[Dict], point_ids: Set[str]):
+        """Point Mongo documents still carrying a legacy vector_id at their deterministic ID"""
+        operations = []
+
+        for doc in docs:
+            if kind == 'jobs':
+                vector_id = self.vector_service.job_vector_id(doc['id'])
+                selector = {'id': doc['id']}
+            else:
+                vector_id = self.vector_service.resume_vector_id(doc['user_id'], str(doc['_id']))
+                selector = {'_id': doc['_id']}
+
+            if vector_id in point_ids and doc.get('vector_id') != vector_id:
+                operations.append(UpdateOne(selector, {'$set': {'vector_id': vector_id}}))
+
+        if operations:
+            source = self.db.jobs if kind == 'jobs' else self.db.resumes
+            source.bulk_write(operations, ordered=False)
+
+    def _location_for(self, user_id: str) -> str:
+        if user_id not in self._location_cache:
+            user = User.from_mongo(self.db.users.find_one({'id': user_id}))
+            self._location_cache[user_id] = (user.location or '') if user else ''
+        return self._location_cache[user_id]
+
+    def _company_for(self, employer_id: str) -> str:
+        if employer_id not in self._company_cache:
+            employer = User.from_mongo(self.db.users.find_one({'id': employer_id}))
+            self._company_cache[employer_id] = employer.company_name if employer else ''
+        return self._company_cache[employer_id]
+
+    def _job_items(self, docs: List[Dict]) -> List[Dict]:
+        jobs = [Job.from_mongo(doc) for doc in docs]
+        embeddings = JobMatcher.generate_job_vectors_many([job.to_embedding_data() for job in jobs])
+
+        return [
+            {
+                'job_id': job.id,
+                'embedding': embedding,
+                'metadata': job.to_vector_metadata(company=self._company_for(job.employer_id))
+            }
+            for job, embedding in zip(jobs, embeddings) if embedding
+        ]
+
+    def _resume_items(self, docs: List[Dict]) -> List[Dict]:
+        embeddings = embedding_engine.encode_many(
+            [ResumeParser.build_embedding_text(doc.get('parsed_data', {})) for doc in docs]
+        )
+
+        return [
+            {
+                'user_id': doc['user_id'],
+                'resume_id': str(doc['_id']),
+                'embedding': embedding,
+                'metadata': ResumeParser.build_vector_metadata(
+                    doc['user_id'], doc.get('parsed_data', {}), self._location_for(doc['user_id'])
+                )
+            }
+            for doc, embedding in zip(docs, embeddings) if embedding
+        ]
@@ -3,11 +3,13 @@ import re
 import logging
 from typing import Dict, List, Optional
 import google.generativeai as genai
-from sentence_transformers import SentenceTransformer
-import spacy
 import PyPDF2
 import docx
 from io import BytesIO
+from .model_registry import model_registry
+from .embedding_engine import embedding_engine
+from .skill_taxonomy import skill_taxonomy
+from .skill_extractor import skill_extractor
 
 logger = logging.getLogger(__name__)
 
@@ -27,16 +29,15 @@ class ResumeParser:
             logger.warning("Gemini API key not found. Using fallback parsing.")
             self.gemini_model = None
 
-        # Load embedding model
-        embedding_model_name = os.getenv('EMBEDDING_MODEL', 'sentence-transformers/all-mpnet-base-v2')
-        self.embedding_model = SentenceTransformer(embedding_model_name)
+    @property
+    def embedding_model(self):
+        """Shared embedding model from the process-wide registry"""
+        return model_registry.get_embedding_model()
 
-        # Load spaCy for basic NLP
-        try:
-            self.nlp = spacy.load('en_core_web_sm')
-        except OSError:
-            logger.warning("spaCy model not found. Some features may be limited.")
-            self.nlp = None
+    @property
+    def nlp(self):
+        """Shared spaCy pipeline (None if not installed)"""
+        return model_registry.get_nlp()
 
     def extract_text_from_pdf(self, file_content: bytes) -> str:
         """Extract text from PDF file"""
@@ -137,20 +138,8 @@ class ResumeParser:
         if phone_match:
             parsed_data['personal_info']['phone'] = phone_match.group()
 
-        # Extract skills (basic keyword matching)
-        skill_keywords = [
-            'python', 'java', 'javascript', 'react', 'angular', 'vue', 'node.js',
-            'flask', 'django', 'spring', 'sql', 'mongodb', 'postgresql', 'mysql',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'git', 'ci/cd',
-            'machine learning', 'deep learning', 'data analysis', 'tensorflow',
-            'pytorch', 'scikit-learn', 'pandas', 'numpy', 'excel', 'powerbi',
-            'project management', 'agile', 'scrum', 'leadership', 'communication'
-        ]
-
-        text_lower = resume_text.lower()
-        for skill in skill_keywords:
-            if skill in text_lower:
-                parsed_data['skills'].append(skill.title())
+        # Extract skills: every taxonomy skill mentioned as a whole word, in one pass
+        parsed_data['skills'] = skill_extractor.extract(resume_text)
 
         # Use spaCy for basic entity extraction
         if self.nlp:
@@ -165,12 +154,7 @@ class ResumeParser:
 
     def generate_embedding(self, text: str) -> List[float]:
         """Generate embedding vector for text"""
-        try:
-            embedding = self.embedding_model.encode(text, convert_to_tensor=False)
-            return embedding.tolist()
-        except Exception as e:
-            logger.error(f"Error generating embedding: {e}")
-            return []
+        return embedding_engine.encode(text)
 
     def parse_resume(self, file_content: bytes, filename: str) -> Dict:
         """
@@ -184,18 +168,10 @@ class ResumeParser:
             raise ValueError("Could not extract text from resume")
 
         # Parse with Gemini
-        parsed_data = self.parse_with_gemini(resume_text)
+        parsed_data = self.attach_skill_ids(self.parse_with_gemini(resume_text))
 
         # Generate embedding
-        # Combine relevant fields for embedding
-        embedding_text = f"""
-        {parsed_data.get('summary', '')}
-        Skills: {', '.join(parsed_data.get('skills', []))}
-        Experience: {self._format_experience_for_embedding(parsed_data.get('experience', []))}
-        Education: {self._format_education_for_embedding(parsed_data.get('education', []))}
-        """
-
-        embedding = self.generate_embedding(embedding_text.strip())
+        embedding = self.generate_embedding(self.build_embedding_text(parsed_data))
 
         return {
             'raw_text': resume_text,
@@ -204,7 +180,65 @@ class ResumeParser:
             'embedding_dimension': len(embedding)
         }
 
-    def _format_experience_for_embedding(self, experience: List[Dict]) -> str:
+    @staticmethod
+    def attach_skill_ids(parsed_data: Dict) -> Dict:
+        """Store the taxonomy IDs of parsed_data['skills'] (one per skill) as parsed_data['skill_ids']"""
+        skills = parsed_data.get('skills')
+        parsed_data['skill_ids'] = skill_taxonomy.ids_for(skills) if isinstance(skills, list) else []
+        return parsed_data
+
+    @classmethod
+    def build_embedding_text(cls, parsed_data: Dict) -> str:
+        """Combine the relevant parsed fields into the text that is embedded"""
+        embedding_text = f"""
+        {parsed_data.get('summary', '')}
+        Skills: {', '.join(parsed_data.get('skills', []))}
+        Experience: {cls._format_experience_for_embedding(parsed_data.get('experience', []))}
+        Education: {cls._format_education_for_embedding(parsed_data.get('education', []))}
+        """
+        return embedding_text.strip()
+
+    @staticmethod
+    def build_match_data(parsed_data: Dict) -> Dict:
+        """Resume side of the reranking score (JobMatcher.score_jobs_batch)"""
+        return {
+            'skills': parsed_data.get('skills', []),
+            'skill_ids': parsed_data.get('skill_ids'),
+            'experience_years': len(parsed_data.get('experience', [])),
+            'location': parsed_data.get('personal_info', {}).get('location', '')
+        }
+
+    @staticmethod
+    def build_vector_metadata(user_id: str, parsed_data: Dict, fallback_location: str = '') -> Dict:
+        """Metadata stored alongside the resume vector in Qdrant"""
+        # Calculate experience years from work history
+        experience_years = 0
+        if 'experience' in parsed_data and isinstance(parsed_data['experience'], list):
+            for exp in parsed_data['experience']:
+                if isinstance(exp, dict):
+                    # Simple calculation - can be enhanced
+                    experience_years += 1
+
+        metadata = {
+            'user_id': user_id,
+            'skills': parsed_data.get('skills', []),
+            'experience_years': experience_years,
+            'location': parsed_data.get('personal_info', {}).get('location', fallback_location or ''),
+            'education_level': '',
+            'job_titles': [],
+            'industries': []
+        }
+
+        # Extract education level
+        if 'education' in parsed_data and isinstance(parsed_data['education'], list) and parsed_data['education']:
+            education = parsed_data['education'][0]
+            if isinstance(education, dict):
+                metadata['education_level'] = education.get('degree', '')
+
+        return metadata
+
+    @staticmethod
+    def _format_experience_for_embedding(experience: List[Dict]) -> str:
         """Format experience for embedding generation"""
         formatted = []
         for exp in experience:
@@ -212,7 +246,8 @@ class ResumeParser:
                 formatted.append(f"{exp.get('position', '')} at {exp.get('company', '')}")
         return "; ".join(formatted)
 
-    def _format_education_for_embedding(self, education: List[Dict]) -> str:
+    @staticmethod
+    def _format_education_for_embedding(education: List[Dict]) -> str:
         """Format education for embedding generation"""
         formatted = []
         for edu in education:
@@ -221,9 +256,9 @@ class ResumeParser:
         return "; ".join(formatted)
 
     def extract_skills_from_text(self, text: str) -> List[str]:
-        """Extract skills from any text using Gemini"""
+        """Extract skills from any text using Gemini (taxonomy keyword matching without it)"""
         if not self.gemini_model:
-            return []
+            return skill_extractor.extract(text)
 
         try:
             prompt = f"""
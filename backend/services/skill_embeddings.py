@@ -0,0 +1,171 @@
+import os
+import json
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+import numpy as np
+from .skill_taxonomy import skill_taxonomy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDINGS_PATH = Path(__file__).resolve().parent.parent / 'data' / 'skill_embeddings.npy'
+
+
+class SkillEmbeddingIndex:
+    """
+    Semantic skill matching over a precomputed embedding matrix.
+
+    One L2-normalised float32 row per taxonomy skill, stored as a .npy file and
+    memory-mapped, so every worker shares the same pages. A sidecar .json manifest
+    records which skill ID each row holds. Two skills match when their cosine
+    similarity reaches the threshold. Scoring one side against the whole
+    vocabulary is a single matrix multiply, so the per-pair cost is a set lookup.
+
+    Without the file (scripts/build_skill_embeddings.py writes it), matching falls
+    back to exact skill IDs. Skills outside the taxonomy always match exactly.
+    """
+
+    def __init__(self, path: Optional[str] = None, threshold: Optional[float] = None, taxonomy=None):
+        self.path = Path(path or os.getenv('SKILL_EMBEDDINGS_PATH') or DEFAULT_EMBEDDINGS_PATH)
+        self.threshold = threshold if threshold is not None else float(os.getenv('SKILL_MATCH_THRESHOLD', 0.75))
+        self.taxonomy = taxonomy or skill_taxonomy
+        self._lock = threading.Lock()
+        self._index = None
+        self._loaded = False
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.path.with_suffix('.json')
+
+    @property
+    def enabled(self) -> bool:
+        return self._get_index() is not None
+
+    def neighbours(self, skill_ids: Iterable[int]) -> Dict[int, Set[int]]:
+        """
+        {skill ID: IDs of the skills it matches, itself included}
+        All known IDs are scored against the vocabulary in one multiply
+        """
+        result = {skill_id: {skill_id} for skill_id in skill_ids}
+        index = self._get_index()
+        if index is None:
+            return result
+
+        known = [skill_id for skill_id in result if skill_id in index['rows']]
+        if not known:
+            return result
+
+        matrix = index['matrix']
+        similarities = matrix @ matrix[[index['rows'][skill_id] for skill_id in known]].T
+        matches = similarities >= self.threshold
+        for column, skill_id in enumerate(known):
+            result[skill_id].update(index['ids'][matches[:, column]].tolist())
+        return result
+
+    def expand(self, skill_ids: Iterable[int]) -> Set[int]:
+        """The skill IDs plus every skill any of them matches"""
+        expanded = set()
+        for matches in self.neighbours(skill_ids).values():
+            expanded |= matches
+        return expanded
+
+    def similarity(self, first_id: int, second_id: int) -> Optional[float]:
+        """Cosine similarity of two taxonomy skills, None if either has no embedding"""
+        index = self._get_index()
+        if index is None or first_id not in index['rows'] or second_id not in index['rows']:
+            return None
+        matrix = index['matrix']
+        return float(matrix[index['rows'][first_id]] @ matrix[index['rows'][second_id]])
+
+    def build(self, encode: Callable[[List[str]], List[List[float]]], batch_size: int = 256) -> Dict:
+        """
+        Embed every taxonomy skill name and write the matrix and manifest
+        Both are written to temporary files and renamed into place, so readers never
+        see a partial file; the new matrix is picked up by reload()
+        """
+        skills = self.taxonomy.skills()
+        if not skills:
+            raise ValueError("Skill taxonomy is empty")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        matrix_tmp = self.path.with_name(self.path.name + '.tmp')
+        manifest_tmp = self.manifest_path.with_name(self.manifest_path.name + '.tmp')
+
+        matrix = None
+        for start in range(0, len(skills), batch_size):
+            names = [name for _, name in skills[start:start + batch_size]]
+            vectors = np.asarray(encode(names), dtype=np.float32)
+            if vectors.ndim != 2 or len(vectors) != len(names) or not vectors.shape[1]:
+                raise ValueError(f"Embedding failed for skills {start}-{start + len(names)}")
+
+            if matrix is None:
+                matrix = np.lib.format.open_memmap(matrix_tmp, mode='w+', dtype=np.float32,
+                                                   shape=(len(skills), vectors.shape[1]))
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            matrix[start:start + len(names)] = vectors / np.where(norms > 0, norms, 1)
+
+        matrix.flush()
+        dimension = matrix.shape[1]
+        del matrix
+
+        manifest = {
+            'model': os.getenv('EMBEDDING_MODEL', 'sentence-transformers/all-mpnet-base-v2'),
+            'dimension': dimension,
+            'taxonomy_version': self.taxonomy.version,
+            'ids': [skill_id for skill_id, _ in skills],
+            'built_at': datetime.utcnow().isoformat()
+        }
+        with open(manifest_tmp, 'w') as f:
+            json.dump(manifest, f)
+
+        os.replace(matrix_tmp, self.path)
+        os.replace(manifest_tmp, self.manifest_path)
+        return {'skills': len(skills), 'dimension': dimension, 'path': str(self.path)}
+
+    def reload(self):
+        """Drop the mapped matrix; the next lookup maps the file again"""
+        with self._lock:
+            self._index = None
+            self._loaded = False
+
+    def _get_index(self) -> Optional[Dict]:
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._index = self._load()
+                    self._loaded = True
+        return self._index
+
+    def _load(self) -> Optional[Dict]:
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+            matrix = np.load(self.path, mmap_mode='r')
+        except FileNotFoundError:
+            logger.info(f"No skill embeddings at {self.path}; skills match by exact ID only")
+            return None
+        except Exception as e:
+            logger.error(f"Error loading skill embeddings: {e}")
+            return None
+
+        ids = np.asarray(manifest.get('ids', []), dtype=np.int64)
+        if matrix.ndim != 2 or len(ids) != len(matrix):
+            logger.error(f"Skill embeddings at {self.path} do not match their manifest; "
+                         f"skills match by exact ID only")
+            return None
+
+        if manifest.get('taxonomy_version') != self.taxonomy.version:
+            logger.warning(f"Skill embeddings were built for taxonomy v{manifest.get('taxonomy_version')}, "
+                           f"now v{self.taxonomy.version}; new skills match by exact ID until rebuilt")
+
+        return {
+            'matrix': matrix,
+            'ids': ids,
+            'rows': {int(skill_id): row for row, skill_id in enumerate(ids.tolist())}
+        }
+
+
+# Global instance, mapped on first use
+skill_embeddings = SkillEmbeddingIndex()
@@ -0,0 +1,119 @@
+import logging
+import threading
+from collections import deque
+from typing import Dict, List, Tuple
+from .skill_taxonomy import skill_taxonomy
+
+logger = logging.getLogger(__name__)
+
+
+class SkillExtractor:
+    """
+    Finds taxonomy skills in free text with an Aho-Corasick automaton.
+
+    The automaton is compiled once from the taxonomy's terms (names and aliases,
+    lowercased) and rebuilt only after the taxonomy reloads. Extraction is a single
+    pass over the text whatever the number of terms. A hit only counts on word
+    boundaries ("java" does not fire inside "javascript", "git" not inside
+    "digital"), and overlapping hits keep the leftmost-longest one, so "React
+    Native" is not also reported as "React".
+    """
+
+    def __init__(self, taxonomy=None):
+        self.taxonomy = taxonomy or skill_taxonomy
+        self._lock = threading.Lock()
+        self._terms = None
+        self._automaton = None
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Lowercase and collapse whitespace runs, the same form the terms are stored in"""
+        return ' '.join((text or '').lower().split())
+
+    def extract_ids(self, text: str) -> List[int]:
+        """Taxonomy IDs of the skills mentioned in text, in order of first mention"""
+        text = self.normalize(text)
+        goto, fail, output = self._get_automaton()
+
+        hits = []
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for length, skill_id in output[state]:
+                start = end - length + 1
+                if self._is_boundary(text, start - 1) and self._is_boundary(text, end + 1):
+                    hits.append((start, -length, skill_id))
+
+        skill_ids, covered_until = [], 0
+        for start, negative_length, skill_id in sorted(hits):
+            if start < covered_until:
+                continue
+            covered_until = start - negative_length
+            if skill_id not in skill_ids:
+                skill_ids.append(skill_id)
+        return skill_ids
+
+    def extract(self, text: str) -> List[str]:
+        """Canonical names of the skills mentioned in text, in order of first mention"""
+        return [self.taxonomy.name(skill_id) for skill_id in self.extract_ids(text)]
+
+    @staticmethod
+    def _is_boundary(text: str, index: int) -> bool:
+        return index < 0 or index >= len(text) or not (text[index].isalnum() or text[index] == '_')
+
+    def _get_automaton(self) -> Tuple[List[Dict[str, int]], List[int], List[List[Tuple[int, int]]]]:
+        terms = self.taxonomy.terms()
+        automaton = self._automaton
+        if self._terms is not terms:
+            with self._lock:
+                if self._terms is not terms:
+                    self._automaton = self._build(terms)
+                    self._terms = terms
+                    logger.info(f"Compiled skill extractor: {len(terms)} terms, "
+                                f"{len(self._automaton[0])} states")
+                automaton = self._automaton
+        return automaton
+
+    @staticmethod
+    def _build(terms: List[Tuple[str, int]]):
+        """
+        Trie of the terms plus failure links (breadth-first)
+        output[state] lists (term length, skill ID) for every term ending at that state,
+        including those reached through failure links
+        """
+        goto: List[Dict[str, int]] = [{}]
+        output: List[List[Tuple[int, int]]] = [[]]
+
+        for term, skill_id in terms:
+            state = 0
+            for char in term:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    output.append([])
+                state = next_state
+            output[state].append((len(term), skill_id))
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                output[next_state] = output[next_state] + output[fail[next_state]]
+
+        return goto, fail, output
+
+
+# Global instance, compiled on first use
+skill_extractor = SkillExtractor()
@@ -0,0 +1,143 @@
+import os
+import re
+import json
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAXONOMY_PATH = Path(__file__).resolve().parent.parent / 'data' / 'skills.json'
+
+
+class SkillTaxonomy:
+    """
+    Shared skill dictionary: every alias of a skill maps to one integer ID.
+
+    Keys are case- and punctuation-insensitive ("Node.js", "nodejs" and "NODE JS"
+    are the same key), so matching is integer-set intersection. Skills that are
+    not in the dictionary get a stable hashed ID at or above UNKNOWN_ID_BASE,
+    identical in every process, so free-form skills still match each other
+    exactly. Canonical IDs come from data/skills.json and must never be renumbered:
+    they are stored in Mongo documents and vector payloads. An entry's 'ambiguous'
+    aliases ("go", "cv", "spring") still resolve to its ID but are left out of
+    terms(), the list free-text extraction searches for.
+    """
+
+    UNKNOWN_ID_BASE = 1 << 31
+
+    def __init__(self, path: Optional[str] = None, cache_size: Optional[int] = None):
+        self.path = Path(path or os.getenv('SKILL_TAXONOMY_PATH') or DEFAULT_TAXONOMY_PATH)
+        self.cache_size = cache_size if cache_size is not None else int(os.getenv('SKILL_ID_CACHE_SIZE', 100000))
+        self._lock = threading.Lock()
+        self._index = None
+        self._cache: Dict[str, int] = {}
+
+    @staticmethod
+    def key(skill: str) -> str:
+        """Lowercase and drop everything but letters, digits, '+' and '#' (keeps C, C++ and C# apart)"""
+        return re.sub(r'[^\w+#]|_', '', (skill or '').lower())
+
+    @property
+    def version(self) -> int:
+        return self._get_index()['version']
+
+    def __len__(self) -> int:
+        return len(self._get_index()['names'])
+
+    def skill_id(self, skill: str) -> int:
+        """Canonical ID for a skill or any of its aliases; a stable hashed ID for unknown skills"""
+        cached = self._cache.get(skill)
+        if cached is not None:
+            return cached
+
+        key = self.key(skill)
+        skill_id = self._get_index()['aliases'].get(key)
+        if skill_id is None:
+            digest = hashlib.blake2b(key.encode('utf-8'), digest_size=4).digest()
+            skill_id = self.UNKNOWN_ID_BASE + int.from_bytes(digest, 'big')
+
+        if len(self._cache) >= self.cache_size:
+            self._cache = {}
+        self._cache[skill] = skill_id
+        return skill_id
+
+    def ids_for(self, skills: Iterable[str]) -> List[int]:
+        """One ID per skill, in order (aligned with the input list, duplicates kept)"""
+        return [self.skill_id(skill) for skill in skills or []]
+
+    def name(self, skill_id: int) -> Optional[str]:
+        """Canonical name for a dictionary ID, None for hashed IDs"""
+        return self._get_index()['names'].get(skill_id)
+
+    def canonical_name(self, skill: str) -> Optional[str]:
+        """Canonical spelling of a known skill or alias ("nodejs" -> "Node.js"), None if unknown"""
+        return self.name(self.skill_id(skill))
+
+    def is_known(self, skill_id: int) -> bool:
+        return skill_id < self.UNKNOWN_ID_BASE
+
+    def skills(self) -> List[Tuple[int, str]]:
+        """(ID, canonical name) for every dictionary skill, by ID"""
+        return sorted(self._get_index()['names'].items())
+
+    def terms(self) -> List[Tuple[str, int]]:
+        """
+        (lowercased name or alias, ID) pairs to look for in free text, minus ambiguous ones
+        The same list object is returned until the next reload()
+        """
+        return self._get_index()['terms']
+
+    def reload(self):
+        """Re-read the dictionary file and swap it in; lookups in flight keep the old one"""
+        index = self._load()
+        with self._lock:
+            self._index = index
+            self._cache = {}
+        logger.info(f"Loaded skill taxonomy v{index['version']}: {len(index['names'])} skills "
+                    f"from {self.path}")
+
+    def _get_index(self) -> Dict:
+        index = self._index
+        if index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = self._load()
+                index = self._index
+        return index
+
+    def _load(self) -> Dict:
+        """Build {alias key: id} and {id: name}; conflicting aliases are a data error"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            logger.warning(f"Skill taxonomy {self.path} not found; every skill gets a hashed ID")
+            return {'version': 0, 'aliases': {}, 'names': {}, 'terms': []}
+
+        aliases, names, terms = {}, {}, []
+        for entry in data.get('skills', []):
+            skill_id = int(entry['id'])
+            if not 0 < skill_id < self.UNKNOWN_ID_BASE or skill_id in names:
+                raise ValueError(f"Invalid or duplicate skill id {skill_id} in {self.path}")
+            names[skill_id] = entry['name']
+            ambiguous = {' '.join(alias.lower().split()) for alias in entry.get('ambiguous', [])}
+
+            for alias in [entry['name']] + entry.get('aliases', []):
+                key = self.key(alias)
+                if aliases.get(key, skill_id) != skill_id:
+                    raise ValueError(f"Alias '{alias}' maps to skills {aliases[key]} and {skill_id} "
+                                     f"in {self.path}")
+                aliases[key] = skill_id
+
+                term = ' '.join(alias.lower().split())
+                if term and term not in ambiguous:
+                    terms.append((term, skill_id))
+
+        return {'version': data.get('version', 0), 'aliases': aliases, 'names': names, 'terms': terms}
+
+
+# Global instance shared by the resume parser, job matcher and vector payloads
+skill_taxonomy = SkillTaxonomy()
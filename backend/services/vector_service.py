@@ -1,15 +1,32 @@
 import os
+import json
+import time
 import logging
-from typing import List, Dict, Optional
-from qdrant_client import QdrantClient
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import List, Dict, Optional, Iterator, Iterable, Set, Tuple, Union
+import numpy as np
+from qdrant_client.local.qdrant_local import QdrantLocal
 from qdrant_client.models import (
-    Distance, VectorParams, PointStruct,
-    Filter, FieldCondition, MatchValue, Range
+    Distance, VectorParams, PointStruct, NamedVector, ScoredPoint,
+    Filter, FieldCondition, MatchValue, Range,
+    PayloadSchemaType, CreateAlias, CreateAliasOperation,
+    DeleteAlias, DeleteAliasOperation, IsEmptyCondition, PayloadField,
+    SearchRequest, SearchParams, QuantizationSearchParams, HnswConfigDiff,
+    ScalarQuantization, ScalarQuantizationConfig, ScalarType,
+    BinaryQuantization, BinaryQuantizationConfig, VectorParamsDiff, Disabled
 )
 import uuid
+from .vector_store import ShardedVectorStore, create_vector_store
+from .skill_taxonomy import skill_taxonomy
 
 logger = logging.getLogger(__name__)
 
+# Fixed namespace so point IDs are stable across processes and deployments
+VECTOR_ID_NAMESPACE = uuid.UUID('6f1c3c2e-5b8a-4d7e-9a51-2c6f0b8e4d13')
+
 
 class VectorService:
     """
@@ -17,40 +34,171 @@ class VectorService:
     Handles resume and job embeddings for similarity search
     """
 
-    def __init__(self):
+    # Payload fields used in search filters or lookups. Without an index Qdrant has
+    # to scan payloads during filtered HNSW search.
+    JOB_PAYLOAD_INDEXES = {
+        'job_id': PayloadSchemaType.KEYWORD,
+        'location': PayloadSchemaType.KEYWORD,
+        'employment_type': PayloadSchemaType.KEYWORD,
+        'salary_min': PayloadSchemaType.FLOAT,
+        'status': PayloadSchemaType.KEYWORD,
+        'category': PayloadSchemaType.KEYWORD,
+        'remote_allowed': PayloadSchemaType.BOOL,
+        'application_deadline': PayloadSchemaType.FLOAT,
+        'required_skill_ids': PayloadSchemaType.INTEGER
+    }
+    QUANTIZATION_MODES = ('none', 'scalar', 'binary')
+
+    # Named vectors stored for every job point; 'full' is the default search vector
+    JOB_VECTORS = ('title', 'skills', 'full')
+    DEFAULT_JOB_VECTOR = 'full'
+    # Fused searches rescore this many candidates per requested hit from each vector's results
+    FUSION_OVERFETCH = 4
+
+    # Batched candidate search fetches this many points per requested candidate, since
+    # several of a candidate's resumes can rank together
+    CANDIDATE_BATCH_OVERFETCH = 3
+
+    RESUME_PAYLOAD_INDEXES = {
+        'user_id': PayloadSchemaType.KEYWORD,
+        'location': PayloadSchemaType.KEYWORD,
+        'experience_years': PayloadSchemaType.INTEGER,
+        'skill_ids': PayloadSchemaType.INTEGER
+    }
+
+    def __init__(self, client=None):
         self.host = os.getenv('QDRANT_HOST', 'localhost')
         self.port = int(os.getenv('QDRANT_PORT', 6333))
         self.api_key = os.getenv('QDRANT_API_KEY')
+        self.transport = os.getenv('QDRANT_TRANSPORT', 'rest').lower()
         self.dimension = int(os.getenv('EMBEDDING_DIMENSION', 768))
+        self.retrieve_batch_size = int(os.getenv('QDRANT_RETRIEVE_BATCH_SIZE', 256))
+        self.upsert_batch_size = int(os.getenv('QDRANT_UPSERT_BATCH_SIZE', 256))
+        self.upsert_parallel = int(os.getenv('QDRANT_UPSERT_PARALLEL', 4))
+
+        # Storage and index settings for new collections (push them to existing
+        # collections with apply_collection_config)
+        self.quantization = os.getenv('QDRANT_QUANTIZATION', 'none').lower()
+        if self.quantization not in self.QUANTIZATION_MODES:
+            raise ValueError(f"QDRANT_QUANTIZATION must be one of {self.QUANTIZATION_MODES}")
+        self.quantization_always_ram = os.getenv('QDRANT_QUANTIZATION_ALWAYS_RAM', 'True') == 'True'
+        self.on_disk = os.getenv('QDRANT_ON_DISK', 'False') == 'True'
+        self.hnsw_m = int(os.getenv('QDRANT_HNSW_M', 16))
+        self.hnsw_ef_construct = int(os.getenv('QDRANT_HNSW_EF_CONSTRUCT', 100))
+
+        # Search-time defaults
+        self.search_hnsw_ef = int(os.getenv('QDRANT_SEARCH_HNSW_EF', 0)) or None
+        self.search_oversampling = float(os.getenv('QDRANT_SEARCH_OVERSAMPLING', 0)) or None
+        self.search_rescore = os.getenv('QDRANT_SEARCH_RESCORE', 'True') == 'True'
 
         # Collection names
         self.resume_collection = 'resumes'
         self.job_collection = 'jobs'
 
-        # Initialize client
-        if self.api_key:
-            self.client = QdrantClient(host=self.host, port=self.port, api_key=self.api_key)
+        # Initialize the vector store backend (networked Qdrant or in-process).
+        # The store is shared per process, so constructing a service is cheap
+        self.backend = os.getenv('VECTOR_BACKEND', 'qdrant').lower()
+        self.client = client if client is not None else create_vector_store(self.backend, self.transport)
+
+        if self.backend == 'qdrant':
+            logger.info(f"Qdrant client initialized: {self.host}:{self.port} ({self.transport})")
         else:
-            self.client = QdrantClient(host=self.host, port=self.port)
+            logger.info(f"Vector store initialized: {self.backend}")
 
-        logger.info(f"Qdrant client initialized: {self.host}:{self.port}")
+    @staticmethod
+    def job_vector_id(job_id: str) -> str:
+        """Deterministic point ID for a job, so re-storing a job replaces its point"""
+        return str(uuid.uuid5(VECTOR_ID_NAMESPACE, f"job:{job_id}"))
+
+    @staticmethod
+    def resume_vector_id(user_id: str, resume_id: str) -> str:
+        """Deterministic point ID for a user's resume"""
+        return str(uuid.uuid5(VECTOR_ID_NAMESPACE, f"resume:{user_id}:{resume_id}"))
+
+    def vectors_config(self, alias: Optional[str] = None) -> Union[VectorParams, Dict[str, VectorParams]]:
+        """Vector parameters for newly created collections; jobs get one named vector per JOB_VECTORS"""
+        params = VectorParams(size=self.dimension, distance=Distance.COSINE, on_disk=self.on_disk)
+        if alias == self.job_collection:
+            return {name: params for name in self.JOB_VECTORS}
+        return params
+
+    def hnsw_config(self) -> HnswConfigDiff:
+        """HNSW graph settings for newly created collections"""
+        return HnswConfigDiff(m=self.hnsw_m, ef_construct=self.hnsw_ef_construct)
+
+    def quantization_config(self):
+        """
+        Quantization for newly created collections, None when disabled
+        scalar: int8 per dimension (4x smaller); binary: 1 bit per dimension (32x smaller)
+        """
+        if self.quantization == 'scalar':
+            return ScalarQuantization(scalar=ScalarQuantizationConfig(
+                type=ScalarType.INT8,
+                quantile=0.99,
+                always_ram=self.quantization_always_ram
+            ))
+        if self.quantization == 'binary':
+            return BinaryQuantization(binary=BinaryQuantizationConfig(
+                always_ram=self.quantization_always_ram
+            ))
+        return None
+
+    def search_params(self, oversampling: Optional[float] = None,
+                      rescore: Optional[bool] = None) -> Optional[SearchParams]:
+        """
+        Search parameters for quantized collections
+        oversampling fetches limit*oversampling candidates from the quantized index;
+        rescore re-ranks them with the original vectors
+        """
+        oversampling = oversampling or self.search_oversampling
+        rescore = self.search_rescore if rescore is None else rescore
+
+        quantization = None
+        if self.quantization != 'none' or oversampling:
+            quantization = QuantizationSearchParams(ignore=False, rescore=rescore, oversampling=oversampling)
+
+        if quantization is None and self.search_hnsw_ef is None:
+            return None
+        return SearchParams(hnsw_ef=self.search_hnsw_ef, quantization=quantization)
+
+    def apply_collection_config(self, collection_names: Optional[List[str]] = None) -> Dict[str, bool]:
+        """
+        Push the current on-disk, HNSW and quantization settings to existing collections
+        Qdrant rebuilds the affected structures in the background; returns success per collection
+        """
+        results = {}
+        for collection_name in collection_names or [self.resume_collection, self.job_collection]:
+            try:
+                vector_names = self.JOB_VECTORS if collection_name == self.job_collection else ('',)
+                self.client.update_collection(
+                    collection_name=self.resolve_collection(collection_name) or collection_name,
+                    vectors_config={name: VectorParamsDiff(on_disk=self.on_disk) for name in vector_names},
+                    hnsw_config=self.hnsw_config(),
+                    quantization_config=self.quantization_config() or Disabled.DISABLED
+                )
+                results[collection_name] = True
+            except Exception as e:
+                logger.error(f"Error applying collection config to {collection_name}: {e}")
+                results[collection_name] = False
+        return results
 
     def initialize_collections(self):
-        """Initialize Qdrant collections for resumes and jobs"""
+        """
+        Create the resumes and jobs collections if they don't exist yet
+        Each name is an alias over a versioned collection; existing data is never
+        dropped - rebuild with ReindexService instead
+        """
         try:
-            # Create resume collection
-            self.client.recreate_collection(
-                collection_name=self.resume_collection,
-                vectors_config=VectorParams(size=self.dimension, distance=Distance.COSINE)
-            )
-            logger.info(f"Created collection: {self.resume_collection}")
+            for alias in (self.resume_collection, self.job_collection):
+                if self.resolve_collection(alias):
+                    logger.info(f"Collection already exists: {alias}")
+                    continue
 
-            # Create job collection
-            self.client.recreate_collection(
-                collection_name=self.job_collection,
-                vectors_config=VectorParams(size=self.dimension, distance=Distance.COSINE)
-            )
-            logger.info(f"Created collection: {self.job_collection}")
+                collection_name = self.create_versioned_collection(alias)
+                self.switch_aliases({alias: collection_name})
+                logger.info(f"Created collection: {collection_name} (alias: {alias})")
+
+            self.ensure_payload_indexes()
 
             return True
 
@@ -58,6 +206,106 @@ class VectorService:
             logger.error(f"Error initializing collections: {e}")
             return False
 
+    def get_aliases(self) -> Dict[str, str]:
+        """Map of alias name to the collection it points at"""
+        return {alias.alias_name: alias.collection_name
+                for alias in self.client.get_aliases().aliases}
+
+    def resolve_collection(self, name: str) -> Optional[str]:
+        """Physical collection behind an alias (or the name itself), None if neither exists"""
+        aliases = self.get_aliases()
+        if name in aliases:
+            return aliases[name]
+        return name if self.collection_exists(name) else None
+
+    def create_versioned_collection(self, alias: str, version: Optional[str] = None) -> str:
+        """Create a new physical collection for an alias, e.g. jobs_v20240101120000"""
+        version = version or datetime.utcnow().strftime('%Y%m%d%H%M%S')
+        collection_name = f"{alias}_v{version}"
+
+        self.client.create_collection(
+            collection_name=collection_name,
+            vectors_config=self.vectors_config(alias),
+            hnsw_config=self.hnsw_config(),
+            quantization_config=self.quantization_config()
+        )
+        return collection_name
+
+    def switch_aliases(self, targets: Dict[str, str]) -> Dict[str, Optional[str]]:
+        """
+        Point each alias at its new collection in one atomic alias update
+        Returns the collection each alias pointed at before the switch
+        """
+        aliases = self.get_aliases()
+        operations = []
+        previous = {}
+
+        for alias, collection_name in targets.items():
+            previous[alias] = aliases.get(alias)
+
+            if alias in aliases:
+                operations.append(DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=alias)))
+            elif self.collection_exists(alias):
+                # Pre-alias deployments have a real collection under this name, which
+                # must be dropped before the name can become an alias
+                logger.warning(f"Dropping legacy collection {alias} to replace it with an alias")
+                self.client.delete_collection(alias)
+
+            operations.append(CreateAliasOperation(
+                create_alias=CreateAlias(collection_name=collection_name, alias_name=alias)
+            ))
+
+        self.client.update_collection_aliases(change_aliases_operations=operations)
+        logger.info(f"Switched aliases: {targets}")
+
+        return previous
+
+    def payload_index_schema(self) -> Dict[str, Dict]:
+        """Declared payload indexes, keyed by collection name"""
+        return {
+            self.job_collection: self.JOB_PAYLOAD_INDEXES,
+            self.resume_collection: self.RESUME_PAYLOAD_INDEXES
+        }
+
+    def ensure_payload_indexes(self, targets: Optional[Dict[str, Dict]] = None) -> Dict[str, List[str]]:
+        """
+        Create any declared payload index that is missing (or has the wrong type)
+        Safe to call on every startup; returns the fields created per collection
+        """
+        created = {}
+        targets = targets or self.payload_index_schema()
+
+        for collection_name, fields in targets.items():
+            created[collection_name] = []
+            try:
+                existing = self.client.get_collection(collection_name).payload_schema or {}
+
+                for field_name, field_schema in fields.items():
+                    current = existing.get(field_name)
+                    if current is not None and current.data_type == field_schema:
+                        continue
+
+                    if current is not None:
+                        logger.warning(f"Payload index {collection_name}.{field_name} is "
+                                       f"{current.data_type}, expected {field_schema}; rebuilding")
+                        self.client.delete_payload_index(collection_name, field_name)
+
+                    self.client.create_payload_index(
+                        collection_name=collection_name,
+                        field_name=field_name,
+                        field_schema=field_schema,
+                        wait=True
+                    )
+                    created[collection_name].append(field_name)
+
+                if created[collection_name]:
+                    logger.info(f"Created payload indexes on {collection_name}: {created[collection_name]}")
+
+            except Exception as e:
+                logger.error(f"Error ensuring payload indexes on {collection_name}: {e}")
+
+        return created
+
     def collection_exists(self, collection_name: str) -> bool:
         """Check if collection exists"""
         try:
@@ -67,30 +315,73 @@ class VectorService:
             logger.error(f"Error checking collection: {e}")
             return False
 
+    @staticmethod
+    def build_resume_payload(user_id: str, resume_id: Optional[str], metadata: Dict) -> Dict:
+        """Payload stored with a resume vector"""
+        return {
+            'user_id': user_id,
+            'resume_id': resume_id,
+            'skills': metadata.get('skills', []),
+            'skill_ids': skill_taxonomy.ids_for(metadata.get('skills', [])),
+            'experience_years': metadata.get('experience_years', 0),
+            'location': metadata.get('location', ''),
+            'education_level': metadata.get('education_level', ''),
+            'job_titles': metadata.get('job_titles', []),
+            'industries': metadata.get('industries', []),
+            'indexed_at': time.time()
+        }
+
+    @staticmethod
+    def build_job_payload(job_id: str, metadata: Dict) -> Dict:
+        """Payload stored with a job vector"""
+        return {
+            'job_id': job_id,
+            'required_skills': metadata.get('required_skills', []),
+            'preferred_skills': metadata.get('preferred_skills', []),
+            'required_skill_ids': skill_taxonomy.ids_for(metadata.get('required_skills', [])),
+            'preferred_skill_ids': skill_taxonomy.ids_for(metadata.get('preferred_skills', [])),
+            'experience_years': metadata.get('experience_years', 0),
+            'location': metadata.get('location', ''),
+            'employment_type': metadata.get('employment_type', ''),
+            'salary_min': metadata.get('salary_min', 0),
+            'salary_max': metadata.get('salary_max', 0),
+            'category': metadata.get('category', ''),
+            'company': metadata.get('company', ''),
+            'status': metadata.get('status', 'active'),
+            'remote_allowed': metadata.get('remote_allowed', False),
+            'application_deadline': metadata.get('application_deadline'),
+            'indexed_at': time.time()
+        }
+
+    def build_resume_point(self, user_id: str, resume_id: str, embedding: List[float],
+                           metadata: Dict) -> PointStruct:
+        """Point for a resume at its deterministic ID"""
+        return PointStruct(
+            id=self.resume_vector_id(user_id, resume_id),
+            vector=embedding,
+            payload=self.build_resume_payload(user_id, resume_id, metadata)
+        )
+
+    def build_job_point(self, job_id: str, vectors: Dict[str, List[float]], metadata: Dict) -> PointStruct:
+        """Point for a job at its deterministic ID, carrying every named vector in JOB_VECTORS"""
+        missing = [name for name in self.JOB_VECTORS if name not in (vectors or {})]
+        if missing:
+            raise ValueError(f"missing job vectors: {missing}")
+        return PointStruct(
+            id=self.job_vector_id(job_id),
+            vector={name: vectors[name] for name in self.JOB_VECTORS},
+            payload=self.build_job_payload(job_id, metadata)
+        )
+
     def store_resume_vector(self, user_id: str, embedding: List[float],
-                           metadata: Dict) -> Optional[str]:
+                           metadata: Dict, resume_id: str) -> Optional[str]:
         """
-        Store resume embedding in Qdrant
+        Store resume embedding in Qdrant (idempotent per user/resume)
         Returns vector ID
         """
         try:
-            vector_id = str(uuid.uuid4())
-
-            payload = {
-                'user_id': user_id,
-                'skills': metadata.get('skills', []),
-                'experience_years': metadata.get('experience_years', 0),
-                'location': metadata.get('location', ''),
-                'education_level': metadata.get('education_level', ''),
-                'job_titles': metadata.get('job_titles', []),
-                'industries': metadata.get('industries', [])
-            }
-
-            point = PointStruct(
-                id=vector_id,
-                vector=embedding,
-                payload=payload
-            )
+            point = self.build_resume_point(user_id, resume_id, embedding, metadata)
+            vector_id = point.id
 
             self.client.upsert(
                 collection_name=self.resume_collection,
@@ -104,38 +395,19 @@ class VectorService:
             logger.error(f"Error storing resume vector: {e}")
             return None
 
-    def store_job_vector(self, job_id: str, embedding: List[float],
-                        metadata: Dict) -> Optional[str]:
+    def store_job_vector(self, job_id: str, vectors: Dict[str, List[float]],
+                        metadata: Dict, replace: bool = False) -> Optional[str]:
         """
-        Store job embedding in Qdrant
+        Store a job's named vectors in Qdrant (idempotent per job)
+        vectors: {'title', 'skills', 'full'} as from JobMatcher.generate_job_vectors
+        replace: the job may already be stored, possibly in another shard
         Returns vector ID
         """
         try:
-            vector_id = str(uuid.uuid4())
-
-            payload = {
-                'job_id': job_id,
-                'required_skills': metadata.get('required_skills', []),
-                'preferred_skills': metadata.get('preferred_skills', []),
-                'experience_years': metadata.get('experience_years', 0),
-                'location': metadata.get('location', ''),
-                'employment_type': metadata.get('employment_type', ''),
-                'salary_min': metadata.get('salary_min', 0),
-                'salary_max': metadata.get('salary_max', 0),
-                'category': metadata.get('category', ''),
-                'company': metadata.get('company', '')
-            }
-
-            point = PointStruct(
-                id=vector_id,
-                vector=embedding,
-                payload=payload
-            )
+            point = self.build_job_point(job_id, vectors, metadata)
+            vector_id = point.id
 
-            self.client.upsert(
-                collection_name=self.job_collection,
-                points=[point]
-            )
+            self._upsert(self.job_collection, [point], shard_may_change=replace)
 
             logger.info(f"Stored job vector: {vector_id} for job: {job_id}")
             return vector_id
@@ -144,133 +416,570 @@ class VectorService:
             logger.error(f"Error storing job vector: {e}")
             return None
 
+    def store_resume_vectors_bulk(self, items: Iterable[Dict], batch_size: Optional[int] = None,
+                                  parallel: Optional[int] = None,
+                                  collection_name: Optional[str] = None) -> List[Dict]:
+        """
+        Store many resume vectors, chunked and uploaded in parallel
+        Each item: {'user_id', 'resume_id', 'embedding', 'metadata'}
+        Returns one result per item, in input order:
+        {'user_id', 'resume_id', 'vector_id', 'success', 'error'}
+        """
+        def to_point(item):
+            return self.build_resume_point(item['user_id'], item['resume_id'],
+                                           item['embedding'], item.get('metadata', {}))
+
+        def to_result(item):
+            return {'user_id': item.get('user_id'), 'resume_id': item.get('resume_id')}
+
+        return self._store_bulk(collection_name or self.resume_collection, items, to_point,
+                                to_result, batch_size, parallel)
+
+    def _upsert(self, collection_name: str, points: List[PointStruct], shard_may_change: bool = False):
+        """Upsert; a sharded store is told when the points may have to leave their old shard"""
+        kwargs = {'shard_may_change': True} if shard_may_change and isinstance(self.client, ShardedVectorStore) else {}
+        self.client.upsert(collection_name=collection_name, points=points, **kwargs)
+
+    def store_job_vectors_bulk(self, items: Iterable[Dict], batch_size: Optional[int] = None,
+                               parallel: Optional[int] = None,
+                               collection_name: Optional[str] = None) -> List[Dict]:
+        """
+        Store many job vectors, chunked and uploaded in parallel
+        Each item: {'job_id', 'embedding', 'metadata'}; 'embedding' holds the named vectors
+        Returns one result per item, in input order:
+        {'job_id', 'vector_id', 'success', 'error'}
+        """
+        def to_point(item):
+            return self.build_job_point(item['job_id'], item['embedding'], item.get('metadata', {}))
+
+        def to_result(item):
+            return {'job_id': item.get('job_id')}
+
+        return self._store_bulk(collection_name or self.job_collection, items, to_point,
+                                to_result, batch_size, parallel)
+
+    def _store_bulk(self, collection_name: str, items: Iterable[Dict], to_point, to_result,
+                    batch_size: Optional[int], parallel: Optional[int]) -> List[Dict]:
+        batch_size = batch_size or self.upsert_batch_size
+        parallel = max(1, parallel or self.upsert_parallel)
+        if isinstance(getattr(self.client, '_client', None), QdrantLocal):
+            # The embedded local client is not thread-safe
+            parallel = 1
+        results = []
+
+        def upload(chunk):
+            """Upsert one chunk; (result, point) pairs are updated in place"""
+            try:
+                self.client.upsert(
+                    collection_name=collection_name,
+                    points=[point for _, point in chunk],
+                    wait=True
+                )
+                for result, point in chunk:
+                    result.update({'vector_id': str(point.id), 'success': True, 'error': None})
+            except Exception as e:
+                logger.error(f"Error bulk upserting {len(chunk)} points into {collection_name}: {e}")
+                for result, _ in chunk:
+                    result.update({'success': False, 'error': str(e)})
+
+        def chunks():
+            iterator = iter(items)
+            while True:
+                batch = list(islice(iterator, batch_size))
+                if not batch:
+                    return
+                chunk = []
+                for item in batch:
+                    result = to_result(item)
+                    result.update({'vector_id': None, 'success': False, 'error': None})
+                    results.append(result)
+                    try:
+                        self.check_embedding(item.get('embedding'))
+                        chunk.append((result, to_point(item)))
+                    except Exception as e:
+                        result['error'] = str(e)
+                if chunk:
+                    yield chunk
+
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+            # Bounded in-flight window so huge iterables aren't materialised as points up front
+            pending = []
+            for chunk in chunks():
+                pending.append(executor.submit(upload, chunk))
+                if len(pending) >= parallel * 2:
+                    pending.pop(0).result()
+            for future in pending:
+                future.result()
+
+        stored = sum(1 for result in results if result['success'])
+        logger.info(f"Bulk stored {stored}/{len(results)} vectors in {collection_name}")
+
+        return results
+
+    def check_embedding(self, embedding):
+        """Raise ValueError unless embedding is a vector (or dict of named vectors) of self.dimension"""
+        vectors = embedding.values() if isinstance(embedding, dict) else [embedding]
+        if not vectors or any(vector is None or len(vector) != self.dimension for vector in vectors):
+            raise ValueError(f"expected a {self.dimension}-dim embedding")
+
+    def build_job_filter(self, filters: Optional[Dict] = None) -> Filter:
+        """
+        Qdrant filter for job search
+        Only open jobs (status, default 'active') whose deadline is unset or not yet passed
+        """
+        filters = filters or {}
+        conditions = [
+            FieldCondition(key='status', match=MatchValue(value=filters.get('status', 'active')))
+        ]
+
+        if 'location' in filters:
+            conditions.append(
+                FieldCondition(key='location', match=MatchValue(value=filters['location']))
+            )
+
+        if 'employment_type' in filters:
+            conditions.append(
+                FieldCondition(key='employment_type', match=MatchValue(value=filters['employment_type']))
+            )
+
+        if 'category' in filters:
+            conditions.append(
+                FieldCondition(key='category', match=MatchValue(value=filters['category']))
+            )
+
+        if filters.get('remote'):
+            conditions.append(
+                FieldCondition(key='remote_allowed', match=MatchValue(value=True))
+            )
+
+        if 'min_salary' in filters:
+            conditions.append(
+                FieldCondition(key='salary_min', range=Range(gte=filters['min_salary']))
+            )
+
+        # No deadline, or a deadline that hasn't passed yet
+        deadline_conditions = [
+            IsEmptyCondition(is_empty=PayloadField(key='application_deadline')),
+            FieldCondition(key='application_deadline', range=Range(gte=time.time()))
+        ]
+
+        return Filter(must=conditions, should=deadline_conditions)
+
     def search_similar_jobs(self, resume_vector: List[float],
                            filters: Optional[Dict] = None,
-                           limit: int = 10) -> List[Dict]:
+                           limit: int = 10, oversampling: Optional[float] = None,
+                           rescore: Optional[bool] = None, offset: int = 0,
+                           score_threshold: Optional[float] = None,
+                           vector: Union[str, Dict[str, float]] = DEFAULT_JOB_VECTOR) -> List[Dict]:
         """
-        Search for jobs similar to a resume
+        Search for open jobs similar to a resume
+        vector picks the job vector to compare against ('title', 'skills' or 'full'), or
+        fuses several as {name: weight}; oversampling/rescore override the configured
+        quantized-search defaults; offset skips the best `offset` hits and
+        score_threshold drops weaker ones (for paging)
         """
         try:
-            # Build filter if provided
-            search_filter = None
-            if filters:
-                conditions = []
-
-                if 'location' in filters:
-                    conditions.append(
-                        FieldCondition(key='location', match=MatchValue(value=filters['location']))
-                    )
+            search_filter = self.build_job_filter(filters)
+            params = self.search_params(oversampling, rescore)
 
-                if 'employment_type' in filters:
-                    conditions.append(
-                        FieldCondition(key='employment_type', match=MatchValue(value=filters['employment_type']))
-                    )
+            if isinstance(vector, dict):
+                # One search per named vector, then fuse the candidates' weighted scores
+                batch_results = self.client.search_batch(
+                    collection_name=self.job_collection,
+                    requests=self._fusion_requests(resume_vector, vector, search_filter, params,
+                                                   (offset + limit) * self.FUSION_OVERFETCH)
+                )
+                results = self.fuse_job_hits(resume_vector, vector, batch_results,
+                                             limit, offset, score_threshold)
+            else:
+                # Perform search
+                results = self.client.search(
+                    collection_name=self.job_collection,
+                    query_vector=NamedVector(name=vector, vector=resume_vector),
+                    query_filter=search_filter,
+                    search_params=params,
+                    limit=limit,
+                    offset=offset,
+                    score_threshold=score_threshold,
+                    with_payload=True
+                )
 
-                if 'min_salary' in filters:
-                    conditions.append(
-                        FieldCondition(key='salary_min', range=Range(gte=filters['min_salary']))
-                    )
+            return [self._format_job_hit(result) for result in results]
 
-                if conditions:
-                    search_filter = Filter(must=conditions)
+        except Exception as e:
+            logger.error(f"Error searching similar jobs: {e}")
+            return []
 
-            # Perform search
-            results = self.client.search(
-                collection_name=self.job_collection,
-                query_vector=resume_vector,
-                query_filter=search_filter,
+    def _fusion_requests(self, query: List[float], weights: Dict[str, float], search_filter: Filter,
+                         params: Optional[SearchParams], limit: int) -> List[SearchRequest]:
+        unknown = set(weights) - set(self.JOB_VECTORS)
+        if unknown or not weights:
+            raise ValueError(f"unknown job vectors: {sorted(unknown)}")
+        return [
+            SearchRequest(
+                vector=NamedVector(name=name, vector=query),
+                filter=search_filter,
+                params=params,
                 limit=limit,
-                with_payload=True
+                with_payload=True,
+                with_vector=list(weights)
             )
+            for name in weights
+        ]
 
-            # Format results
-            formatted_results = []
+    @staticmethod
+    def fuse_job_hits(query: List[float], weights: Dict[str, float], batch_results: List[List],
+                      limit: int, offset: int = 0, score_threshold: Optional[float] = None) -> List[ScoredPoint]:
+        """
+        Merge per-vector hit lists: every candidate is rescored as the weighted mean of
+        its cosine similarity to the query on each named vector (vectors come back with
+        the hits, so no extra request is needed)
+        """
+        candidates = {}
+        for results in batch_results:
             for result in results:
-                formatted_results.append({
-                    'job_id': result.payload.get('job_id'),
-                    'score': result.score,
-                    'payload': result.payload
-                })
+                candidates.setdefault(result.id, result)
+        if not candidates:
+            return []
 
-            return formatted_results
+        names = list(weights)
+        query = np.asarray(query, dtype=np.float32)
+        query = query / (np.linalg.norm(query) or 1.0)
+        weight = np.array([weights[name] for name in names], dtype=np.float32)
 
-        except Exception as e:
-            logger.error(f"Error searching similar jobs: {e}")
+        hits = list(candidates.values())
+        stacked = np.array([[hit.vector[name] for name in names] for hit in hits], dtype=np.float32)
+        stacked /= np.maximum(np.linalg.norm(stacked, axis=2, keepdims=True), 1e-12)
+        scores = (stacked @ query) @ weight / weight.sum()
+
+        fused = [hit.model_copy(update={'score': float(score), 'vector': None})
+                 for hit, score in zip(hits, scores)
+                 if score_threshold is None or score >= score_threshold]
+        fused.sort(key=lambda hit: hit.score, reverse=True)
+        return fused[offset:offset + limit]
+
+    def search_similar_jobs_batch(self, queries: List[Tuple[List[float], Optional[Dict]]],
+                                  limit: int = 10, oversampling: Optional[float] = None,
+                                  rescore: Optional[bool] = None,
+                                  vector: str = DEFAULT_JOB_VECTOR) -> List[List[Dict]]:
+        """
+        Run several job searches in one request, against one named job vector
+        queries: [(resume_vector, filters), ...]; returns one result list per query, in order
+        """
+        if not queries:
             return []
 
+        try:
+            params = self.search_params(oversampling, rescore)
+            requests = [
+                SearchRequest(
+                    vector=NamedVector(name=vector, vector=resume_vector),
+                    filter=self.build_job_filter(filters),
+                    params=params,
+                    limit=limit,
+                    with_payload=True
+                )
+                for resume_vector, filters in queries
+            ]
+
+            batch_results = self.client.search_batch(
+                collection_name=self.job_collection,
+                requests=requests
+            )
+
+            return [[self._format_job_hit(result) for result in results] for results in batch_results]
+
+        except Exception as e:
+            logger.error(f"Error batch searching similar jobs: {e}")
+            return [[] for _ in queries]
+
+    @staticmethod
+    def _format_job_hit(result) -> Dict:
+        return {
+            'job_id': result.payload.get('job_id'),
+            'score': result.score,
+            'payload': result.payload
+        }
+
+    def build_candidate_filter(self, filters: Optional[Dict] = None) -> Optional[Filter]:
+        """Qdrant filter for candidate search, or None when nothing is filtered"""
+        if not filters:
+            return None
+
+        conditions = []
+
+        if 'location' in filters:
+            conditions.append(
+                FieldCondition(key='location', match=MatchValue(value=filters['location']))
+            )
+
+        if 'min_experience' in filters:
+            conditions.append(
+                FieldCondition(key='experience_years', range=Range(gte=filters['min_experience']))
+            )
+
+        return Filter(must=conditions) if conditions else None
+
+    def measure_recall(self, collection_name: str, sample_size: int = 50, limit: int = 10,
+                       oversampling: Optional[float] = None, rescore: Optional[bool] = None) -> Dict:
+        """
+        Recall@limit of the configured (quantized/HNSW) search against exact search,
+        using stored vectors as queries. Also reports mean latency of both
+        """
+        queries = []
+        for point in self.iter_points(collection_name, with_vectors=True, with_payload=False):
+            vector = point.vector
+            if isinstance(vector, dict):
+                name = self.DEFAULT_JOB_VECTOR if self.DEFAULT_JOB_VECTOR in vector else next(iter(vector))
+                vector = NamedVector(name=name, vector=vector[name])
+            queries.append(vector)
+            if len(queries) >= sample_size:
+                break
+
+        exact_params = SearchParams(exact=True, quantization=QuantizationSearchParams(ignore=True))
+        approximate_params = self.search_params(oversampling, rescore)
+        recalls, approximate_seconds, exact_seconds = [], 0.0, 0.0
+
+        for query in queries:
+            started = time.perf_counter()
+            approximate = self.client.search(collection_name=collection_name, query_vector=query,
+                                             search_params=approximate_params, limit=limit)
+            approximate_seconds += time.perf_counter() - started
+
+            started = time.perf_counter()
+            exact = self.client.search(collection_name=collection_name, query_vector=query,
+                                       search_params=exact_params, limit=limit)
+            exact_seconds += time.perf_counter() - started
+
+            expected = {hit.id for hit in exact}
+            if expected:
+                recalls.append(len(expected & {hit.id for hit in approximate}) / len(expected))
+
+        count = max(len(queries), 1)
+        return {
+            'collection': collection_name,
+            'samples': len(recalls),
+            'limit': limit,
+            'recall': sum(recalls) / len(recalls) if recalls else None,
+            'approximate_ms': approximate_seconds / count * 1000,
+            'exact_ms': exact_seconds / count * 1000
+        }
+
     def search_similar_candidates(self, job_vector: List[float],
                                  filters: Optional[Dict] = None,
-                                 limit: int = 20) -> List[Dict]:
+                                 limit: int = 20, oversampling: Optional[float] = None,
+                                 rescore: Optional[bool] = None, offset: int = 0,
+                                 score_threshold: Optional[float] = None) -> List[Dict]:
         """
         Search for candidates similar to a job
+        Grouped by user_id, so each hit is a distinct candidate's best-matching resume
+        oversampling/rescore override the configured quantized-search defaults;
+        offset skips the best `offset` candidates and score_threshold drops weaker ones (for paging)
         """
         try:
-            # Build filter if provided
-            search_filter = None
-            if filters:
-                conditions = []
-
-                if 'location' in filters:
-                    conditions.append(
-                        FieldCondition(key='location', match=MatchValue(value=filters['location']))
-                    )
+            search_filter = self.build_candidate_filter(filters)
 
-                if 'min_experience' in filters:
-                    conditions.append(
-                        FieldCondition(key='experience_years', range=Range(gte=filters['min_experience']))
-                    )
-
-                if conditions:
-                    search_filter = Filter(must=conditions)
-
-            # Perform search
-            results = self.client.search(
+            # Perform search (grouped search has no offset, so fetch the skipped groups too)
+            results = self.client.search_groups(
                 collection_name=self.resume_collection,
                 query_vector=job_vector,
+                group_by='user_id',
+                group_size=1,
                 query_filter=search_filter,
-                limit=limit,
+                search_params=self.search_params(oversampling, rescore),
+                limit=offset + limit,
+                score_threshold=score_threshold,
                 with_payload=True
             )
 
-            # Format results
-            formatted_results = []
-            for result in results:
-                formatted_results.append({
-                    'user_id': result.payload.get('user_id'),
-                    'score': result.score,
-                    'payload': result.payload
-                })
-
-            return formatted_results
+            return [self._format_candidate_hit(group.hits[0])
+                    for group in results.groups[offset:] if group.hits]
 
         except Exception as e:
             logger.error(f"Error searching similar candidates: {e}")
             return []
 
+    def search_similar_candidates_batch(self, queries: List[Tuple[List[float], Optional[Dict]]],
+                                        limit: int = 20, oversampling: Optional[float] = None,
+                                        rescore: Optional[bool] = None) -> List[List[Dict]]:
+        """
+        Run several candidate searches in one request
+        queries: [(job_vector, filters), ...]; returns one result list per query, in order
+        There is no batched grouping API, so each search over-fetches and keeps the best
+        hit per user_id - results are distinct candidates, possibly fewer than `limit`
+        """
+        if not queries:
+            return []
+
+        try:
+            params = self.search_params(oversampling, rescore)
+            requests = [
+                SearchRequest(
+                    vector=job_vector,
+                    filter=self.build_candidate_filter(filters),
+                    params=params,
+                    limit=limit * self.CANDIDATE_BATCH_OVERFETCH,
+                    with_payload=True
+                )
+                for job_vector, filters in queries
+            ]
+
+            batch_results = self.client.search_batch(
+                collection_name=self.resume_collection,
+                requests=requests
+            )
+
+            return [self._best_hit_per_candidate(results, limit) for results in batch_results]
+
+        except Exception as e:
+            logger.error(f"Error batch searching similar candidates: {e}")
+            return [[] for _ in queries]
+
+    @classmethod
+    def _best_hit_per_candidate(cls, results, limit: int) -> List[Dict]:
+        """First (best) hit for each user_id, up to `limit` candidates"""
+        hits, seen = [], set()
+        for result in results:
+            hit = cls._format_candidate_hit(result)
+            if hit['user_id'] in seen:
+                continue
+            seen.add(hit['user_id'])
+            hits.append(hit)
+            if len(hits) >= limit:
+                break
+        return hits
+
+    @staticmethod
+    def _format_candidate_hit(result) -> Dict:
+        return {
+            'user_id': result.payload.get('user_id'),
+            'score': result.score,
+            'payload': result.payload
+        }
+
+    def _retrieve_vectors(self, collection_name: str, vector_ids: List[str],
+                          batch_size: Optional[int] = None,
+                          vector_name: Optional[str] = None) -> Dict[str, List[float]]:
+        """
+        Fetch stored vectors by point ID, in batches
+        vector_name selects one named vector from collections that have several
+        Returns {vector_id: vector}; IDs with no point are simply absent
+        """
+        batch_size = batch_size or self.retrieve_batch_size
+        ids = list(dict.fromkeys(vid for vid in vector_ids if vid))
+        vectors = {}
+
+        try:
+            for start in range(0, len(ids), batch_size):
+                points = self.client.retrieve(
+                    collection_name=collection_name,
+                    ids=ids[start:start + batch_size],
+                    with_payload=False,
+                    with_vectors=[vector_name] if vector_name else True
+                )
+                for point in points:
+                    vectors[str(point.id)] = point.vector[vector_name] if vector_name else point.vector
+
+        except Exception as e:
+            logger.error(f"Error retrieving vectors from {collection_name}: {e}")
+
+        return vectors
+
+    def existing_point_ids(self, collection_name: str, vector_ids: List[str],
+                           batch_size: Optional[int] = None) -> Set[str]:
+        """IDs among vector_ids that have a point in the collection (no payloads or vectors fetched)"""
+        batch_size = batch_size or self.retrieve_batch_size
+        ids = list(dict.fromkeys(vid for vid in vector_ids if vid))
+        existing = set()
+
+        for start in range(0, len(ids), batch_size):
+            points = self.client.retrieve(
+                collection_name=collection_name,
+                ids=ids[start:start + batch_size],
+                with_payload=False,
+                with_vectors=False
+            )
+            existing.update(str(point.id) for point in points)
+
+        return existing
+
+    def get_resume_vectors(self, vector_ids: List[str],
+                           batch_size: Optional[int] = None) -> Dict[str, List[float]]:
+        """Fetch stored resume vectors by vector ID"""
+        return self._retrieve_vectors(self.resume_collection, vector_ids, batch_size)
+
+    def get_job_vectors(self, vector_ids: List[str], batch_size: Optional[int] = None,
+                        vector: str = DEFAULT_JOB_VECTOR) -> Dict[str, List[float]]:
+        """Fetch one named vector ('title', 'skills' or 'full') of stored jobs by vector ID"""
+        return self._retrieve_vectors(self.job_collection, vector_ids, batch_size, vector)
+
+    def get_resume_vector(self, vector_id: str) -> Optional[List[float]]:
+        """Fetch a single stored resume vector, or None if the point is missing"""
+        return self.get_resume_vectors([vector_id]).get(str(vector_id))
+
+    def get_job_vector(self, vector_id: str, vector: str = DEFAULT_JOB_VECTOR) -> Optional[List[float]]:
+        """Fetch a single stored job vector, or None if the point is missing"""
+        return self.get_job_vectors([vector_id], vector=vector).get(str(vector_id))
+
+    def update_job_payload(self, job_id: str, metadata: Dict, overwrite: bool = False) -> bool:
+        """
+        Update a job's payload without re-sending its vector
+        overwrite=True replaces the whole payload, otherwise only the given keys are set
+        """
+        try:
+            if overwrite:
+                self.client.overwrite_payload(
+                    collection_name=self.job_collection,
+                    payload=self.build_job_payload(job_id, metadata),
+                    points=[self.job_vector_id(job_id)]
+                )
+            else:
+                self.client.set_payload(
+                    collection_name=self.job_collection,
+                    payload=metadata,
+                    points=[self.job_vector_id(job_id)]
+                )
+            return True
+
+        except Exception as e:
+            logger.error(f"Error updating payload for job {job_id}: {e}")
+            return False
+
+    def update_resume_payload(self, vector_id: str, metadata: Dict, overwrite: bool = False) -> bool:
+        """
+        Update a resume's payload without re-sending its vector
+        overwrite=True replaces the whole payload (metadata must carry user_id and resume_id)
+        """
+        try:
+            if overwrite:
+                self.client.overwrite_payload(
+                    collection_name=self.resume_collection,
+                    payload=self.build_resume_payload(metadata.get('user_id'), metadata.get('resume_id'), metadata),
+                    points=[vector_id]
+                )
+            else:
+                self.client.set_payload(
+                    collection_name=self.resume_collection,
+                    payload=metadata,
+                    points=[vector_id]
+                )
+            return True
+
+        except Exception as e:
+            logger.error(f"Error updating resume payload {vector_id}: {e}")
+            return False
+
     def update_resume_vector(self, vector_id: str, embedding: List[float],
                             metadata: Dict) -> bool:
         """Update existing resume vector"""
         try:
-            payload = {
-                'user_id': metadata.get('user_id'),
-                'skills': metadata.get('skills', []),
-                'experience_years': metadata.get('experience_years', 0),
-                'location': metadata.get('location', ''),
-                'education_level': metadata.get('education_level', ''),
-                'job_titles': metadata.get('job_titles', []),
-                'industries': metadata.get('industries', [])
-            }
-
             point = PointStruct(
                 id=vector_id,
                 vector=embedding,
-                payload=payload
+                payload=self.build_resume_payload(metadata.get('user_id'), metadata.get('resume_id'), metadata)
             )
 
-            self.client.upsert(
-                collection_name=self.resume_collection,
-                points=[point]
-            )
+            self._upsert(self.resume_collection, [point], shard_may_change=True)
 
             return True
 
@@ -302,6 +1011,182 @@ class VectorService:
             logger.error(f"Error deleting job vector: {e}")
             return False
 
+    def iter_points(self, collection_name: str, with_vectors: bool = False,
+                    with_payload: bool = True, page_size: int = 256) -> Iterator:
+        """Stream every point in a collection, one scroll page at a time"""
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=collection_name,
+                limit=page_size,
+                offset=offset,
+                with_payload=with_payload,
+                with_vectors=with_vectors
+            )
+            for point in points:
+                yield point
+            if offset is None:
+                break
+
+    def export_collection(self, collection_name: str, directory: str,
+                          page_size: Optional[int] = None) -> Dict:
+        """
+        Stream a collection into a directory, one scroll page at a time:
+        a float32 .npy per vector (written through a memmap), payload.json with
+        the point IDs and one column per payload field (null where a point lacks
+        the field), and manifest.json. Returns the manifest
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        names, dimension = self._vector_layout(collection_name)
+        capacity = self.client.count(collection_name, exact=True).count
+        started = time.perf_counter()
+
+        matrices = {
+            name: np.lib.format.open_memmap(directory / self._export_file(name), mode='w+',
+                                            dtype=np.float32, shape=(capacity, dimension))
+            for name in (names or [None])
+        }
+        ids = []
+        columns = {}
+
+        for row, point in enumerate(self.iter_points(collection_name, with_vectors=True,
+                                                     page_size=page_size or self.retrieve_batch_size)):
+            if row >= capacity:
+                logger.warning(f"{collection_name} grew during export; stopping at {capacity} points")
+                break
+
+            for name, matrix in matrices.items():
+                matrix[row] = point.vector[name] if name else point.vector
+            ids.append(point.id)
+
+            for key, value in (point.payload or {}).items():
+                columns.setdefault(key, [None] * row).append(value)
+            for values in columns.values():
+                if len(values) == row:
+                    values.append(None)
+
+        for matrix in matrices.values():
+            matrix.flush()
+
+        with open(directory / 'payload.json', 'w') as f:
+            json.dump({'ids': ids, 'columns': columns}, f)
+
+        manifest = {
+            'collection': collection_name,
+            'count': len(ids),
+            'dimension': dimension,
+            'vectors': names,
+            'exported_at': time.time()
+        }
+        with open(directory / 'manifest.json', 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+        elapsed = time.perf_counter() - started
+        logger.info(f"Exported {len(ids)} points from {collection_name} to {directory} "
+                    f"({len(ids) / elapsed if elapsed else 0:.0f} points/s)")
+
+        return manifest
+
+    def import_collection(self, directory: str, collection_name: Optional[str] = None,
+                          batch_size: Optional[int] = None, parallel: Optional[int] = None) -> Dict:
+        """
+        Bulk-load an export_collection directory into collection_name (default: the
+        exported collection), creating it if missing. Vectors are read sequentially
+        from the memmapped .npy files, so nothing is re-embedded
+        Returns {'collection', 'imported', 'failed'}
+        """
+        directory = Path(directory)
+        with open(directory / 'manifest.json') as f:
+            manifest = json.load(f)
+        collection_name = collection_name or manifest['collection']
+        names = manifest['vectors']
+        batch_size = batch_size or self.upsert_batch_size
+
+        if manifest['dimension'] != self.dimension:
+            raise ValueError(f"export is {manifest['dimension']}-dim, expected {self.dimension}")
+
+        if not self.resolve_collection(collection_name):
+            self._create_import_collection(collection_name, names)
+        if self._vector_layout(collection_name)[0] != names:
+            raise ValueError(f"{collection_name} vectors do not match the export's {names or 'single vector'}")
+
+        with open(directory / 'payload.json') as f:
+            payloads = json.load(f)
+        ids, columns = payloads['ids'], payloads['columns']
+        matrices = {name: np.load(directory / self._export_file(name), mmap_mode='r')
+                    for name in (names or [None])}
+
+        def items():
+            for start in range(0, manifest['count'], batch_size):
+                end = min(start + batch_size, manifest['count'])
+                block = {name: np.asarray(matrix[start:end]).tolist() for name, matrix in matrices.items()}
+                for offset, row in enumerate(range(start, end)):
+                    vectors = {name: rows[offset] for name, rows in block.items()}
+                    yield {
+                        'id': ids[row],
+                        'embedding': vectors if names else vectors[None],
+                        'payload': {key: values[row] for key, values in columns.items()}
+                    }
+
+        def to_point(item):
+            return PointStruct(id=item['id'], vector=item['embedding'], payload=item['payload'])
+
+        results = self._store_bulk(collection_name, items(), to_point, lambda item: {},
+                                   batch_size, parallel)
+        imported = sum(1 for result in results if result['success'])
+
+        return {'collection': collection_name, 'imported': imported, 'failed': len(results) - imported}
+
+    def _vector_layout(self, collection_name: str) -> Tuple[Optional[List[str]], int]:
+        """(sorted vector names, or None for a single unnamed vector; dimension)"""
+        vectors = self.client.get_collection(collection_name).config.params.vectors
+        if isinstance(vectors, dict):
+            names = sorted(vectors)
+            return names, vectors[names[0]].size
+        return None, vectors.size
+
+    @staticmethod
+    def _export_file(name: Optional[str]) -> str:
+        return f"vectors.{name}.npy" if name else 'vectors.npy'
+
+    def _create_import_collection(self, collection_name: str, names: Optional[List[str]]):
+        """Create an import target: a versioned collection behind jobs/resumes, else a plain one"""
+        schema = self.payload_index_schema()
+        if collection_name in schema:
+            self.switch_aliases({collection_name: self.create_versioned_collection(collection_name)})
+            self.ensure_payload_indexes({collection_name: schema[collection_name]})
+            return
+
+        params = VectorParams(size=self.dimension, distance=Distance.COSINE, on_disk=self.on_disk)
+        self.client.create_collection(
+            collection_name=collection_name,
+            vectors_config={name: params for name in names} if names else params,
+            hnsw_config=self.hnsw_config(),
+            quantization_config=self.quantization_config()
+        )
+
+    def delete_resume_vectors(self, vector_ids: List[str]) -> bool:
+        """Delete several resume vectors in one request"""
+        return self._delete_points(self.resume_collection, vector_ids)
+
+    def delete_job_vectors(self, vector_ids: List[str]) -> bool:
+        """Delete several job vectors in one request"""
+        return self._delete_points(self.job_collection, vector_ids)
+
+    def _delete_points(self, collection_name: str, vector_ids: List[str]) -> bool:
+        if not vector_ids:
+            return True
+        try:
+            self.client.delete(
+                collection_name=collection_name,
+                points_selector=list(vector_ids)
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting vectors from {collection_name}: {e}")
+            return False
+
     def get_collection_info(self, collection_name: str) -> Optional[Dict]:
         """Get information about a collection"""
         try:
@@ -0,0 +1,1636 @@
+"""
+Vector store backends for VectorService.
+
+VectorService only talks to its store through the subset of the qdrant-client
+API declared by VectorStore, so the networked Qdrant server and the in-process
+backend are interchangeable. Select one with VECTOR_BACKEND=qdrant|inprocess.
+"""
+import os
+import re
+import json
+import asyncio
+import uuid
+import atexit
+import logging
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.local.qdrant_local import QdrantLocal
+from qdrant_client.models import (
+    AliasDescription, Batch, CollectionConfig, CollectionDescription, CollectionInfo,
+    CollectionParams, CollectionsAliasesResponse, CollectionsResponse, CollectionStatus,
+    CountResult, CreateAlias, CreateAliasOperation, DeleteAlias, DeleteAliasOperation, Distance, FieldCondition,
+    Filter, FilterSelector, GroupsResult, HasIdCondition, HnswConfig, IsEmptyCondition, IsNullCondition,
+    MatchAny, MatchExcept, MatchText, MatchValue, NamedVector, OptimizersConfig,
+    OptimizersStatusOneOf, PayloadIndexInfo, PointGroup, PointIdsList, PointStruct, Range, Record,
+    RenameAlias, RenameAliasOperation, ScoredPoint, SearchRequest, UpdateResult, UpdateStatus,
+    VectorParams, WalConfig
+)
+
+try:
+    import hnswlib
+except ImportError:  # optional - exact search is used without it
+    hnswlib = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VECTOR = ''
+
+
+class VectorStore(ABC):
+    """Operations VectorService needs from a vector database (qdrant-client signatures)"""
+
+    @abstractmethod
+    def get_collections(self) -> CollectionsResponse:
+        """List physical collections"""
+
+    @abstractmethod
+    def get_collection(self, collection_name: str) -> CollectionInfo:
+        """Collection config, counts and payload schema"""
+
+    @abstractmethod
+    def create_collection(self, collection_name: str, vectors_config, **kwargs) -> bool:
+        """Create an empty collection"""
+
+    @abstractmethod
+    def update_collection(self, collection_name: str, **kwargs) -> bool:
+        """Change storage, index or quantization settings of a collection"""
+
+    @abstractmethod
+    def delete_collection(self, collection_name: str, **kwargs) -> bool:
+        """Drop a collection and the aliases pointing at it"""
+
+    @abstractmethod
+    def get_aliases(self, **kwargs) -> CollectionsAliasesResponse:
+        """List aliases"""
+
+    @abstractmethod
+    def update_collection_aliases(self, change_aliases_operations: List, **kwargs) -> bool:
+        """Apply alias create/delete/rename operations atomically"""
+
+    @abstractmethod
+    def create_payload_index(self, collection_name: str, field_name: str, field_schema=None, **kwargs):
+        """Index a payload field"""
+
+    @abstractmethod
+    def delete_payload_index(self, collection_name: str, field_name: str, **kwargs):
+        """Drop a payload field index"""
+
+    @abstractmethod
+    def upsert(self, collection_name: str, points, **kwargs) -> UpdateResult:
+        """Insert or replace points"""
+
+    @abstractmethod
+    def retrieve(self, collection_name: str, ids: List, with_payload=True, with_vectors=False,
+                 **kwargs) -> List[Record]:
+        """Fetch points by ID; missing IDs are skipped"""
+
+    @abstractmethod
+    def delete(self, collection_name: str, points_selector, **kwargs) -> UpdateResult:
+        """Delete points by ID list or filter"""
+
+    @abstractmethod
+    def scroll(self, collection_name: str, scroll_filter: Optional[Filter] = None, limit: int = 10,
+               offset=None, with_payload=True, with_vectors=False, **kwargs) -> Tuple[List[Record], Optional[str]]:
+        """Page through points in ID order"""
+
+    @abstractmethod
+    def count(self, collection_name: str, count_filter: Optional[Filter] = None, exact: bool = True,
+              **kwargs) -> CountResult:
+        """Count points matching a filter"""
+
+    @abstractmethod
+    def search(self, collection_name: str, query_vector, query_filter: Optional[Filter] = None,
+               search_params=None, limit: int = 10, offset: int = 0, with_payload=True,
+               with_vectors=False, score_threshold: Optional[float] = None, **kwargs) -> List[ScoredPoint]:
+        """Nearest neighbours of a vector"""
+
+    @abstractmethod
+    def search_batch(self, collection_name: str, requests: List[SearchRequest], **kwargs) -> List[List[ScoredPoint]]:
+        """Several searches in one call"""
+
+    @abstractmethod
+    def search_groups(self, collection_name: str, query_vector, group_by: str,
+                      query_filter: Optional[Filter] = None, search_params=None, limit: int = 10,
+                      group_size: int = 1, with_payload=True, with_vectors=False,
+                      score_threshold: Optional[float] = None, **kwargs) -> GroupsResult:
+        """Nearest neighbours grouped by a payload field: best `group_size` points of `limit` groups"""
+
+    @abstractmethod
+    def set_payload(self, collection_name: str, payload: Dict, points, **kwargs) -> UpdateResult:
+        """Merge keys into the payload of existing points"""
+
+    @abstractmethod
+    def overwrite_payload(self, collection_name: str, payload: Dict, points, **kwargs) -> UpdateResult:
+        """Replace the payload of existing points"""
+
+
+class QdrantVectorStore(QdrantClient, VectorStore):
+    """Networked Qdrant backend - QdrantClient already implements the interface"""
+
+
+class _PayloadIndex:
+    """
+    Rows by value for one payload field, so filters on the field build their row
+    mask from sets and arrays instead of visiting every payload
+    """
+
+    def __init__(self, key: str, capacity: int):
+        self.key = key
+        self.rows_by_value: Dict = {}
+        self.present = np.zeros(capacity, dtype=bool)
+        # The row's numeric value for range filters (NaN if it has none); rows with several go to `multi`
+        self.numbers = np.full(capacity, np.nan)
+        self.multi = set()
+
+    def grow(self, capacity: int):
+        extra = capacity - len(self.present)
+        self.present = np.concatenate([self.present, np.zeros(extra, dtype=bool)])
+        self.numbers = np.concatenate([self.numbers, np.full(extra, np.nan)])
+
+    def add(self, row: int, payload: Dict):
+        values = _payload_values(payload, self.key)
+        if not values:
+            return
+        self.present[row] = True
+        for value in values:
+            key = _index_key(value)
+            if key is not None:
+                self.rows_by_value.setdefault(key, set()).add(row)
+
+        numbers = [value for value in values if _is_number(value)]
+        if len(numbers) == 1 and abs(numbers[0]) < 2 ** 53:
+            self.numbers[row] = numbers[0]
+        elif numbers:
+            self.multi.add(row)
+
+    def discard(self, row: int, payload: Dict):
+        for value in _payload_values(payload, self.key):
+            key = _index_key(value)
+            rows = self.rows_by_value.get(key) if key is not None else None
+            if rows is not None:
+                rows.discard(row)
+                if not rows:
+                    del self.rows_by_value[key]
+        self.present[row] = False
+        self.numbers[row] = np.nan
+        self.multi.discard(row)
+
+    def mask(self, condition, size: int, payloads: List) -> Optional[np.ndarray]:
+        """Rows matching condition, or None when it needs the payload scan"""
+        if isinstance(condition, IsEmptyCondition):
+            return ~self.present[:size]
+
+        match = condition.match
+        if isinstance(match, MatchValue):
+            return self._rows_mask([_index_key(match.value)], size)
+        if isinstance(match, MatchAny):
+            return self._rows_mask([_index_key(option) for option in match.any], size)
+        if isinstance(match, MatchExcept):
+            excluded = {_index_key(option) for option in getattr(match, 'except_')}
+            return self._rows_mask([key for key in self.rows_by_value if key not in excluded], size)
+        if match is not None:
+            return None
+
+        bounds = condition.range
+        if bounds is not None:
+            numbers = self.numbers[:size]
+            mask = ~np.isnan(numbers)
+            if bounds.gt is not None:
+                mask &= numbers > bounds.gt
+            if bounds.gte is not None:
+                mask &= numbers >= bounds.gte
+            if bounds.lt is not None:
+                mask &= numbers < bounds.lt
+            if bounds.lte is not None:
+                mask &= numbers <= bounds.lte
+            for row in self.multi:
+                mask[row] = any(_in_range(value, bounds) for value in _payload_values(payloads[row], self.key)
+                                if _is_number(value))
+            return mask
+        return None
+
+    def _rows_mask(self, keys: List, size: int) -> np.ndarray:
+        mask = np.zeros(size, dtype=bool)
+        for key in keys:
+            rows = self.rows_by_value.get(key) if key is not None else None
+            if rows:
+                mask[np.fromiter(rows, dtype=np.int64, count=len(rows))] = True
+        return mask
+
+
+class _Collection:
+    """Points of one in-process collection: one float32 matrix per named vector"""
+
+    def __init__(self, vectors_config: Union[VectorParams, Dict[str, VectorParams]]):
+        self.vectors_config = vectors_config
+        if isinstance(vectors_config, dict):
+            self.vector_params = dict(vectors_config)
+        else:
+            self.vector_params = {DEFAULT_VECTOR: vectors_config}
+
+        self.size = 0
+        self.ids: List = []
+        self.rows: Dict = {}
+        self.payloads: List[Optional[Dict]] = []
+        self.alive = np.zeros(0, dtype=bool)
+        self.matrices = {name: np.zeros((0, params.size), dtype=np.float32)
+                         for name, params in self.vector_params.items()}
+        self.indexes: Dict[str, object] = {}
+        self.payload_schema: Dict[str, PayloadIndexInfo] = {}
+        self.field_indexes: Dict[str, _PayloadIndex] = {}
+        self.indexed_size = 0
+        self._sorted_ids: Optional[List] = None
+
+    @property
+    def points_count(self) -> int:
+        return len(self.rows)
+
+    @property
+    def deleted_count(self) -> int:
+        """Tombstoned rows still holding space until compact()"""
+        return self.size - len(self.rows)
+
+    def sorted_ids(self) -> List:
+        if self._sorted_ids is None:
+            self._sorted_ids = sorted(self.rows, key=_id_sort_key)
+        return self._sorted_ids
+
+    def _grow(self, needed: int):
+        capacity = len(self.alive)
+        if needed <= capacity:
+            return
+        capacity = max(needed, capacity * 2, 64)
+        self.alive = np.concatenate([self.alive, np.zeros(capacity - len(self.alive), dtype=bool)])
+        for name, matrix in self.matrices.items():
+            grown = np.zeros((capacity, matrix.shape[1]), dtype=np.float32)
+            grown[:self.size] = matrix[:self.size]
+            self.matrices[name] = grown
+        for index in self.indexes.values():
+            index.resize_index(capacity)
+        for field_index in self.field_indexes.values():
+            field_index.grow(capacity)
+
+    def upsert(self, point_id, vectors: Dict[str, np.ndarray], payload: Optional[Dict]):
+        """
+        Store a point in a fresh row; call index_pending() afterwards
+        Replacing a point tombstones its old row, so HNSW labels are never reused
+        """
+        self.remove(point_id)
+        self._grow(self.size + 1)
+
+        row = self.size
+        for name, matrix in self.matrices.items():
+            matrix[row] = vectors[name]
+        self.alive[row] = True
+        self.ids.append(point_id)
+        self.payloads.append(payload or {})
+        self.rows[point_id] = row
+        self.size += 1
+        self._sorted_ids = None
+        for field_index in self.field_indexes.values():
+            field_index.add(row, self.payloads[row])
+
+    def update_payload(self, point_id, payload: Dict, overwrite: bool = False):
+        row = self.rows[point_id]
+        for field_index in self.field_indexes.values():
+            field_index.discard(row, self.payloads[row])
+        if overwrite:
+            self.payloads[row] = dict(payload)
+        else:
+            self.payloads[row].update(payload)
+        for field_index in self.field_indexes.values():
+            field_index.add(row, self.payloads[row])
+
+    def index_pending(self):
+        """Add rows written since the last call to the HNSW indexes, if built"""
+        if self.indexes and self.indexed_size < self.size:
+            rows = self.indexed_size + np.flatnonzero(self.alive[self.indexed_size:self.size])
+            for name, index in self.indexes.items():
+                index.add_items(self.matrices[name][rows], rows)
+        self.indexed_size = self.size
+
+    def remove(self, point_id) -> bool:
+        row = self.rows.pop(point_id, None)
+        if row is None:
+            return False
+        for field_index in self.field_indexes.values():
+            field_index.discard(row, self.payloads[row])
+        self.alive[row] = False
+        self.payloads[row] = None
+        self._sorted_ids = None
+        if row < self.indexed_size:
+            for index in self.indexes.values():
+                index.mark_deleted(row)
+        return True
+
+    def index_field(self, key: str):
+        """(Re)build the payload index of one field from the live rows"""
+        field_index = _PayloadIndex(key, len(self.alive))
+        for row in np.flatnonzero(self.alive[:self.size]):
+            field_index.add(row, self.payloads[row])
+        self.field_indexes[key] = field_index
+
+    def has_values(self, key: str) -> np.ndarray:
+        """Rows holding at least one non-null value at key"""
+        field_index = self.field_indexes.get(key)
+        if field_index is not None:
+            return field_index.present[:self.size].copy()
+        return np.array([payload is not None and bool(_payload_values(payload, key))
+                         for payload in self.payloads[:self.size]], dtype=bool)
+
+    def compact(self):
+        """
+        Move the live points into fresh rows and drop the tombstones
+        Row numbers change, so the HNSW indexes are dropped (the store rebuilds them)
+        """
+        rows = np.flatnonzero(self.alive[:self.size])
+        self.ids = [self.ids[row] for row in rows]
+        self.payloads = [self.payloads[row] for row in rows]
+        self.matrices = {name: matrix[rows] for name, matrix in self.matrices.items()}
+        self.size = len(rows)
+        self.rows = {point_id: row for row, point_id in enumerate(self.ids)}
+        self.alive = np.ones(self.size, dtype=bool)
+        self.indexes = {}
+        self.indexed_size = self.size
+        self._sorted_ids = None
+        for key in list(self.field_indexes):
+            self.index_field(key)
+
+
+class InProcessVectorStore(VectorStore):
+    """
+    Vectors held in float32 NumPy matrices inside this process.
+
+    Search is an exact dot product over the (filtered) rows. Once a collection
+    reaches hnsw_threshold points - and hnswlib is installed - unselective
+    queries go through an HNSW index instead. Payload filters follow Qdrant's
+    semantics for the conditions VectorService uses; fields with a payload index
+    are filtered through it, other fields by scanning payloads. Replaced and
+    deleted points leave tombstoned rows, compacted once they pass vacuum_ratio
+    of the collection (and vacuum_min_deleted rows).
+
+    Data lives per process; with `path` set it is loaded at start-up and
+    written back on save() / interpreter exit.
+    """
+
+    def __init__(self, path: Optional[str] = None, hnsw_threshold: int = 20000,
+                 hnsw_m: int = 16, hnsw_ef_construct: int = 200, hnsw_ef: int = 128,
+                 vacuum_ratio: float = 0.2, vacuum_min_deleted: int = 1000):
+        self.path = path
+        self.hnsw_threshold = hnsw_threshold
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construct = hnsw_ef_construct
+        self.hnsw_ef = hnsw_ef
+        self.vacuum_ratio = vacuum_ratio
+        self.vacuum_min_deleted = vacuum_min_deleted
+        self._collections: Dict[str, _Collection] = {}
+        self._aliases: Dict[str, str] = {}
+        self._lock = threading.RLock()
+
+        if path:
+            self.load()
+            atexit.register(self.save)
+
+    # Collections and aliases
+
+    def get_collections(self) -> CollectionsResponse:
+        with self._lock:
+            return CollectionsResponse(
+                collections=[CollectionDescription(name=name) for name in self._collections]
+            )
+
+    def get_collection(self, collection_name: str) -> CollectionInfo:
+        with self._lock:
+            collection = self._get(collection_name)
+            points_count = collection.points_count
+            return CollectionInfo(
+                status=CollectionStatus.GREEN,
+                optimizer_status=OptimizersStatusOneOf.OK,
+                vectors_count=points_count * len(collection.vector_params),
+                indexed_vectors_count=points_count if collection.indexes else 0,
+                points_count=points_count,
+                segments_count=1,
+                payload_schema=dict(collection.payload_schema),
+                config=CollectionConfig(
+                    params=CollectionParams(vectors=collection.vectors_config),
+                    hnsw_config=HnswConfig(
+                        m=self.hnsw_m,
+                        ef_construct=self.hnsw_ef_construct,
+                        full_scan_threshold=self.hnsw_threshold
+                    ),
+                    optimizer_config=OptimizersConfig(
+                        deleted_threshold=self.vacuum_ratio,
+                        vacuum_min_vector_number=self.vacuum_min_deleted,
+                        default_segment_number=0,
+                        indexing_threshold=self.hnsw_threshold,
+                        flush_interval_sec=5,
+                        max_optimization_threads=1
+                    ),
+                    wal_config=WalConfig(wal_capacity_mb=32, wal_segments_ahead=0)
+                )
+            )
+
+    def create_collection(self, collection_name: str, vectors_config, **kwargs) -> bool:
+        with self._lock:
+            if collection_name in self._collections or collection_name in self._aliases:
+                raise ValueError(f"Collection {collection_name} already exists")
+            self._collections[collection_name] = _Collection(vectors_config)
+            return True
+
+    def update_collection(self, collection_name: str, **kwargs) -> bool:
+        # Vectors always live in RAM as float32 here; storage and quantization settings don't apply
+        with self._lock:
+            self._get(collection_name)
+            return True
+
+    def delete_collection(self, collection_name: str, **kwargs) -> bool:
+        with self._lock:
+            if self._collections.pop(collection_name, None) is None:
+                return False
+            self._aliases = {alias: target for alias, target in self._aliases.items()
+                             if target != collection_name}
+            return True
+
+    def get_aliases(self, **kwargs) -> CollectionsAliasesResponse:
+        with self._lock:
+            return CollectionsAliasesResponse(aliases=[
+                AliasDescription(alias_name=alias, collection_name=target)
+                for alias, target in self._aliases.items()
+            ])
+
+    def update_collection_aliases(self, change_aliases_operations: List, **kwargs) -> bool:
+        with self._lock:
+            # Apply to a copy so a failing operation leaves every alias untouched
+            aliases = dict(self._aliases)
+            for operation in change_aliases_operations:
+                if isinstance(operation, CreateAliasOperation):
+                    target = operation.create_alias.collection_name
+                    alias = operation.create_alias.alias_name
+                    if target not in self._collections:
+                        raise ValueError(f"Collection {target} not found")
+                    if alias in self._collections:
+                        raise ValueError(f"Alias {alias} clashes with an existing collection")
+                    aliases[alias] = target
+                elif isinstance(operation, DeleteAliasOperation):
+                    if aliases.pop(operation.delete_alias.alias_name, None) is None:
+                        raise ValueError(f"Alias {operation.delete_alias.alias_name} not found")
+                elif isinstance(operation, RenameAliasOperation):
+                    old_name = operation.rename_alias.old_alias_name
+                    if old_name not in aliases:
+                        raise ValueError(f"Alias {old_name} not found")
+                    aliases[operation.rename_alias.new_alias_name] = aliases.pop(old_name)
+                else:
+                    raise ValueError(f"Unsupported alias operation: {operation}")
+            self._aliases = aliases
+            return True
+
+    def create_payload_index(self, collection_name: str, field_name: str, field_schema=None, **kwargs):
+        # Any field type gets the same value/number index; the schema is recorded for get_collection()
+        with self._lock:
+            collection = self._get(collection_name)
+            collection.index_field(field_name)
+            collection.payload_schema[field_name] = PayloadIndexInfo(
+                data_type=field_schema, points=collection.points_count
+            )
+            return self._completed()
+
+    def delete_payload_index(self, collection_name: str, field_name: str, **kwargs):
+        with self._lock:
+            collection = self._get(collection_name)
+            collection.payload_schema.pop(field_name, None)
+            collection.field_indexes.pop(field_name, None)
+            return self._completed()
+
+    # Points
+
+    def upsert(self, collection_name: str, points, **kwargs) -> UpdateResult:
+        if isinstance(points, Batch):
+            payloads = points.payloads or [None] * len(points.ids)
+            if isinstance(points.vectors, dict):
+                vectors = [{name: values[i] for name, values in points.vectors.items()}
+                           for i in range(len(points.ids))]
+            else:
+                vectors = points.vectors
+            points = list(zip(points.ids, vectors, payloads))
+        else:
+            points = [(point.id, point.vector, point.payload) for point in points]
+
+        with self._lock:
+            collection = self._get(collection_name)
+            prepared = [(_point_id(point_id), self._prepare_vectors(collection, vector), payload)
+                        for point_id, vector, payload in points]
+            for point_id, vectors, payload in prepared:
+                collection.upsert(point_id, vectors, dict(payload or {}))
+            collection.index_pending()
+            self._maybe_compact(collection)
+            self._maybe_build_indexes(collection)
+            return self._completed()
+
+    def retrieve(self, collection_name: str, ids: List, with_payload=True, with_vectors=False,
+                 **kwargs) -> List[Record]:
+        with self._lock:
+            collection = self._get(collection_name)
+            records = []
+            for point_id in ids:
+                row = collection.rows.get(_point_id(point_id))
+                if row is not None:
+                    records.append(self._record(collection, row, with_payload, with_vectors))
+            return records
+
+    def delete(self, collection_name: str, points_selector, **kwargs) -> UpdateResult:
+        with self._lock:
+            collection = self._get(collection_name)
+            for point_id in self._select_ids(collection, points_selector):
+                collection.remove(point_id)
+            self._maybe_compact(collection)
+            self._maybe_build_indexes(collection)
+            return self._completed()
+
+    def set_payload(self, collection_name: str, payload: Dict, points, **kwargs) -> UpdateResult:
+        with self._lock:
+            collection = self._get(collection_name)
+            for point_id in self._select_ids(collection, points, must_exist=True):
+                collection.update_payload(point_id, payload)
+            return self._completed()
+
+    def overwrite_payload(self, collection_name: str, payload: Dict, points, **kwargs) -> UpdateResult:
+        with self._lock:
+            collection = self._get(collection_name)
+            for point_id in self._select_ids(collection, points, must_exist=True):
+                collection.update_payload(point_id, payload, overwrite=True)
+            return self._completed()
+
+    def scroll(self, collection_name: str, scroll_filter: Optional[Filter] = None, limit: int = 10,
+               offset=None, with_payload=True, with_vectors=False, **kwargs) -> Tuple[List[Record], Optional[str]]:
+        with self._lock:
+            collection = self._get(collection_name)
+            point_ids = collection.sorted_ids()
+            position = 0
+            if offset is not None:
+                position = bisect_left([_id_sort_key(point_id) for point_id in point_ids],
+                                       _id_sort_key(_point_id(offset)))
+
+            records = []
+            while position < len(point_ids) and len(records) < limit:
+                row = collection.rows[point_ids[position]]
+                if scroll_filter is None or _matches_filter(scroll_filter, collection.payloads[row],
+                                                            collection.ids[row]):
+                    records.append(self._record(collection, row, with_payload, with_vectors))
+                position += 1
+
+            next_offset = point_ids[position] if position < len(point_ids) else None
+            return records, next_offset
+
+    def count(self, collection_name: str, count_filter: Optional[Filter] = None, exact: bool = True,
+              **kwargs) -> CountResult:
+        with self._lock:
+            collection = self._get(collection_name)
+            if count_filter is None:
+                return CountResult(count=collection.points_count)
+            return CountResult(count=int(self._filter_mask(collection, count_filter).sum()))
+
+    # Search
+
+    def search(self, collection_name: str, query_vector, query_filter: Optional[Filter] = None,
+               search_params=None, limit: int = 10, offset: int = 0, with_payload=True,
+               with_vectors=False, score_threshold: Optional[float] = None, **kwargs) -> List[ScoredPoint]:
+        with self._lock:
+            collection = self._get(collection_name)
+            vector_name, query, mask = self._prepare_query(collection, query_vector, query_filter)
+            distance = collection.vector_params[vector_name].distance
+            hits = self._ranked_rows(collection, vector_name, query, mask, (offset or 0) + limit, search_params)
+
+            results = []
+            for row, score in hits[offset or 0:]:
+                if score_threshold is not None and not _passes_threshold(score, score_threshold, distance):
+                    break
+                results.append(self._scored_point(collection, row, score, with_payload, with_vectors))
+            return results
+
+    def search_groups(self, collection_name: str, query_vector, group_by: str,
+                      query_filter: Optional[Filter] = None, search_params=None, limit: int = 10,
+                      group_size: int = 1, with_payload=True, with_vectors=False,
+                      score_threshold: Optional[float] = None, **kwargs) -> GroupsResult:
+        with self._lock:
+            collection = self._get(collection_name)
+            vector_name, query, mask = self._prepare_query(collection, query_vector, query_filter)
+            distance = collection.vector_params[vector_name].distance
+
+            # Points without the group key never form a group
+            mask = mask & collection.has_values(group_by)
+            candidates = int(mask.sum())
+
+            # Widen the window until enough groups are full (or every point has been seen)
+            k = limit * group_size * 4
+            while True:
+                groups: Dict = {}
+                hits = self._ranked_rows(collection, vector_name, query, mask, min(k, candidates), search_params)
+                for row, score in hits:
+                    if score_threshold is not None and not _passes_threshold(score, score_threshold, distance):
+                        break
+                    for value in _payload_values(collection.payloads[row], group_by):
+                        if not isinstance(value, (str, int)) or isinstance(value, bool):
+                            continue
+                        if value not in groups and len(groups) >= limit:
+                            continue
+                        members = groups.setdefault(value, [])
+                        if len(members) < group_size:
+                            members.append(self._scored_point(collection, row, score, with_payload, with_vectors))
+                full = len(groups) >= limit and all(len(members) >= group_size for members in groups.values())
+                if full or k >= candidates:
+                    break
+                k *= 4
+
+            return GroupsResult(groups=[PointGroup(id=value, hits=members) for value, members in groups.items()])
+
+    def _prepare_query(self, collection: _Collection, query_vector,
+                       query_filter: Optional[Filter]) -> Tuple[str, np.ndarray, np.ndarray]:
+        """(vector name, normalised query, candidate row mask) for a search"""
+        vector_name, vector = _unpack_query(query_vector)
+        query = _normalize(np.asarray(vector, dtype=np.float32), collection.vector_params[vector_name].distance)
+
+        mask = collection.alive[:collection.size]
+        if query_filter is not None:
+            mask = mask & self._filter_mask(collection, query_filter)
+        return vector_name, query, mask
+
+    def _ranked_rows(self, collection: _Collection, vector_name: str, query: np.ndarray,
+                     mask: np.ndarray, k: int, search_params) -> List[Tuple[int, float]]:
+        """Top-k (row, score) pairs, best first: HNSW when indexed and large enough, else exact"""
+        distance = collection.vector_params[vector_name].distance
+        exact = search_params is not None and getattr(search_params, 'exact', False)
+        index = collection.indexes.get(vector_name)
+
+        hits = None
+        if index is not None and not exact and int(mask.sum()) >= self.hnsw_threshold:
+            ef = getattr(search_params, 'hnsw_ef', None) or self.hnsw_ef
+            hits = self._search_hnsw(index, query, mask, k, ef, distance)
+        if hits is None:
+            hits = self._search_exact(collection.matrices[vector_name][:collection.size], query, mask, k, distance)
+        return hits
+
+    def _scored_point(self, collection: _Collection, row: int, score: float, with_payload,
+                      with_vectors) -> ScoredPoint:
+        record = self._record(collection, row, with_payload, with_vectors)
+        return ScoredPoint(id=record.id, version=0, score=score, payload=record.payload, vector=record.vector)
+
+    def search_batch(self, collection_name: str, requests: List[SearchRequest], **kwargs) -> List[List[ScoredPoint]]:
+        return [
+            self.search(
+                collection_name=collection_name,
+                query_vector=request.vector,
+                query_filter=request.filter,
+                search_params=request.params,
+                limit=request.limit,
+                offset=request.offset or 0,
+                with_payload=request.with_payload if request.with_payload is not None else False,
+                with_vectors=request.with_vector if request.with_vector is not None else False,
+                score_threshold=request.score_threshold
+            )
+            for request in requests
+        ]
+
+    @staticmethod
+    def _search_exact(matrix: np.ndarray, query: np.ndarray, mask: np.ndarray, k: int,
+                      distance: Distance) -> List[Tuple[int, float]]:
+        rows = np.flatnonzero(mask)
+        if not len(rows) or k <= 0:
+            return []
+
+        if distance == Distance.EUCLID:
+            scores = np.linalg.norm(matrix[rows] - query, axis=1)
+            order_scores = -scores
+        else:
+            scores = matrix[rows] @ query
+            order_scores = scores
+
+        k = min(k, len(rows))
+        top = np.argpartition(-order_scores, k - 1)[:k]
+        top = top[np.argsort(-order_scores[top], kind='stable')]
+        return [(int(rows[i]), float(scores[i])) for i in top]
+
+    @staticmethod
+    def _search_hnsw(index, query: np.ndarray, mask: np.ndarray, k: int, ef: int,
+                     distance: Distance) -> Optional[List[Tuple[int, float]]]:
+        try:
+            index.set_ef(max(ef, k))
+            # The filter is a Python callback, so keep the query single-threaded
+            labels, distances = index.knn_query(query, k=k, num_threads=1,
+                                                filter=lambda label: bool(mask[label]))
+        except RuntimeError:
+            # Fewer reachable points than k under this filter - let exact search answer
+            return None
+
+        if distance == Distance.EUCLID:
+            scores = np.sqrt(distances[0])
+        else:
+            scores = 1.0 - distances[0]
+        return [(int(label), float(score)) for label, score in zip(labels[0], scores)]
+
+    def _maybe_compact(self, collection: _Collection):
+        """Drop tombstoned rows once they make up vacuum_ratio of the collection"""
+        deleted = collection.deleted_count
+        if deleted < max(self.vacuum_min_deleted, 1) or deleted <= self.vacuum_ratio * collection.size:
+            return
+        collection.compact()
+        logger.info(f"Compacted {deleted} deleted rows, {collection.points_count} points left")
+
+    def _maybe_build_indexes(self, collection: _Collection):
+        """Build the HNSW index the first time a collection crosses hnsw_threshold"""
+        if hnswlib is None or collection.indexes or collection.points_count < self.hnsw_threshold:
+            return
+
+        rows = np.flatnonzero(collection.alive[:collection.size])
+        for name, params in collection.vector_params.items():
+            index = hnswlib.Index(space='l2' if params.distance == Distance.EUCLID else 'ip',
+                                  dim=params.size)
+            index.init_index(max_elements=len(collection.alive), M=self.hnsw_m,
+                             ef_construction=self.hnsw_ef_construct)
+            index.add_items(collection.matrices[name][rows], rows)
+            collection.indexes[name] = index
+        collection.indexed_size = collection.size
+
+        logger.info(f"Built HNSW index over {len(rows)} points")
+
+    # Helpers
+
+    def _get(self, name: str) -> _Collection:
+        collection = self._collections.get(self._aliases.get(name, name))
+        if collection is None:
+            raise ValueError(f"Collection {name} not found")
+        return collection
+
+    @staticmethod
+    def _prepare_vectors(collection: _Collection, vector) -> Dict[str, np.ndarray]:
+        if not isinstance(vector, dict):
+            vector = {DEFAULT_VECTOR: vector}
+        prepared = {}
+        for name, params in collection.vector_params.items():
+            if name not in vector:
+                raise ValueError(f"Missing vector '{name}'")
+            values = np.asarray(vector[name], dtype=np.float32)
+            if values.shape != (params.size,):
+                raise ValueError(f"Vector '{name}' has shape {values.shape}, expected ({params.size},)")
+            prepared[name] = _normalize(values, params.distance)
+        return prepared
+
+    @staticmethod
+    def _record(collection: _Collection, row: int, with_payload, with_vectors) -> Record:
+        payload = None
+        if with_payload:
+            payload = dict(collection.payloads[row])
+            if isinstance(with_payload, list):
+                payload = {key: value for key, value in payload.items() if key in with_payload}
+
+        vector = None
+        if with_vectors:
+            names = with_vectors if isinstance(with_vectors, list) else list(collection.vector_params)
+            vectors = {name: collection.matrices[name][row].tolist() for name in names}
+            vector = vectors if DEFAULT_VECTOR not in collection.vector_params else vectors[DEFAULT_VECTOR]
+
+        return Record(id=collection.ids[row], payload=payload, vector=vector)
+
+    @staticmethod
+    def _filter_mask(collection: _Collection, query_filter: Filter) -> np.ndarray:
+        return collection.alive[:collection.size] & _filter_rows(collection, query_filter)
+
+    def _select_ids(self, collection: _Collection, selector, must_exist: bool = False) -> List:
+        if isinstance(selector, FilterSelector):
+            selector = selector.filter
+        if isinstance(selector, Filter):
+            mask = self._filter_mask(collection, selector)
+            return [collection.ids[row] for row in np.flatnonzero(mask)]
+
+        if isinstance(selector, PointIdsList):
+            selector = selector.points
+        point_ids = [_point_id(point_id) for point_id in selector]
+        if must_exist:
+            for point_id in point_ids:
+                if point_id not in collection.rows:
+                    raise ValueError(f"No point with id {point_id} found")
+        return point_ids
+
+    @staticmethod
+    def _completed() -> UpdateResult:
+        return UpdateResult(operation_id=0, status=UpdateStatus.COMPLETED)
+
+    # Persistence
+
+    def save(self):
+        """Write every collection and alias under self.path"""
+        if not self.path:
+            return
+        with self._lock:
+            os.makedirs(self.path, exist_ok=True)
+            manifest = {'aliases': self._aliases, 'collections': {}}
+
+            for name, collection in self._collections.items():
+                rows = [collection.rows[point_id] for point_id in collection.sorted_ids()]
+                for vector_name, matrix in collection.matrices.items():
+                    np.save(os.path.join(self.path, f"{name}.{vector_name or 'default'}.npy"), matrix[rows])
+                manifest['collections'][name] = {
+                    'vectors': {vector_name: {'size': params.size, 'distance': params.distance.value}
+                                for vector_name, params in collection.vector_params.items()},
+                    'named': isinstance(collection.vectors_config, dict),
+                    'ids': [collection.ids[row] for row in rows],
+                    'payloads': [collection.payloads[row] for row in rows],
+                    'payload_schema': {field: info.data_type.value
+                                       for field, info in collection.payload_schema.items()}
+                }
+
+            with open(os.path.join(self.path, 'manifest.json'), 'w') as f:
+                json.dump(manifest, f)
+
+        logger.info(f"Saved in-process vector store to {self.path}")
+
+    def load(self):
+        """Load collections saved by save(); a missing store starts empty"""
+        manifest_path = os.path.join(self.path, 'manifest.json')
+        if not os.path.exists(manifest_path):
+            return
+
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+        with self._lock:
+            for name, saved in manifest['collections'].items():
+                vector_params = {vector_name: VectorParams(size=params['size'], distance=Distance(params['distance']))
+                                 for vector_name, params in saved['vectors'].items()}
+                collection = _Collection(vector_params if saved['named'] else vector_params[DEFAULT_VECTOR])
+                matrices = {vector_name: np.load(os.path.join(self.path, f"{name}.{vector_name or 'default'}.npy"))
+                            for vector_name in vector_params}
+
+                for row, (point_id, payload) in enumerate(zip(saved['ids'], saved['payloads'])):
+                    collection.upsert(point_id, {vector_name: matrix[row] for vector_name, matrix in matrices.items()},
+                                      payload)
+                for field, data_type in saved['payload_schema'].items():
+                    collection.index_field(field)
+                    collection.payload_schema[field] = PayloadIndexInfo(data_type=data_type,
+                                                                        points=collection.points_count)
+
+                self._collections[name] = collection
+                self._maybe_build_indexes(collection)
+
+            self._aliases = dict(manifest['aliases'])
+
+        logger.info(f"Loaded in-process vector store from {self.path}")
+
+
+# Sharding
+
+SHARD_SEPARATOR = '__'
+
+
+class ShardPolicy:
+    """
+    How one collection is split: by a payload field, one shard per listed value
+    plus a catch-all 'other' shard for every value not listed (or missing)
+    """
+
+    OTHER = 'other'
+
+    def __init__(self, field: str, values: List):
+        self.field = field
+        self.values = list(values)
+        self._shard_of = {value: _shard_slug(value) for value in self.values}
+        self.shards = list(dict.fromkeys(list(self._shard_of.values()) + [self.OTHER]))
+
+    def shard_for(self, value) -> str:
+        """Shard holding points whose field equals value"""
+        if isinstance(value, (str, int)) and not isinstance(value, bool):
+            return self._shard_of.get(value, self.OTHER)
+        return self.OTHER
+
+    def route(self, query_filter: Optional[Filter]) -> List[str]:
+        """
+        Shards a filter can match: narrowed by top-level `must` MatchValue/MatchAny
+        conditions on the shard field, otherwise every shard
+        """
+        shards = set(self.shards)
+        for condition in _as_list(query_filter.must) if query_filter is not None else []:
+            if not isinstance(condition, FieldCondition) or condition.key != self.field:
+                continue
+            if isinstance(condition.match, MatchValue):
+                shards &= {self.shard_for(condition.match.value)}
+            elif isinstance(condition.match, MatchAny):
+                shards &= {self.shard_for(value) for value in condition.match.any}
+        return [shard for shard in self.shards if shard in shards]
+
+
+def _shard_slug(value) -> str:
+    return re.sub(r'[^a-z0-9]+', '_', str(value).lower()).strip('_') or ShardPolicy.OTHER
+
+
+class ShardedVectorStore(VectorStore):
+    """
+    Splits sharded collections into one physical collection per shard
+    (e.g. jobs_v1__engineering behind alias jobs__engineering) over another store.
+
+    Callers keep using logical names. A collection is sharded when its name is a
+    policy's alias or one of its versioned collections (jobs, jobs_v20240101...).
+    Writes go to the shard of each point's payload value. Searches whose filter
+    pins the shard field go to that shard only; the rest fan out in parallel and
+    merge top-k by score (all collections use cosine similarity, higher is better).
+    """
+
+    def __init__(self, store: VectorStore, policies: Dict[str, ShardPolicy], max_workers: int = 8):
+        self.store = store
+        self.policies = policies
+        # VectorService checks this to avoid threads on the embedded (non thread-safe) client
+        self._client = getattr(store, '_client', None)
+        self.max_workers = 1 if isinstance(self._client, QdrantLocal) else max(1, max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def close(self, **kwargs):
+        self._executor.shutdown(wait=False)
+        if hasattr(self.store, 'close'):
+            self.store.close(**kwargs)
+
+    def _policy(self, name: str) -> Optional[ShardPolicy]:
+        for alias, policy in self.policies.items():
+            # The version may hold single underscores but never the shard separator, so a
+            # physical shard name (jobs_v1__engineering) is not mistaken for a collection
+            if name == alias or re.fullmatch(rf"{re.escape(alias)}_v[A-Za-z0-9]+(?:_[A-Za-z0-9]+)*", name):
+                return policy
+        return None
+
+    @staticmethod
+    def _shard(name: str, shard: str) -> str:
+        return f"{name}{SHARD_SEPARATOR}{shard}"
+
+    def _logical(self, physical: str) -> str:
+        """Logical collection/alias name for a physical one"""
+        name, _, shard = physical.rpartition(SHARD_SEPARATOR)
+        policy = self._policy(name) if name else None
+        return name if policy and shard in policy.shards else physical
+
+    def _fan_out(self, calls: List) -> List:
+        """Run zero-argument calls on the shard pool; results in call order"""
+        if len(calls) == 1 or self.max_workers == 1:
+            return [call() for call in calls]
+        return list(self._executor.map(lambda call: call(), calls))
+
+    def _each_shard(self, collection_name: str, method: str, *args, **kwargs) -> List:
+        """Apply a store method to every shard of a sharded collection"""
+        shards = self._policy(collection_name).shards
+        return self._fan_out([
+            partial(getattr(self.store, method), self._shard(collection_name, shard), *args, **kwargs)
+            for shard in shards
+        ])
+
+    # Collections and aliases
+
+    def get_collections(self) -> CollectionsResponse:
+        names = {self._logical(collection.name) for collection in self.store.get_collections().collections}
+        return CollectionsResponse(collections=[CollectionDescription(name=name) for name in sorted(names)])
+
+    def get_collection(self, collection_name: str) -> CollectionInfo:
+        if not self._policy(collection_name):
+            return self.store.get_collection(collection_name)
+
+        infos = self._each_shard(collection_name, 'get_collection')
+        totals = {
+            field: sum(getattr(info, field) or 0 for info in infos)
+            for field in ('vectors_count', 'indexed_vectors_count', 'points_count', 'segments_count')
+        }
+        return infos[0].model_copy(update=totals)
+
+    def create_collection(self, collection_name: str, vectors_config, **kwargs) -> bool:
+        if not self._policy(collection_name):
+            return self.store.create_collection(collection_name, vectors_config, **kwargs)
+        return all(self._each_shard(collection_name, 'create_collection', vectors_config, **kwargs))
+
+    def update_collection(self, collection_name: str, **kwargs) -> bool:
+        if not self._policy(collection_name):
+            return self.store.update_collection(collection_name, **kwargs)
+        return all(self._each_shard(collection_name, 'update_collection', **kwargs))
+
+    def delete_collection(self, collection_name: str, **kwargs) -> bool:
+        policy = self._policy(collection_name)
+        if not policy:
+            return self.store.delete_collection(collection_name, **kwargs)
+
+        # Whatever exists: the shards, or an unsharded collection from before sharding was enabled
+        existing = {collection.name for collection in self.store.get_collections().collections}
+        targets = [name for name in [collection_name] + [self._shard(collection_name, shard) for shard in policy.shards]
+                   if name in existing]
+        return all(self._fan_out([partial(self.store.delete_collection, name, **kwargs) for name in targets]))
+
+    def get_aliases(self, **kwargs) -> CollectionsAliasesResponse:
+        aliases = {
+            (self._logical(alias.alias_name), self._logical(alias.collection_name))
+            for alias in self.store.get_aliases(**kwargs).aliases
+        }
+        return CollectionsAliasesResponse(aliases=[
+            AliasDescription(alias_name=alias_name, collection_name=collection_name)
+            for alias_name, collection_name in sorted(aliases)
+        ])
+
+    def update_collection_aliases(self, change_aliases_operations: List, **kwargs) -> bool:
+        """Expand operations on sharded aliases to every shard; still applied atomically"""
+        existing = {alias.alias_name for alias in self.store.get_aliases().aliases}
+        operations = []
+
+        for operation in change_aliases_operations:
+            if isinstance(operation, CreateAliasOperation) and self._policy(operation.create_alias.alias_name):
+                create = operation.create_alias
+                operations.extend(
+                    CreateAliasOperation(create_alias=CreateAlias(
+                        collection_name=self._shard(create.collection_name, shard),
+                        alias_name=self._shard(create.alias_name, shard)
+                    ))
+                    for shard in self._policy(create.alias_name).shards
+                )
+            elif isinstance(operation, DeleteAliasOperation) and self._policy(operation.delete_alias.alias_name):
+                alias_name = operation.delete_alias.alias_name
+                # The shard aliases, or the single alias used before sharding was enabled
+                names = [alias_name] + [self._shard(alias_name, shard) for shard in self._policy(alias_name).shards]
+                operations.extend(
+                    DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=name))
+                    for name in names if name in existing
+                )
+            elif isinstance(operation, RenameAliasOperation) and self._policy(operation.rename_alias.old_alias_name):
+                rename = operation.rename_alias
+                operations.extend(
+                    RenameAliasOperation(rename_alias=RenameAlias(
+                        old_alias_name=self._shard(rename.old_alias_name, shard),
+                        new_alias_name=self._shard(rename.new_alias_name, shard)
+                    ))
+                    for shard in self._policy(rename.old_alias_name).shards
+                )
+            else:
+                operations.append(operation)
+
+        return self.store.update_collection_aliases(change_aliases_operations=operations, **kwargs)
+
+    def create_payload_index(self, collection_name: str, field_name: str, field_schema=None, **kwargs):
+        if not self._policy(collection_name):
+            return self.store.create_payload_index(collection_name, field_name, field_schema, **kwargs)
+        return self._each_shard(collection_name, 'create_payload_index', field_name, field_schema, **kwargs)[0]
+
+    def delete_payload_index(self, collection_name: str, field_name: str, **kwargs):
+        if not self._policy(collection_name):
+            return self.store.delete_payload_index(collection_name, field_name, **kwargs)
+        return self._each_shard(collection_name, 'delete_payload_index', field_name, **kwargs)[0]
+
+    # Points
+
+    def upsert(self, collection_name: str, points, shard_may_change: bool = False, **kwargs) -> UpdateResult:
+        """
+        Write each point to the shard of its payload value
+        Pass shard_may_change=True when points may already exist under another shard
+        value; only then are their IDs deleted from the other shards
+        """
+        policy = self._policy(collection_name)
+        if not policy:
+            return self.store.upsert(collection_name, points, **kwargs)
+
+        by_shard = {}
+        for point in points:
+            by_shard.setdefault(policy.shard_for((point.payload or {}).get(policy.field)), []).append(point)
+
+        results = self._fan_out([
+            partial(self.store.upsert, self._shard(collection_name, shard), shard_points, **kwargs)
+            for shard, shard_points in by_shard.items()
+        ])
+
+        if not shard_may_change:
+            return results[0] if results else self._completed()
+
+        # A point whose shard value changed must not survive in its old shard
+        self._fan_out([
+            partial(self.store.delete, self._shard(collection_name, shard),
+                    points_selector=self._ids_selector([point.id for other, shard_points in by_shard.items()
+                                                        if other != shard for point in shard_points]), **kwargs)
+            for shard in policy.shards if set(by_shard) - {shard}
+        ])
+
+        return results[0] if results else self._completed()
+
+    def retrieve(self, collection_name: str, ids: List, with_payload=True, with_vectors=False,
+                 **kwargs) -> List[Record]:
+        if not self._policy(collection_name):
+            return self.store.retrieve(collection_name, ids, with_payload=with_payload,
+                                       with_vectors=with_vectors, **kwargs)
+
+        order = {str(point_id): position for position, point_id in enumerate(ids)}
+        records = [record for shard_records in self._each_shard(collection_name, 'retrieve', ids,
+                                                                with_payload=with_payload,
+                                                                with_vectors=with_vectors, **kwargs)
+                   for record in shard_records]
+        return sorted(records, key=lambda record: order.get(str(record.id), len(order)))
+
+    def delete(self, collection_name: str, points_selector, **kwargs) -> UpdateResult:
+        if not self._policy(collection_name):
+            return self.store.delete(collection_name, points_selector, **kwargs)
+        if not isinstance(points_selector, (FilterSelector, Filter)):
+            # Each ID lives in one shard; a filter skips the shards that don't hold it
+            ids = points_selector.points if isinstance(points_selector, PointIdsList) else list(points_selector)
+            points_selector = self._ids_selector(ids)
+        return self._each_shard(collection_name, 'delete', points_selector, **kwargs)[0]
+
+    @staticmethod
+    def _ids_selector(ids: List) -> FilterSelector:
+        return FilterSelector(filter=Filter(must=[HasIdCondition(has_id=list(ids))]))
+
+    def set_payload(self, collection_name: str, payload: Dict, points, **kwargs) -> UpdateResult:
+        if not self._policy(collection_name):
+            return self.store.set_payload(collection_name, payload, points, **kwargs)
+        return self._update_payload(collection_name, payload, points, overwrite=False, **kwargs)
+
+    def overwrite_payload(self, collection_name: str, payload: Dict, points, **kwargs) -> UpdateResult:
+        if not self._policy(collection_name):
+            return self.store.overwrite_payload(collection_name, payload, points, **kwargs)
+        return self._update_payload(collection_name, payload, points, overwrite=True, **kwargs)
+
+    def _update_payload(self, collection_name: str, payload: Dict, points, overwrite: bool,
+                        **kwargs) -> UpdateResult:
+        """Update payloads in place, moving points whose new shard value belongs to another shard"""
+        policy = self._policy(collection_name)
+        method = 'overwrite_payload' if overwrite else 'set_payload'
+        may_move = overwrite or policy.field in payload
+
+        if isinstance(points, (FilterSelector, Filter)):
+            if may_move:
+                raise ValueError(f"Cannot change sharded field {policy.field} by filter")
+            return self._each_shard(collection_name, method, payload, points, **kwargs)[0]
+
+        ids = points.points if isinstance(points, PointIdsList) else list(points)
+        located = dict(zip(policy.shards, self._each_shard(collection_name, 'retrieve', ids,
+                                                           with_payload=may_move, with_vectors=may_move)))
+        found = {str(record.id) for records in located.values() for record in records}
+        missing = [point_id for point_id in ids if str(point_id) not in found]
+        if missing:
+            raise ValueError(f"No point with id {missing[0]} in {collection_name}")
+
+        calls = []
+        for shard, records in located.items():
+            moving = []
+            if may_move:
+                for record in records:
+                    new_payload = dict(payload) if overwrite else {**(record.payload or {}), **payload}
+                    target = policy.shard_for(new_payload.get(policy.field))
+                    if target != shard:
+                        moving.append(record.id)
+                        calls.append(partial(self._move, collection_name, shard, target,
+                                             PointStruct(id=record.id, vector=record.vector, payload=new_payload)))
+            staying = [record.id for record in records if record.id not in moving]
+            if staying:
+                calls.append(partial(getattr(self.store, method), self._shard(collection_name, shard),
+                                     payload, staying, **kwargs))
+
+        self._fan_out(calls)
+        return self._completed()
+
+    def _move(self, collection_name: str, source: str, target: str, point: PointStruct):
+        self.store.upsert(self._shard(collection_name, target), [point], wait=True)
+        self.store.delete(self._shard(collection_name, source), points_selector=[point.id], wait=True)
+
+    def scroll(self, collection_name: str, scroll_filter: Optional[Filter] = None, limit: int = 10,
+               offset=None, with_payload=True, with_vectors=False, **kwargs) -> Tuple[List[Record], Optional[str]]:
+        """Shards are scrolled one after another; offsets are (shard, offset) pairs"""
+        policy = self._policy(collection_name)
+        if not policy:
+            return self.store.scroll(collection_name, scroll_filter, limit, offset, with_payload,
+                                     with_vectors, **kwargs)
+
+        shards = policy.route(scroll_filter)
+        position, inner = (shards.index(offset[0]), offset[1]) if offset is not None else (0, None)
+        records = []
+
+        while position < len(shards) and len(records) < limit:
+            page, inner = self.store.scroll(self._shard(collection_name, shards[position]), scroll_filter,
+                                            limit - len(records), inner, with_payload, with_vectors, **kwargs)
+            records.extend(page)
+            if inner is None:
+                position += 1
+
+        return records, ((shards[position], inner) if position < len(shards) else None)
+
+    def count(self, collection_name: str, count_filter: Optional[Filter] = None, exact: bool = True,
+              **kwargs) -> CountResult:
+        policy = self._policy(collection_name)
+        if not policy:
+            return self.store.count(collection_name, count_filter, exact, **kwargs)
+
+        counts = self._fan_out([
+            partial(self.store.count, self._shard(collection_name, shard), count_filter, exact, **kwargs)
+            for shard in policy.route(count_filter)
+        ])
+        return CountResult(count=sum(result.count for result in counts))
+
+    # Search
+
+    def search(self, collection_name: str, query_vector, query_filter: Optional[Filter] = None,
+               search_params=None, limit: int = 10, offset: int = 0, with_payload=True,
+               with_vectors=False, score_threshold: Optional[float] = None, **kwargs) -> List[ScoredPoint]:
+        policy = self._policy(collection_name)
+        shards = policy.route(query_filter) if policy else []
+        if len(shards) == 1:
+            collection_name = self._shard(collection_name, shards[0])
+        if len(shards) <= 1:
+            return self.store.search(collection_name, query_vector, query_filter, search_params, limit,
+                                     offset, with_payload, with_vectors, score_threshold, **kwargs)
+
+        # Every shard's top offset+limit, merged
+        offset = offset or 0
+        results = self._fan_out([
+            partial(self.store.search, self._shard(collection_name, shard), query_vector, query_filter,
+                    search_params, offset + limit, 0, with_payload, with_vectors, score_threshold, **kwargs)
+            for shard in shards
+        ])
+        return self._merge_hits(results)[offset:offset + limit]
+
+    def search_batch(self, collection_name: str, requests: List[SearchRequest], **kwargs) -> List[List[ScoredPoint]]:
+        policy = self._policy(collection_name)
+        if not policy:
+            return self.store.search_batch(collection_name, requests, **kwargs)
+
+        routes = [policy.route(request.filter) for request in requests]
+        by_shard = {}
+        for position, (request, shards) in enumerate(zip(requests, routes)):
+            if len(shards) > 1:
+                request = request.model_copy(update={'limit': (request.offset or 0) + request.limit, 'offset': 0})
+            for shard in shards:
+                by_shard.setdefault(shard, []).append((position, request))
+
+        shard_results = self._fan_out([
+            partial(self.store.search_batch, self._shard(collection_name, shard),
+                    [request for _, request in entries], **kwargs)
+            for shard, entries in by_shard.items()
+        ])
+
+        hits = [[] for _ in requests]
+        for entries, results in zip(by_shard.values(), shard_results):
+            for (position, _), result in zip(entries, results):
+                hits[position].append(result)
+
+        merged = []
+        for request, shards, results in zip(requests, routes, hits):
+            if len(shards) == 1:
+                merged.append(results[0])
+            else:
+                offset = request.offset or 0
+                merged.append(self._merge_hits(results)[offset:offset + request.limit])
+        return merged
+
+    def search_groups(self, collection_name: str, query_vector, group_by: str,
+                      query_filter: Optional[Filter] = None, search_params=None, limit: int = 10,
+                      group_size: int = 1, with_payload=True, with_vectors=False,
+                      score_threshold: Optional[float] = None, **kwargs) -> GroupsResult:
+        """
+        Fanned-out groups merge exactly: a group's best hit ranks it in the shard
+        holding that hit, so the global top groups are within the shards' top groups
+        """
+        policy = self._policy(collection_name)
+        shards = policy.route(query_filter) if policy else []
+        arguments = (query_vector, group_by, query_filter, search_params, limit, group_size,
+                     with_payload, with_vectors, score_threshold)
+        if len(shards) == 1:
+            collection_name = self._shard(collection_name, shards[0])
+        if len(shards) <= 1:
+            return self.store.search_groups(collection_name, *arguments, **kwargs)
+
+        results = self._fan_out([
+            partial(self.store.search_groups, self._shard(collection_name, shard), *arguments, **kwargs)
+            for shard in shards
+        ])
+
+        groups = {}
+        for result in results:
+            for group in result.groups:
+                if group.id in groups:
+                    groups[group.id] = groups[group.id].model_copy(update={'hits': groups[group.id].hits + group.hits})
+                else:
+                    groups[group.id] = group
+        merged = [group.model_copy(update={'hits': self._merge_hits([group.hits])[:group_size]})
+                  for group in groups.values()]
+        merged.sort(key=lambda group: group.hits[0].score, reverse=True)
+
+        return GroupsResult(groups=merged[:limit])
+
+    @staticmethod
+    def _merge_hits(results: List[List[ScoredPoint]]) -> List[ScoredPoint]:
+        return sorted((hit for hits in results for hit in hits), key=lambda hit: hit.score, reverse=True)
+
+    @staticmethod
+    def _completed() -> UpdateResult:
+        return UpdateResult(operation_id=0, status=UpdateStatus.COMPLETED)
+
+
+def shard_policies_from_env() -> Dict[str, ShardPolicy]:
+    """
+    Sharding policies from JOB_SHARD_FIELD/JOB_SHARDS and RESUME_SHARD_FIELD/RESUME_SHARDS,
+    e.g. JOB_SHARD_FIELD=category JOB_SHARDS=engineering,design,sales
+    """
+    policies = {}
+    for alias, prefix in (('jobs', 'JOB'), ('resumes', 'RESUME')):
+        field = os.getenv(f'{prefix}_SHARD_FIELD')
+        if field:
+            values = [value.strip() for value in os.getenv(f'{prefix}_SHARDS', '').split(',') if value.strip()]
+            policies[alias] = ShardPolicy(field, values)
+    return policies
+
+
+TRANSPORTS = ('rest', 'grpc')
+
+_shared_stores: Dict[Tuple, object] = {}
+_shared_lock = threading.Lock()
+
+
+def _qdrant_client_kwargs(transport: str) -> Dict:
+    """Connection settings shared by the sync and async Qdrant clients"""
+    if transport not in TRANSPORTS:
+        raise ValueError(f"QDRANT_TRANSPORT must be one of {TRANSPORTS}")
+
+    kwargs = {
+        'host': os.getenv('QDRANT_HOST', 'localhost'),
+        'port': int(os.getenv('QDRANT_PORT', 6333)),
+        'grpc_port': int(os.getenv('QDRANT_GRPC_PORT', 6334)),
+        'prefer_grpc': transport == 'grpc',
+        'timeout': int(os.getenv('QDRANT_TIMEOUT', 30))
+    }
+    if os.getenv('QDRANT_API_KEY'):
+        kwargs['api_key'] = os.getenv('QDRANT_API_KEY')
+    if transport == 'grpc':
+        # One long-lived HTTP/2 channel multiplexes every concurrent call
+        kwargs['grpc_options'] = {
+            'grpc.keepalive_time_ms': 30000,
+            'grpc.keepalive_permit_without_calls': 1,
+            'grpc.max_receive_message_length': 64 * 1024 * 1024,
+            'grpc.max_send_message_length': 64 * 1024 * 1024
+        }
+    return kwargs
+
+
+def _shared(key: Tuple, factory):
+    """
+    One store per key per process: every VectorService shares the same connection
+    pool / gRPC channel (or in-process data). Keyed by pid so forked workers never
+    reuse a parent's channel
+    """
+    key = (os.getpid(),) + key
+    with _shared_lock:
+        if key not in _shared_stores:
+            _shared_stores[key] = factory()
+        return _shared_stores[key]
+
+
+def _sharded(key: Tuple, factory):
+    """Shared store for key, wrapped in a ShardedVectorStore when sharding is configured"""
+    policies = shard_policies_from_env()
+    if not policies:
+        return _shared(key, factory)
+
+    key += tuple((alias, policy.field, tuple(policy.values)) for alias, policy in sorted(policies.items()))
+    return _shared(key, lambda: ShardedVectorStore(
+        factory(), policies, max_workers=int(os.getenv('VECTOR_SHARD_PARALLEL', 8))
+    ))
+
+
+def create_vector_store(backend: Optional[str] = None, transport: Optional[str] = None) -> VectorStore:
+    """
+    Build the backend selected by VECTOR_BACKEND (default: qdrant), shared per process
+    For qdrant, QDRANT_TRANSPORT picks REST (default) or gRPC
+    """
+    backend = (backend or os.getenv('VECTOR_BACKEND', 'qdrant')).lower()
+
+    if backend == 'inprocess':
+        path = os.getenv('VECTOR_STORE_PATH') or None
+        return _sharded(('inprocess', path), lambda: InProcessVectorStore(
+            path=path,
+            hnsw_threshold=int(os.getenv('VECTOR_HNSW_THRESHOLD', 20000))
+        ))
+
+    if backend != 'qdrant':
+        raise ValueError(f"Unknown VECTOR_BACKEND: {backend}")
+
+    transport = (transport or os.getenv('QDRANT_TRANSPORT', 'rest')).lower()
+    kwargs = _qdrant_client_kwargs(transport)
+    return _sharded(('qdrant', transport, kwargs['host'], kwargs['port']),
+                    lambda: QdrantVectorStore(**kwargs))
+
+
+class AsyncThreadedVectorStore:
+    """Async facade over a synchronous VectorStore; calls run in the default thread pool"""
+
+    def __init__(self, store: VectorStore):
+        self._store = store
+
+    def __getattr__(self, name):
+        method = getattr(self._store, name)
+
+        async def call(*args, **kwargs):
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+        return call
+
+    async def close(self):
+        pass
+
+
+def create_async_vector_store(backend: Optional[str] = None, transport: Optional[str] = None):
+    """
+    Async counterpart of create_vector_store: an AsyncQdrantClient, or the shared
+    in-process (or sharded) store behind an async facade. Not shared - each event loop owns its client
+    """
+    backend = (backend or os.getenv('VECTOR_BACKEND', 'qdrant')).lower()
+
+    if backend == 'inprocess' or shard_policies_from_env():
+        # Sharding routes in the synchronous wrapper, so sharded stores are used through threads too
+        return AsyncThreadedVectorStore(create_vector_store(backend, transport))
+
+    if backend != 'qdrant':
+        raise ValueError(f"Unknown VECTOR_BACKEND: {backend}")
+
+    transport = (transport or os.getenv('QDRANT_TRANSPORT', 'rest')).lower()
+    return AsyncQdrantClient(**_qdrant_client_kwargs(transport))
+
+
+# Payload filtering (Qdrant semantics)
+
+def _filter_rows(collection: _Collection, query_filter: Filter) -> np.ndarray:
+    """Row mask of a filter, combining one mask per condition"""
+    mask = np.ones(collection.size, dtype=bool)
+    for condition in _as_list(query_filter.must):
+        mask &= _condition_rows(collection, condition)
+    for condition in _as_list(query_filter.must_not):
+        mask &= ~_condition_rows(collection, condition)
+
+    should = _as_list(query_filter.should)
+    if should:
+        matched = np.zeros(collection.size, dtype=bool)
+        for condition in should:
+            matched |= _condition_rows(collection, condition)
+        mask &= matched
+    return mask
+
+
+def _condition_rows(collection: _Collection, condition) -> np.ndarray:
+    if isinstance(condition, Filter):
+        return _filter_rows(collection, condition)
+
+    if isinstance(condition, HasIdCondition):
+        mask = np.zeros(collection.size, dtype=bool)
+        rows = [collection.rows.get(_point_id(value)) for value in condition.has_id]
+        mask[[row for row in rows if row is not None]] = True
+        return mask
+
+    key = condition.is_empty.key if isinstance(condition, IsEmptyCondition) else getattr(condition, 'key', None)
+    field_index = collection.field_indexes.get(key)
+    if field_index is not None and isinstance(condition, (IsEmptyCondition, FieldCondition)):
+        mask = field_index.mask(condition, collection.size, collection.payloads)
+        if mask is not None:
+            return mask
+
+    # Unindexed field (or a condition the index can't answer): check each live payload
+    mask = np.zeros(collection.size, dtype=bool)
+    for row in np.flatnonzero(collection.alive[:collection.size]):
+        mask[row] = _matches_condition(condition, collection.payloads[row], collection.ids[row])
+    return mask
+
+
+def _matches_filter(query_filter: Filter, payload: Dict, point_id) -> bool:
+    must = _as_list(query_filter.must)
+    should = _as_list(query_filter.should)
+    must_not = _as_list(query_filter.must_not)
+
+    if any(not _matches_condition(condition, payload, point_id) for condition in must):
+        return False
+    if any(_matches_condition(condition, payload, point_id) for condition in must_not):
+        return False
+    if should and not any(_matches_condition(condition, payload, point_id) for condition in should):
+        return False
+    return True
+
+
+def _matches_condition(condition, payload: Dict, point_id) -> bool:
+    if isinstance(condition, Filter):
+        return _matches_filter(condition, payload, point_id)
+
+    if isinstance(condition, HasIdCondition):
+        return point_id in {_point_id(value) for value in condition.has_id}
+
+    if isinstance(condition, IsEmptyCondition):
+        return not _payload_values(payload, condition.is_empty.key)
+
+    if isinstance(condition, IsNullCondition):
+        found, value = _payload_lookup(payload, condition.is_null.key)
+        return found and value is None
+
+    if isinstance(condition, FieldCondition):
+        values = _payload_values(payload, condition.key)
+
+        if condition.match is not None:
+            match = condition.match
+            if isinstance(match, MatchValue):
+                return any(_equals(value, match.value) for value in values)
+            if isinstance(match, MatchAny):
+                return any(_equals(value, option) for value in values for option in match.any)
+            if isinstance(match, MatchExcept):
+                excluded = getattr(match, 'except_')
+                return any(not any(_equals(value, option) for option in excluded) for value in values)
+            if isinstance(match, MatchText):
+                return any(isinstance(value, str) and match.text in value for value in values)
+
+        if condition.range is not None:
+            return any(_in_range(value, condition.range) for value in values
+                       if isinstance(value, (int, float)) and not isinstance(value, bool))
+
+        if condition.values_count is not None:
+            return _in_range(len(values), condition.values_count)
+
+    raise ValueError(f"Unsupported filter condition: {condition}")
+
+
+def _payload_lookup(payload: Dict, key: str):
+    value = payload
+    for part in key.split('.'):
+        if not isinstance(value, dict) or part not in value:
+            return False, None
+        value = value[part]
+    return True, value
+
+
+def _payload_values(payload: Dict, key: str) -> List:
+    """Leaf values at a key; arrays match element-wise, null counts as empty"""
+    found, value = _payload_lookup(payload, key)
+    if not found or value is None:
+        return []
+    if isinstance(value, list):
+        return [item for item in value if item is not None]
+    return [value]
+
+
+def _in_range(value, bounds) -> bool:
+    return ((bounds.gt is None or value > bounds.gt) and
+            (bounds.gte is None or value >= bounds.gte) and
+            (bounds.lt is None or value < bounds.lt) and
+            (bounds.lte is None or value <= bounds.lte))
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _index_key(value):
+    """Hashable key under which _equals-equal values meet, or None for unhashable values"""
+    if isinstance(value, (str, int, float)):
+        return isinstance(value, bool), value
+    return None
+
+
+def _equals(value, expected) -> bool:
+    # Keep bools from matching 0/1
+    if isinstance(value, bool) != isinstance(expected, bool):
+        return False
+    return value == expected
+
+
+def _as_list(conditions) -> List:
+    if conditions is None:
+        return []
+    return conditions if isinstance(conditions, list) else [conditions]
+
+
+def _point_id(point_id):
+    """Canonical point ID: ints stay ints, UUID strings are normalised"""
+    if isinstance(point_id, (int, np.integer)):
+        return int(point_id)
+    return str(uuid.UUID(str(point_id)))
+
+
+def _id_sort_key(point_id):
+    # Qdrant orders integer IDs before UUIDs
+    return (1, point_id) if isinstance(point_id, str) else (0, point_id)
+
+
+def _unpack_query(query_vector) -> Tuple[str, List[float]]:
+    if isinstance(query_vector, NamedVector):
+        return query_vector.name, query_vector.vector
+    if isinstance(query_vector, tuple):
+        return query_vector
+    return DEFAULT_VECTOR, query_vector
+
+
+def _normalize(vector: np.ndarray, distance: Distance) -> np.ndarray:
+    if distance != Distance.COSINE:
+        return vector
+    if vector.ndim == 1:
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    norms = np.linalg.norm(vector, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vector / norms
+
+
+def _passes_threshold(score: float, threshold: float, distance: Distance) -> bool:
+    if distance == Distance.EUCLID:
+        return score <= threshold
+    return score >= threshold
@@ -1,52 +1,58 @@
 from celery_app import celery
 from services.job_matcher import JobMatcher
 from services.vector_service import VectorService
-from models import Job
+from services.resume_parser import ResumeParser
+from services.match_store import MatchStore
+from models import db, Job, User
+from bson import ObjectId
+from typing import Dict, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
 vector_service = VectorService()
 job_matcher = JobMatcher(vector_service)
+resume_parser = ResumeParser()
 
 
 @celery.task(name='tasks.generate_job_matches')
-def generate_job_matches(job_id: str, limit: int = 50):
+def generate_job_matches(job_id: str, limit: Optional[int] = None):
     """
-    Generate candidate matches for a newly posted job
+    Generate candidate matches for a newly posted job and store them in job_matches
     """
     try:
         logger.info(f"Generating matches for job: {job_id}")
 
         # Get job
-        job = Job.query.get(job_id)
+        job = Job.from_mongo(db.jobs.find_one({'id': job_id}))
         if not job:
             return {'success': False, 'error': 'Job not found'}
 
-        # Generate job embedding
-        job_data = {
-            'title': job.title,
-            'description': job.description,
-            'required_skills': job.required_skills or [],
-            'preferred_skills': job.preferred_skills or [],
-            'experience_years': job.experience_years,
-            'location': job.location
-        }
-        job_embedding = job_matcher.generate_job_embedding(job_data)
+        match_store = MatchStore(db)
+        job_data = job.to_embedding_data()
+
+        # Use the stored job vector; encode only if the point is missing
+        job_embedding = vector_service.get_job_vector(job.vector_id) if job.vector_id else None
+        if not job_embedding:
+            job_embedding = (job_matcher.generate_job_vectors(job_data) or {}).get(VectorService.DEFAULT_JOB_VECTOR)
+        if not job_embedding:
+            return {'success': False, 'error': 'Failed to generate job embedding'}
 
-        # Find matching candidates
-        matches = job_matcher.match_candidates_for_job(
+        # Same ranking and acceptance as the unfiltered /matching/candidates query
+        page = job_matcher.match_candidates_for_job_page(
             job_data=job_data,
             job_embedding=job_embedding,
-            limit=limit
+            limit=limit or match_store.size,
+            accept=_active_candidates
         )
 
-        logger.info(f"Found {len(matches)} matches for job: {job_id}")
+        stored = match_store.save('job', job_id, page)
+        logger.info(f"Found {len(page['matches'])} matches for job: {job_id}")
 
         return {
-            'success': True,
+            'success': stored,
             'job_id': job_id,
-            'matches_count': len(matches)
+            'matches_count': len(page['matches'])
         }
 
     except Exception as e:
@@ -54,6 +60,66 @@ def generate_job_matches(job_id: str, limit: int = 50):
         return {'success': False, 'error': str(e)}
 
 
+@celery.task(name='tasks.generate_resume_matches')
+def generate_resume_matches(resume_id: str, limit: Optional[int] = None):
+    """
+    Generate job matches for a resume and store them in job_matches
+    """
+    try:
+        logger.info(f"Generating matches for resume: {resume_id}")
+
+        resume = db.resumes.find_one({'_id': ObjectId(resume_id)}) if ObjectId.is_valid(resume_id) else None
+        if not resume:
+            return {'success': False, 'error': 'Resume not found'}
+
+        match_store = MatchStore(db)
+
+        # Use the stored resume vector; encode only if the point is missing
+        resume_embedding = vector_service.get_resume_vector(resume['vector_id']) if resume.get('vector_id') else None
+        if not resume_embedding:
+            resume_embedding = resume_parser.generate_embedding(
+                ResumeParser.build_embedding_text(resume['parsed_data'])
+            )
+        if not resume_embedding:
+            return {'success': False, 'error': 'Failed to generate resume embedding'}
+
+        # Same ranking and acceptance as the unfiltered /matching/jobs query
+        page = job_matcher.match_jobs_for_candidate_page(
+            resume_data=ResumeParser.build_match_data(resume['parsed_data']),
+            resume_embedding=resume_embedding,
+            limit=limit or match_store.size,
+            accept=_existing_jobs,
+            vector=VectorService.DEFAULT_JOB_VECTOR
+        )
+
+        stored = match_store.save('resume', resume_id, page, user_id=resume['user_id'])
+        logger.info(f"Found {len(page['matches'])} matches for resume: {resume_id}")
+
+        return {
+            'success': stored,
+            'resume_id': resume_id,
+            'matches_count': len(page['matches'])
+        }
+
+    except Exception as e:
+        logger.error(f"Error generating resume matches: {e}")
+        return {'success': False, 'error': str(e)}
+
+
+def _active_candidates(hits: List[Dict]) -> List[Dict]:
+    """Hits whose user exists and is active"""
+    active = {doc['id'] for doc in db.users.find(
+        {'id': {'$in': list({hit['user_id'] for hit in hits})}, 'is_active': True}, {'id': 1}
+    )}
+    return [hit for hit in hits if hit['user_id'] in active]
+
+
+def _existing_jobs(hits: List[Dict]) -> List[Dict]:
+    """Hits whose job is still in Mongo and open"""
+    existing = Job.open_jobs(db.jobs, {hit['job_id'] for hit in hits})
+    return [hit for hit in hits if hit['job_id'] in existing]
+
+
 @celery.task(name='tasks.update_job_vector')
 def update_job_vector(job_id: str):
     """
@@ -63,48 +129,36 @@ def update_job_vector(job_id: str):
         logger.info(f"Updating job vector: {job_id}")
 
         # Get job
-        job = Job.query.get(job_id)
+        job = Job.from_mongo(db.jobs.find_one({'id': job_id}))
         if not job:
             return {'success': False, 'error': 'Job not found'}
 
-        # Regenerate embedding
-        job_data = {
-            'title': job.title,
-            'description': job.description,
-            'required_skills': job.required_skills or [],
-            'preferred_skills': job.preferred_skills or [],
-            'experience_years': job.experience_years,
-            'location': job.location
-        }
-        new_embedding = job_matcher.generate_job_embedding(job_data)
+        # Regenerate the named job vectors
+        new_vectors = job_matcher.generate_job_vectors(job.to_embedding_data())
 
         # Update metadata
-        from models import User
-        employer = User.query.get(job.employer_id)
-
-        metadata = {
-            'job_id': job_id,
-            'required_skills': job.required_skills or [],
-            'preferred_skills': job.preferred_skills or [],
-            'experience_years': job.experience_years,
-            'location': job.location,
-            'employment_type': job.employment_type or '',
-            'salary_min': job.salary_min or 0,
-            'salary_max': job.salary_max or 0,
-            'category': job.category or '',
-            'company': employer.company_name if employer else ''
-        }
+        employer = User.from_mongo(db.users.find_one({'id': job.employer_id}))
+        metadata = job.to_vector_metadata(company=employer.company_name if employer else '')
 
-        # Store updated vector
-        vector_service.store_job_vector(
+        # Store updated vector (deterministic ID - replaces the existing point)
+        vector_id = vector_service.store_job_vector(
             job_id=job_id,
-            embedding=new_embedding,
-            metadata=metadata
+            vectors=new_vectors,
+            metadata=metadata,
+            replace=True
         )
 
+        if not vector_id:
+            return {'success': False, 'error': 'Failed to store job vector'}
+
+        if vector_id != job.vector_id:
+            if job.vector_id:
+                vector_service.delete_job_vector(job.vector_id)
+            db.jobs.update_one({'id': job_id}, {'$set': {'vector_id': vector_id}})
+
         logger.info(f"Job vector updated: {job_id}")
 
-        return {'success': True, 'job_id': job_id}
+        return {'success': True, 'job_id': job_id, 'vector_id': vector_id}
 
     except Exception as e:
         logger.error(f"Error updating job vector: {e}")
@@ -61,22 +61,17 @@ def update_resume_vector(user_id: str, resume_id: str):
         if not resume:
             return {'success': False, 'error': 'Resume not found'}
 
-        # Regenerate embedding
-        embedding_text = f"""
-        Skills: {', '.join(resume['parsed_data'].get('skills', []))}
-        """
-        new_embedding = resume_parser.generate_embedding(embedding_text)
+        # Regenerate embedding from the same text upload and update_resume embed
+        new_embedding = resume_parser.generate_embedding(
+            ResumeParser.build_embedding_text(resume['parsed_data'])
+        )
+        if not new_embedding:
+            return {'success': False, 'error': 'Failed to generate embedding'}
 
         # Update in Qdrant
-        metadata = {
-            'user_id': user_id,
-            'skills': resume['parsed_data'].get('skills', []),
-            'experience_years': len(resume['parsed_data'].get('experience', [])),
-            'location': resume['parsed_data'].get('personal_info', {}).get('location', ''),
-            'education_level': '',
-            'job_titles': [],
-            'industries': []
-        }
+        user = mongo_db['users'].find_one({'id': user_id}) or {}
+        metadata = ResumeParser.build_vector_metadata(user_id, resume['parsed_data'], user.get('location', ''))
+        metadata['resume_id'] = resume_id
 
         vector_service.update_resume_vector(
             vector_id=resume['vector_id'],
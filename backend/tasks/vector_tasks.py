@@ -0,0 +1,68 @@
+import os
+from celery_app import celery
+from services.vector_service import VectorService
+from services.reindex_service import ReindexService
+from services.reconcile_service import ReconcileService
+from models import db
+import logging
+
+logger = logging.getLogger(__name__)
+
+vector_service = VectorService()
+
+
+@celery.task(name='tasks.reindex_collections', bind=True)
+def reindex_collections(self, kinds=None, batch_size: int = 64, drop_old: bool = False,
+                        allow_partial: bool = False):
+    """
+    Rebuild vector collections in the background and switch aliases when done
+    Progress is published as task state so callers can poll it
+    Any failed document fails the task; aliases only switch despite failures with allow_partial
+    """
+    try:
+        logger.info(f"Starting vector reindex: {kinds or 'all'}")
+
+        def publish(progress):
+            self.update_state(state='PROGRESS', meta=progress)
+
+        reindex_service = ReindexService(vector_service, db, batch_size=batch_size,
+                                         progress_callback=publish)
+        report = reindex_service.rebuild(kinds=kinds or ReindexService.KINDS, drop_old=drop_old,
+                                         allow_partial=allow_partial)
+
+        if report['failed']:
+            outcome = 'aborted' if report['aborted'] else f"switched to {report['switched']} with old collections kept"
+            logger.error(f"Vector reindex {outcome}: {report['failed']} documents failed")
+            return {'success': False, 'error': f"{report['failed']} documents failed to embed/upsert", **report}
+
+        logger.info(f"Vector reindex completed: {report['switched']}")
+
+        return {'success': True, **report}
+
+    except Exception as e:
+        logger.error(f"Error reindexing vectors: {e}")
+        return {'success': False, 'error': str(e)}
+
+
+@celery.task(name='tasks.reconcile_vectors')
+def reconcile_vectors(kinds=None, repair: bool = None):
+    """
+    Diff Mongo against the vector store; scheduled by Celery beat
+    Repairs drift when repair (or RECONCILE_REPAIR) is set, otherwise only reports it
+    """
+    try:
+        if repair is None:
+            repair = os.getenv('RECONCILE_REPAIR', 'False') == 'True'
+
+        report = ReconcileService(vector_service, db).reconcile(
+            kinds=kinds or ReconcileService.KINDS, repair=repair
+        )
+
+        if report['drift']:
+            logger.warning(f"Vector store drift: {report['drift']} (repair={repair})")
+
+        return {'success': True, **report}
+
+    except Exception as e:
+        logger.error(f"Error reconciling vectors: {e}")
+        return {'success': False, 'error': str(e)}
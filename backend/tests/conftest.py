@@ -0,0 +1,38 @@
+import os
+import zlib
+import pytest
+
+# Run the suite against the in-process vector backend - no Qdrant server needed
+os.environ.setdefault('VECTOR_BACKEND', 'inprocess')
+
+
+@pytest.fixture
+def vector_service(monkeypatch):
+    """VectorService over a fresh in-process store with 3-dim collections"""
+    from services.vector_service import VectorService
+    from services.vector_store import InProcessVectorStore
+
+    monkeypatch.setenv('EMBEDDING_DIMENSION', '3')
+    service = VectorService()
+    service.client = InProcessVectorStore()
+    service.initialize_collections()
+    return service
+
+
+@pytest.fixture
+def fake_embeddings(monkeypatch):
+    """Deterministic 3-dim embeddings instead of the sentence-transformer model"""
+    from services.embedding_engine import embedding_engine
+
+    def encode_many(texts, timeout=None):
+        return [[1.0, (zlib.crc32(text.encode()) % 100) / 100, 0.5] for text in texts]
+
+    monkeypatch.setattr(embedding_engine, 'encode_many', encode_many)
+    return encode_many
+
+
+@pytest.fixture
+def mongo():
+    """In-memory MongoDB database"""
+    mongomock = pytest.importorskip('mongomock')
+    return mongomock.MongoClient().skillbridge
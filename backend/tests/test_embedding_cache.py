@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+from services.embedding_cache import EmbeddingCache
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the Redis tier"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+
+@pytest.fixture
+def redis_tier():
+    return FakeRedis()
+
+
+def cache_with(redis_tier, **kwargs):
+    cache = EmbeddingCache(model_name='test-model', use_redis=True, **kwargs)
+    cache._redis = redis_tier
+    return cache
+
+
+class TestEmbeddingCache:
+    """Test content addressing, the float32 byte round trip and LRU eviction"""
+
+    def test_keys_ignore_whitespace_and_unicode_form(self):
+        """Test texts differing only in whitespace or NFC form share one key, per model"""
+        cache = EmbeddingCache(model_name='test-model', use_redis=False)
+
+        assert cache.key('  Senior   Python\ndeveloper ') == cache.key('Senior Python developer')
+        assert cache.key('Cafe\u0301') == cache.key('Caf\u00e9')
+        assert cache.key('Python') != EmbeddingCache(model_name='other', use_redis=False).key('Python')
+
+    def test_redis_round_trip_is_exact(self, redis_tier):
+        """Test vectors come back from the shared tier as identical float32 arrays"""
+        vector = np.random.default_rng(0).normal(size=768)
+        cache_with(redis_tier).put('python developer', vector)
+
+        raw = next(iter(redis_tier.data.values()))
+        assert len(raw) == 768 * 4
+
+        # A second worker: empty L1, same Redis
+        other = cache_with(redis_tier)
+        cached = other.get('python  developer')
+        assert cached.dtype == np.float32
+        assert np.array_equal(cached, vector.astype(np.float32))
+        assert other.stats()['l2_hits'] == 1
+
+        # The L2 hit was promoted to L1
+        assert other.get('python developer') is not None and other.stats()['l1_hits'] == 1
+
+    def test_lru_evicts_least_recently_used(self):
+        """Test the in-process tier stays bounded and reads refresh an entry's recency"""
+        cache = EmbeddingCache(model_name='test-model', max_entries=2, use_redis=False)
+        cache.put('a', [1.0])
+        cache.put('b', [2.0])
+        assert cache.get('a') is not None
+
+        cache.put('c', [3.0])
+
+        assert cache.get('b') is None
+        assert cache.get('a').tolist() == [1.0] and cache.get('c').tolist() == [3.0]
+        assert cache.stats()['evictions'] == 1 and cache.stats()['size'] == 2
+
+    def test_redis_failure_falls_back_to_miss(self):
+        """Test a broken Redis tier counts an error and backs off instead of raising"""
+        class Broken:
+            def get(self, key):
+                raise ConnectionError('down')
+
+        cache = cache_with(Broken())
+
+        assert cache.get('anything') is None
+        assert cache.stats()['l2_errors'] == 1 and cache._get_redis() is None
+
+    def test_counters_are_exact_under_concurrency(self, redis_tier):
+        """Test request threads and the engine worker sharing a cache never lose counter updates"""
+        from concurrent.futures import ThreadPoolExecutor
+        cache = cache_with(redis_tier, max_entries=0)
+        redis_tier.set(cache.key('stored'), np.ones(3, dtype=np.float32).tobytes())
+
+        def work(i):
+            cache.put(f"text {i}", [0.0, 1.0, 0.0])
+            cache.get('stored')
+            cache.get(f"missing {i}")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(work, range(2000)))
+
+        stats = cache.stats()
+        assert (stats['puts'], stats['l2_hits'], stats['misses']) == (2000, 2000, 2000)
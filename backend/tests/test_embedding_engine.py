@@ -0,0 +1,77 @@
+import threading
+import numpy as np
+import pytest
+from services.embedding_engine import EmbeddingEngine, _EncodeRequest
+
+
+class FakeModel:
+    """Encodes a text as [word count, character count]; records every batch it sees"""
+
+    def __init__(self, fail=False, gate=None):
+        self.fail = fail
+        self.gate = gate
+        self.batches = []
+
+    def encode(self, texts, **kwargs):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.batches.append(list(texts))
+        if self.fail:
+            raise RuntimeError('model exploded')
+        return np.array([[len(text.split()), len(text)] for text in texts], dtype=np.float32)
+
+
+def engine_for(model, **kwargs):
+    return EmbeddingEngine(model_loader=lambda: model, **kwargs)
+
+
+class TestEmbeddingEngine:
+    """Test micro-batching, failure propagation and cancellation"""
+
+    def test_batches_concurrent_requests(self):
+        """Test queued texts are encoded together, shortest first, and each future gets its own vector"""
+        model = FakeModel()
+        engine = engine_for(model, max_batch_size=8, max_wait_ms=1000)
+        requests = [_EncodeRequest(text) for text in ('a b c', 'a', 'a b')]
+
+        engine._process(requests)
+
+        assert model.batches == [['a', 'a b', 'a b c']]
+        assert [request.future.result(0).tolist() for request in requests] == [[3, 5], [1, 1], [2, 3]]
+        assert engine.metrics()['batches'] == 1 and engine.metrics()['avg_batch_size'] == 3
+
+        assert engine.encode_many(['x y', 'x']) == [[2, 3], [1, 1]]
+
+    def test_failures_reach_every_caller(self):
+        """Test a failed forward pass fails each request in the batch and is counted"""
+        engine = engine_for(FakeModel(fail=True), max_wait_ms=0)
+        requests = [_EncodeRequest('a'), _EncodeRequest('b')]
+
+        engine._process(requests)
+
+        for request in requests:
+            with pytest.raises(RuntimeError):
+                request.future.result(0)
+        assert engine.metrics()['failed_texts'] == 2
+        assert engine.encode('c') == []
+
+    def test_cancelled_requests_do_not_break_the_batch(self):
+        """Test requests cancelled by a timed-out caller are skipped and the rest still resolve"""
+        model = FakeModel()
+        engine = engine_for(model)
+        cancelled, kept = _EncodeRequest('gone'), _EncodeRequest('kept')
+        cancelled.future.cancel()
+
+        engine._process([cancelled, kept])
+
+        assert model.batches == [['kept']]
+        assert kept.future.result(0).tolist() == [1, 4]
+        assert engine.metrics()['cancelled_texts'] == 1
+
+    def test_timeout_returns_empty_vector(self):
+        """Test a stalled model makes encode give up after the timeout instead of hanging"""
+        gate = threading.Event()
+        engine = engine_for(FakeModel(gate=gate), max_wait_ms=0, timeout=0.05)
+
+        assert engine.encode('slow') == []
+        gate.set()
@@ -0,0 +1,159 @@
+import random
+import pytest
+from services.job_matcher import JobMatcher
+
+SKILLS = ['Python', 'python', 'SQL', 'Go', 'Rust', 'AWS', 'Docker', 'React', 'java', 'Kubernetes']
+LOCATIONS = ['Nairobi', 'nairobi', 'Mombasa', '']
+
+
+@pytest.fixture
+def matcher():
+    """JobMatcher without a vector store - only the scoring functions are used"""
+    return JobMatcher(vector_service=None)
+
+
+def random_resume(rng):
+    return {
+        'skills': rng.sample(SKILLS, rng.randint(0, 6)),
+        'experience_years': rng.choice([0, 1, 2, 3.5, 5, 8, 15]),
+        'location': rng.choice(LOCATIONS)
+    }
+
+
+def random_job(rng):
+    return {
+        'required_skills': rng.sample(SKILLS, rng.randint(0, 5)),
+        'preferred_skills': rng.sample(SKILLS, rng.randint(0, 3)),
+        'experience_years': rng.choice([0, 2, 3, 7, 20]),
+        'location': rng.choice(LOCATIONS)
+    }
+
+
+def normalized(details):
+    """Skill lists come from sets, so compare them order-independently"""
+    return {key: sorted(value) if isinstance(value, list) else value for key, value in details.items()}
+
+
+class TestBatchScoring:
+    """Test the vectorized scorers against the per-pair functions"""
+
+    def test_jobs_batch_matches_detailed_match(self, matcher):
+        """Test score_jobs_batch returns exactly what _calculate_detailed_match does for each job"""
+        rng = random.Random(0)
+        for _ in range(100):
+            resume = random_resume(rng)
+            jobs = [random_job(rng) for _ in range(rng.randint(0, 40))]
+
+            expected = [normalized(matcher._calculate_detailed_match(resume, job)) for job in jobs]
+            assert [normalized(details) for details in matcher.score_jobs_batch(resume, jobs)] == expected
+
+    def test_candidates_batch_matches_candidate_job_match(self, matcher):
+        """Test score_candidates_batch returns exactly what _calculate_candidate_job_match does"""
+        rng = random.Random(1)
+        for _ in range(100):
+            job = random_job(rng)
+            candidates = [random_resume(rng) for _ in range(rng.randint(0, 40))]
+
+            expected = [matcher._calculate_candidate_job_match(candidate, job) for candidate in candidates]
+            assert matcher.score_candidates_batch(job, candidates) == expected
+
+    def test_edge_cases(self, matcher):
+        """Test no required skills, no job location and a large experience gap"""
+        resume = {'skills': ['Python'], 'experience_years': 1, 'location': 'Nairobi'}
+        jobs = [
+            {'required_skills': [], 'experience_years': 0, 'location': ''},
+            {'required_skills': ['python', 'Go'], 'experience_years': 30, 'location': 'Mombasa'}
+        ]
+
+        open_job, hard_job = matcher.score_jobs_batch(resume, jobs)
+
+        assert open_job['skill_match_percentage'] == 100
+        assert open_job['location_match'] and open_job['overall_score'] == pytest.approx(1.0)
+        assert hard_job['skill_match_percentage'] == pytest.approx(50.0)
+        assert hard_job['missing_skills'] == ['go']
+        assert not hard_job['experience_match'] and not hard_job['location_match']
+        assert hard_job['overall_score'] == pytest.approx(0.5 * 0.5 + 0.3 * 0 + 0.2 * 0.5)
+
+        assert matcher.score_jobs_batch(resume, []) == []
+        assert matcher.score_candidates_batch(jobs[1], []) == []
+
+    def test_rank_uses_batch_scores(self, matcher):
+        """Test ranking vector hits orders them by the batch overall score"""
+        rng = random.Random(2)
+        resume = random_resume(rng)
+        hits = [{'job_id': f"job-{i}", 'score': 0.5, 'payload': random_job(rng)} for i in range(50)]
+
+        ranked = matcher._rank_job_matches(resume, hits, limit=10)
+
+        expected = sorted((matcher._calculate_detailed_match(resume, hit['payload'])['overall_score']
+                           for hit in hits), reverse=True)[:10]
+        assert [match['overall_score'] for match in ranked] == expected
+
+
+def paged_search(hits, calls=None):
+    """Search over a fixed, similarity-ordered hit list; records (offset, size, threshold) per call"""
+    def search(offset, size, score_threshold):
+        if calls is not None:
+            calls.append((offset, size, score_threshold))
+        return hits[offset:offset + size]
+    return search
+
+
+def score_hits(accepted):
+    return [{'job_id': hit['job_id'], 'overall_score': hit['score']} for hit in accepted]
+
+
+class TestMatchPaging:
+    """Test cursor paging with iterative deepening"""
+
+    def test_pages_cover_every_accepted_hit_once(self, matcher):
+        """Test following cursors returns each accepted hit exactly once, each page sorted by score"""
+        rng = random.Random(3)
+        hits = [{'job_id': f"j{i}", 'score': rng.random()} for i in range(50)]
+        accept = lambda window: [hit for hit in window if int(hit['job_id'][1:]) % 3]
+
+        seen, cursor = [], None
+        while True:
+            page = matcher._match_page(paged_search(hits), score_hits, 7, cursor, None, None, accept)
+            scores = [match['overall_score'] for match in page['matches']]
+            assert scores == sorted(scores, reverse=True) and len(scores) <= 7
+            seen.extend(match['job_id'] for match in page['matches'])
+            cursor = page['next_cursor']
+            if not cursor:
+                break
+
+        assert sorted(seen) == sorted(hit['job_id'] for hit in accept(hits))
+
+    def test_dropped_hits_trigger_deeper_windows(self, matcher):
+        """Test a page short of matches fetches doubling windows until it fills, within the budget"""
+        hits = [{'job_id': f"j{i}", 'score': 1.0} for i in range(100)]
+        accept = lambda window: [hit for hit in window if int(hit['job_id'][1:]) >= 30]
+        calls = []
+
+        page = matcher._match_page(paged_search(hits, calls), score_hits, 5, None, None, None, accept)
+
+        assert [size for _, size, _ in calls] == [10, 20, 40]
+        assert [match['job_id'] for match in page['matches']] == ['j30', 'j31', 'j32', 'j33', 'j34']
+        assert page['stats'] == {'fetch_rounds': 3, 'fetched': 70, 'dropped': 30}
+        assert JobMatcher.decode_cursor(page['next_cursor']) == (35, None)
+
+        matcher.fetch_budget = 15
+        short = matcher._match_page(paged_search(hits), score_hits, 5, None, None, None, accept)
+        assert short['matches'] == [] and short['stats']['fetched'] == 15
+        assert JobMatcher.decode_cursor(short['next_cursor']) == (15, None)
+
+    def test_similarity_floor_and_min_score(self, matcher):
+        """Test the similarity floor travels in the cursor and min_score drops low-scoring hits"""
+        hits = [{'job_id': f"j{i}", 'score': i / 10} for i in range(10)]
+        calls = []
+
+        first = matcher._match_page(paged_search(hits, calls), score_hits, 3, None, 0.4, 0.25, None)
+        matcher._match_page(paged_search(hits, calls), score_hits, 3, first['next_cursor'], None, None, None)
+
+        assert {match['job_id'] for match in first['matches']} == {'j3', 'j4', 'j5'}
+        assert [threshold for _, _, threshold in calls] == [0.4, 0.4]
+
+        with pytest.raises(ValueError):
+            JobMatcher.decode_cursor('not-a-cursor')
+        with pytest.raises(ValueError):
+            JobMatcher.decode_cursor(JobMatcher.encode_cursor(-1))
@@ -0,0 +1,197 @@
+import random
+from datetime import datetime
+from types import SimpleNamespace
+import pytest
+from services.job_matcher import JobMatcher
+from services.match_store import MatchStore
+from services.resume_parser import ResumeParser
+
+
+@pytest.fixture
+def matcher():
+    """JobMatcher without a vector store - _match_page gets its own search function"""
+    return JobMatcher(vector_service=None)
+
+
+def live_page(matcher, hits, limit, cursor=None):
+    """One page over a fixed hit list; every third hit is rejected like a deleted job"""
+    def search(offset, size, score_threshold):
+        return hits[offset:offset + size]
+
+    def score(accepted):
+        return [{'job_id': hit['job_id'], 'overall_score': hit['score']} for hit in accepted]
+
+    def accept(window):
+        return [hit for hit in window if int(hit['job_id'][1:]) % 3]
+
+    return matcher._match_page(search, score, limit, cursor, None, None, accept)
+
+
+def all_pages(next_page):
+    pages, cursor = [], None
+    while True:
+        page = next_page(cursor)
+        pages.append([match['job_id'] for match in page['matches']])
+        cursor = page['next_cursor']
+        if not cursor:
+            return pages
+
+
+class TestMatchStorePaging:
+    """Test stored entries reproduce live paging"""
+
+    def test_stored_pages_equal_live_pages(self, matcher):
+        """Test every page cut from a stored entry equals the live page (live may add a trailing empty one)"""
+        rng = random.Random(0)
+        hits = [{'job_id': f"j{i}", 'score': rng.random()} for i in range(60)]
+        store = MatchStore(SimpleNamespace(job_matches=None), size=100)
+        entry = store.build_entry('resume', 'r1', live_page(matcher, hits, store.size))
+
+        assert entry['complete']
+        for limit in (1, 5, 7, 40):
+            live = all_pages(lambda cursor: live_page(matcher, hits, limit, cursor))
+            stored = all_pages(lambda cursor: store.page(entry, cursor, limit))
+            assert stored == (live[:-1] if live[-1] == [] and len(live) > 1 else live)
+
+    def test_partial_entry_defers_to_live(self, matcher):
+        """Test pages beyond a partial entry, and cursors with a similarity floor, are not served"""
+        hits = [{'job_id': f"j{i}", 'score': 1.0} for i in range(60)]
+        store = MatchStore(SimpleNamespace(job_matches=None))
+        entry = store.build_entry('job', 'j1', live_page(matcher, hits, 10))
+
+        assert not entry['complete']
+        first = store.page(entry, None, 10)
+        assert len(first['matches']) == 10 and first['next_cursor']
+        assert store.page(entry, first['next_cursor'], 10) is None
+        assert store.page(entry, JobMatcher.encode_cursor(0, 0.5), 10) is None
+
+        with pytest.raises(ValueError):
+            store.page(entry, 'garbage', 10)
+
+
+class TestStoredJobMatches:
+    """Test pages served from the store through the matching endpoints"""
+
+    @pytest.fixture
+    def client(self, vector_service, fake_embeddings, mongo, monkeypatch):
+        """Matching and jobs endpoints over an in-process store, with five open jobs and four resumes"""
+        from flask import Flask
+        from flask_jwt_extended import JWTManager, create_access_token
+        import api.jobs
+        import api.matching
+        import api.resumes
+        from models import Job, User
+
+        for module in (api.jobs, api.matching):
+            monkeypatch.setattr(module, 'vector_service', vector_service)
+            monkeypatch.setattr(module.job_matcher, 'vector_service', vector_service)
+        monkeypatch.setattr(api.resumes, 'vector_service', vector_service)
+
+        app = Flask(__name__)
+        app.config['JWT_SECRET_KEY'] = 'test'
+        JWTManager(app)
+        app.register_blueprint(api.matching.matching_bp, url_prefix='/api/matching')
+        app.register_blueprint(api.jobs.jobs_bp, url_prefix='/api/jobs')
+        app.register_blueprint(api.resumes.resumes_bp, url_prefix='/api/resumes')
+        app.mongo_db = mongo
+
+        for i in range(5):
+            job = Job({'id': f"job-{i}", 'employer_id': 'employer', 'title': f"Engineer {i}",
+                       'required_skills': ['Python']})
+            job.vector_id = vector_service.store_job_vector(
+                job.id, {name: [1.0, i / 10, 0.0] for name in vector_service.JOB_VECTORS}, job.to_vector_metadata()
+            )
+            mongo.jobs.insert_one(job.to_mongo())
+        mongo.resumes.insert_one({'user_id': 'candidate', 'created_at': datetime.utcnow(),
+                                  'parsed_data': {'skills': ['Python'], 'personal_info': {}}})
+        for i in range(3):
+            user = User({'id': f"user-{i}", 'role': 'candidate', 'first_name': f"Candidate {i}"})
+            mongo.users.insert_one(user.to_mongo())
+            parsed_data = {'skills': ['Python'], 'personal_info': {}}
+            resume_id = str(mongo.resumes.insert_one({'user_id': user.id, 'created_at': datetime.utcnow(),
+                                                      'parsed_data': parsed_data}).inserted_id)
+            vector_service.store_resume_vector(user.id, [1.0, i / 10, 0.0],
+                                               {**ResumeParser.build_vector_metadata(user.id, parsed_data),
+                                                'resume_id': resume_id}, resume_id)
+
+        with app.app_context():
+            tokens = {
+                identity: create_access_token(identity=identity, additional_claims={'role': role})
+                for identity, role in (('candidate', 'candidate'), ('employer', 'employer'), ('user-2', 'candidate'))
+            }
+        headers = {identity: {'Authorization': f"Bearer {token}"} for identity, token in tokens.items()}
+        return app.test_client(), headers
+
+    def test_closed_job_leaves_stored_page(self, client):
+        """Test a job closed after its match entry was stored is no longer served from the store"""
+        client, headers = client
+
+        def matched_jobs():
+            data = client.get('/api/matching/jobs?limit=10', headers=headers['candidate']).get_json()['data']
+            return [match['job']['id'] for match in data['matches']], data['stats']['from_store']
+
+        live, from_store = matched_jobs()
+        assert not from_store and sorted(live) == [f"job-{i}" for i in range(5)]
+        assert matched_jobs() == (live, True)
+
+        assert client.post('/api/jobs/job-2/close', headers=headers['employer']).status_code == 200
+
+        stored, from_store = matched_jobs()
+        assert from_store and stored == [job_id for job_id in live if job_id != 'job-2']
+
+    def test_deactivated_candidate_is_counted_as_dropped(self, client, mongo):
+        """Test a candidate deactivated after the entry was stored is left out of the stored page and counted"""
+        client, headers = client
+
+        def matched_candidates():
+            data = client.get('/api/matching/candidates?job_id=job-0&limit=10',
+                              headers=headers['employer']).get_json()['data']
+            return [match['candidate']['id'] for match in data['matches']], data['stats']
+
+        live, stats = matched_candidates()
+        assert not stats['from_store'] and sorted(live) == ['user-0', 'user-1', 'user-2']
+
+        mongo.users.update_one({'id': 'user-1'}, {'$set': {'is_active': False}})
+
+        stored, stats = matched_candidates()
+        assert stats['from_store'] and stats['dropped'] == 1
+        assert stored == [user_id for user_id in live if user_id != 'user-1']
+
+    def test_deleted_resume_leaves_the_store(self, client, mongo):
+        """Test deleting a resume drops its own entry and its candidate from stored job pages"""
+        client, headers = client
+        resume_id = str(mongo.resumes.find_one({'user_id': 'user-2'})['_id'])
+        store = MatchStore(mongo)
+
+        client.get('/api/matching/jobs', headers=headers['user-2'])
+        candidates = client.get('/api/matching/candidates?job_id=job-0', headers=headers['employer'])
+        assert store.get('resume', resume_id) and 'user-2' in [
+            match['candidate']['id'] for match in candidates.get_json()['data']['matches']
+        ]
+
+        assert client.delete(f"/api/resumes/{resume_id}", headers=headers['user-2']).status_code == 200
+
+        data = client.get('/api/matching/candidates?job_id=job-0', headers=headers['employer']).get_json()['data']
+        assert store.get('resume', resume_id) is None
+        assert data['stats']['from_store'] and data['stats']['dropped'] == 1
+        assert 'user-2' not in [match['candidate']['id'] for match in data['matches']]
+
+
+class TestMatchStoreIndexes:
+    """Test the job_matches TTL index"""
+
+    def test_changed_ttl_is_applied_with_coll_mod(self, mongo, monkeypatch):
+        """Test a new TTL goes through collMod instead of a conflicting create_index"""
+        monkeypatch.setattr(MatchStore, '_indexed', set())
+        MatchStore(mongo, ttl_seconds=3600).ensure_indexes()
+        assert mongo.job_matches.index_information()['created_at_1']['expireAfterSeconds'] == 3600
+
+        commands = []
+        monkeypatch.setattr(mongo, 'command', lambda *args, **kwargs: commands.append((args, kwargs)))
+        monkeypatch.setattr(MatchStore, '_indexed', set())
+        MatchStore(mongo, ttl_seconds=600).ensure_indexes()
+
+        assert commands == [(
+            ('collMod', 'job_matches'),
+            {'index': {'keyPattern': {'created_at': 1}, 'expireAfterSeconds': 600}}
+        )]
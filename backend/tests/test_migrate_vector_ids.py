@@ -0,0 +1,67 @@
+import uuid
+from types import SimpleNamespace
+import pytest
+from models import Job
+from scripts import migrate_vector_ids
+
+
+@pytest.fixture
+def legacy(vector_service, mongo, monkeypatch):
+    """A job and a resume whose only points sit at legacy random IDs"""
+    monkeypatch.setattr(migrate_vector_ids, 'db', mongo)
+
+    job = Job({'id': 'job-1', 'employer_id': 'employer', 'title': 'Engineer'})
+    job_point = vector_service.build_job_point(
+        job.id, {name: [1.0, 0.0, 0.0] for name in vector_service.JOB_VECTORS}, job.to_vector_metadata()
+    )
+    job_point.id = job.vector_id = str(uuid.uuid4())
+    vector_service.client.upsert('jobs', [job_point])
+    mongo.jobs.insert_one(job.to_mongo())
+
+    resume_id = mongo.resumes.insert_one({'user_id': 'candidate'}).inserted_id
+    resume_point = vector_service.build_resume_point('candidate', str(resume_id), [1.0, 0.0, 0.0], {})
+    resume_point.id = str(uuid.uuid4())
+    vector_service.client.upsert('resumes', [resume_point])
+    mongo.resumes.update_one({'_id': resume_id}, {'$set': {'vector_id': resume_point.id}})
+    return vector_service, mongo, job_point.id, resume_point.id
+
+
+def point_ids(vector_service, collection):
+    return {str(point.id) for point in vector_service.iter_points(collection, with_payload=False)}
+
+
+class TestMigrateVectorIds:
+    """Test failed copies keep the vectors they were meant to replace"""
+
+    def test_resumes_are_re_keyed(self, legacy):
+        """Test a resume point moves to its deterministic ID and Mongo follows"""
+        vector_service, mongo, _, old_id = legacy
+
+        stats = migrate_vector_ids.migrate_resumes(vector_service)
+
+        resume = mongo.resumes.find_one({})
+        target_id = vector_service.resume_vector_id('candidate', str(resume['_id']))
+        assert (stats['re_keyed'], stats['failed'], stats['orphans_deleted']) == (1, 0, 1)
+        assert point_ids(vector_service, 'resumes') == {target_id} and resume['vector_id'] == target_id
+
+    def test_failed_resume_copy_keeps_old_point(self, legacy, monkeypatch):
+        """Test a failed store leaves the old point and the Mongo reference to it"""
+        vector_service, mongo, _, old_id = legacy
+        monkeypatch.setattr(vector_service, 'store_resume_vector', lambda **kwargs: None)
+
+        stats = migrate_vector_ids.migrate_resumes(vector_service)
+
+        assert (stats['re_keyed'], stats['failed'], stats['orphans_deleted']) == (0, 1, 0)
+        assert point_ids(vector_service, 'resumes') == {old_id}
+        assert mongo.resumes.find_one({})['vector_id'] == old_id
+
+    def test_failed_job_embedding_keeps_old_point(self, legacy):
+        """Test a job that could not be re-embedded keeps its old point and vector_id"""
+        vector_service, mongo, old_id, _ = legacy
+        job_matcher = SimpleNamespace(generate_job_vectors_many=lambda data: [{} for _ in data])
+
+        stats = migrate_vector_ids.migrate_jobs(vector_service, job_matcher)
+
+        assert (stats['re_stored'], stats['failed'], stats['duplicates_deleted'], stats['orphans_deleted']) == (0, 1, 0, 0)
+        assert point_ids(vector_service, 'jobs') == {old_id}
+        assert mongo.jobs.find_one({'id': 'job-1'})['vector_id'] == old_id
@@ -0,0 +1,62 @@
+import uuid
+import pytest
+from models import Job
+from services.reconcile_service import ReconcileService
+
+
+@pytest.fixture
+def drifted(vector_service, fake_embeddings, mongo):
+    """
+    Jobs with one of each kind of drift: a point whose job was deleted, a point at a
+    legacy random ID, a job with no point and a job whose vector_id is stale
+    """
+    vectors = {name: [1.0, 0.0, 0.0] for name in vector_service.JOB_VECTORS}
+    for job_id in ('job-1', 'job-2', 'job-3', 'deleted'):
+        job = Job({'id': job_id, 'employer_id': 'employer', 'title': job_id})
+        if job_id != 'job-3':
+            job.vector_id = vector_service.store_job_vector(job_id, vectors, job.to_vector_metadata())
+        if job_id != 'deleted':
+            mongo.jobs.insert_one(job.to_mongo())
+
+    legacy_id = str(uuid.uuid4())
+    point = vector_service.build_job_point('job-1', vectors, Job({'id': 'job-1'}).to_vector_metadata())
+    point.id = legacy_id
+    vector_service.client.upsert('jobs', [point])
+    mongo.jobs.update_one({'id': 'job-2'}, {'$set': {'vector_id': legacy_id}})
+    return vector_service, mongo
+
+
+class TestReconcile:
+    """Test diffing and repairing Mongo against the vector store"""
+
+    def test_report_counts_each_kind_of_drift(self, drifted):
+        """Test orphans, missing points and stale refs are counted without changing anything"""
+        vector_service, mongo = drifted
+
+        report = ReconcileService(vector_service, mongo, page_size=2, grace_seconds=0).reconcile(kinds=['jobs'])
+
+        stats = report['kinds']['jobs']
+        assert (stats['orphans'], stats['missing'], stats['stale_refs']) == (2, 1, 1)
+        assert report['drift'] == 4 and stats['deleted'] == stats['re_embedded'] == 0
+        assert stats['points_scanned'] == 4 and stats['documents_scanned'] == 3
+        assert vector_service.client.count('jobs').count == 4
+
+    def test_repair_removes_all_drift(self, drifted):
+        """Test repair deletes orphans, re-embeds missing jobs and fixes refs, leaving no drift"""
+        vector_service, mongo = drifted
+        reconciler = ReconcileService(vector_service, mongo, page_size=2, grace_seconds=0)
+
+        stats = reconciler.reconcile(kinds=['jobs'], repair=True)['kinds']['jobs']
+
+        assert (stats['deleted'], stats['re_embedded'], stats['refs_fixed'], stats['failed']) == (2, 1, 1, 0)
+        assert reconciler.reconcile(kinds=['jobs'])['drift'] == 0
+        assert vector_service.client.count('jobs').count == 3
+        assert mongo.jobs.find_one({'id': 'job-2'})['vector_id'] == vector_service.job_vector_id('job-2')
+
+    def test_recent_points_are_left_alone(self, drifted):
+        """Test points written within the grace period are never counted as orphans"""
+        vector_service, mongo = drifted
+
+        stats = ReconcileService(vector_service, mongo, grace_seconds=300).reconcile(kinds=['jobs'])['kinds']['jobs']
+
+        assert stats['orphans'] == 0 and stats['missing'] == 1
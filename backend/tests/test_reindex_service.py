@@ -0,0 +1,105 @@
+from datetime import datetime
+from models import Job
+from services.reindex_service import ReindexService
+
+
+def seed(mongo):
+    """Three jobs and two resumes, none of them stored as vectors yet"""
+    mongo.users.insert_one({'id': 'employer', 'company_name': 'Acme'})
+    mongo.users.insert_one({'id': 'candidate', 'location': 'Nairobi'})
+    for i in range(3):
+        mongo.jobs.insert_one(Job({'id': f"job-{i}", 'employer_id': 'employer', 'title': f"Engineer {i}",
+                                   'required_skills': ['Python']}).to_mongo())
+    for i in range(2):
+        mongo.resumes.insert_one({'user_id': 'candidate', 'created_at': datetime.utcnow(),
+                                  'parsed_data': {'summary': f"Resume {i}", 'skills': ['Python']}})
+
+
+class TestReindexAliasSwitch:
+    """Test rebuilding collections behind their aliases"""
+
+    def test_rebuild_switches_aliases_after_building(self, vector_service, fake_embeddings, mongo):
+        """Test searches stay on the old collections until every new one is built, then switch at once"""
+        seed(mongo)
+        old = vector_service.get_aliases()
+        aliases_during_build = []
+
+        service = ReindexService(vector_service, mongo, batch_size=2,
+                                 progress_callback=lambda progress: aliases_during_build.append(
+                                     vector_service.get_aliases()))
+        report = service.rebuild(version='2', drop_old=True)
+
+        assert all(aliases == old for aliases in aliases_during_build) and aliases_during_build
+        assert vector_service.get_aliases() == {'jobs': 'jobs_v2', 'resumes': 'resumes_v2'}
+        assert report['previous'] == old
+        assert sorted(report['dropped']) == sorted(old.values())
+        assert not any(vector_service.collection_exists(name) for name in old.values())
+
+        assert report['kinds']['jobs']['processed'] == 3 and report['kinds']['resumes']['processed'] == 2
+        assert vector_service.client.count('jobs').count == 3
+        assert vector_service.client.count('resumes').count == 2
+        assert set(vector_service.client.get_collection('jobs_v2').payload_schema) == \
+            set(vector_service.JOB_PAYLOAD_INDEXES)
+
+        # Mongo documents point at the rebuilt points
+        for doc in mongo.jobs.find():
+            assert doc['vector_id'] == vector_service.job_vector_id(doc['id'])
+
+    def test_rebuild_keeps_old_collections_without_drop(self, vector_service, fake_embeddings, mongo):
+        """Test the previous collections survive a rebuild, so the switch can be rolled back"""
+        seed(mongo)
+        old = vector_service.get_aliases()
+
+        ReindexService(vector_service, mongo).rebuild(kinds=['jobs'], version='2')
+
+        assert vector_service.get_aliases()['jobs'] == 'jobs_v2'
+        assert vector_service.get_aliases()['resumes'] == old['resumes']
+        assert vector_service.collection_exists(old['jobs'])
+
+        vector_service.switch_aliases({'jobs': old['jobs']})
+        assert vector_service.client.count('jobs').count == 0
+
+
+class TestReindexFailures:
+    """Test rebuilds never lose documents silently"""
+
+    def test_failed_documents_abort_the_switch(self, vector_service, fake_embeddings, mongo, monkeypatch):
+        """Test a rebuild with failures keeps the current aliases and collections, even with drop_old"""
+        seed(mongo)
+        old = vector_service.get_aliases()
+        store_bulk = vector_service.store_job_vectors_bulk
+
+        def flaky_store(items, **kwargs):
+            results = store_bulk(items, **kwargs)
+            results[0].update({'success': False, 'error': 'upsert failed'})
+            return results
+
+        monkeypatch.setattr(vector_service, 'store_job_vectors_bulk', flaky_store)
+        report = ReindexService(vector_service, mongo).rebuild(version='2', drop_old=True)
+
+        assert report['aborted'] and report['failed'] == 1 and not report['switched'] and not report['dropped']
+        assert vector_service.get_aliases() == old
+        assert all(vector_service.collection_exists(name) for name in old.values())
+        assert not vector_service.collection_exists('jobs_v2')
+
+        report = ReindexService(vector_service, mongo).rebuild(version='3', drop_old=True, allow_partial=True)
+
+        assert not report['aborted'] and vector_service.get_aliases()['jobs'] == 'jobs_v3'
+        assert not report['dropped'] and vector_service.collection_exists(old['jobs'])
+
+    def test_writes_during_rebuild_are_caught_up(self, vector_service, fake_embeddings, mongo):
+        """Test a job added to Mongo mid-rebuild reaches the new collection after the switch"""
+        seed(mongo)
+
+        def add_job(progress):
+            if progress['kind'] == 'jobs' and not mongo.jobs.find_one({'id': 'job-late'}):
+                mongo.jobs.insert_one(Job({'id': 'job-late', 'employer_id': 'employer',
+                                           'title': 'Late'}).to_mongo())
+
+        report = ReindexService(vector_service, mongo, batch_size=10, progress_callback=add_job).rebuild(
+            kinds=['jobs'], version='2'
+        )
+
+        assert report['kinds']['jobs']['processed'] == 3 and report['kinds']['jobs']['caught_up'] >= 1
+        assert vector_service.client.count('jobs').count == 4
+        assert mongo.jobs.find_one({'id': 'job-late'})['vector_id'] == vector_service.job_vector_id('job-late')
@@ -0,0 +1,166 @@
+import json
+import pytest
+import services.job_matcher
+from services.skill_taxonomy import SkillTaxonomy
+from services.skill_embeddings import SkillEmbeddingIndex
+from services.skill_extractor import SkillExtractor
+from services.job_matcher import JobMatcher
+from services.resume_parser import ResumeParser
+
+
+@pytest.fixture
+def taxonomy(tmp_path):
+    path = tmp_path / 'skills.json'
+    path.write_text(json.dumps({'version': 3, 'skills': [
+        {'id': 1, 'name': 'Node.js', 'aliases': ['nodejs', 'node']},
+        {'id': 2, 'name': 'C++', 'aliases': ['cpp']},
+        {'id': 3, 'name': 'C', 'aliases': [], 'ambiguous': ['c']},
+        {'id': 4, 'name': 'Java', 'aliases': []},
+        {'id': 5, 'name': 'JavaScript', 'aliases': ['js']},
+        {'id': 6, 'name': 'Git', 'aliases': []},
+        {'id': 7, 'name': 'React', 'aliases': []},
+        {'id': 8, 'name': 'React Native', 'aliases': []}
+    ]}))
+    return SkillTaxonomy(path=str(path))
+
+
+class TestSkillTaxonomy:
+    """Test alias normalisation and ID assignment"""
+
+    def test_aliases_share_one_id(self, taxonomy):
+        """Test spellings and aliases of a skill map to its canonical ID"""
+        assert taxonomy.ids_for(['Node.js', 'nodejs', 'NODE JS', 'node']) == [1, 1, 1, 1]
+        assert taxonomy.ids_for(['C', 'c++', 'CPP']) == [3, 2, 2]
+        assert taxonomy.canonical_name('NodeJS') == 'Node.js'
+        assert taxonomy.version == 3 and len(taxonomy) == 8
+
+    def test_unknown_skills_get_stable_ids(self, taxonomy, tmp_path):
+        """Test unknown skills hash to the same ID in every instance, above the dictionary range"""
+        other = SkillTaxonomy(path=str(tmp_path / 'missing.json'))
+
+        skill_id = taxonomy.skill_id('Quantum Basket-Weaving')
+        assert skill_id == other.skill_id('quantum basket weaving')
+        assert not taxonomy.is_known(skill_id)
+        assert taxonomy.canonical_name('Quantum Basket-Weaving') is None
+
+    def test_reload_and_conflicts(self, taxonomy):
+        """Test reload picks up new aliases and conflicting aliases are rejected"""
+        assert not taxonomy.is_known(taxonomy.skill_id('golang'))
+
+        taxonomy.path.write_text(json.dumps({'version': 4, 'skills': [
+            {'id': 9, 'name': 'Go', 'aliases': ['golang']}
+        ]}))
+        taxonomy.reload()
+        assert taxonomy.skill_id('golang') == 9 and taxonomy.version == 4
+
+        taxonomy.path.write_text(json.dumps({'skills': [
+            {'id': 1, 'name': 'Node.js', 'aliases': []},
+            {'id': 2, 'name': 'Node', 'aliases': ['node.js']}
+        ]}))
+        with pytest.raises(ValueError):
+            taxonomy.reload()
+        assert taxonomy.skill_id('golang') == 9
+
+
+class TestSkillExtractor:
+    """Test single-pass keyword extraction from free text"""
+
+    def test_word_boundaries(self, taxonomy):
+        """Test terms only match as whole words and the longest overlapping term wins"""
+        extractor = SkillExtractor(taxonomy)
+
+        text = "Digital native.  Built React   Native apps in JavaScript and node.js; some C++, C and Java. js"
+        assert extractor.extract(text) == ['React Native', 'JavaScript', 'Node.js', 'C++', 'Java']
+        assert extractor.extract("javascripts, gitlab, digital") == []
+        assert extractor.extract("") == []
+
+    def test_rebuilds_after_reload(self, taxonomy):
+        """Test the automaton picks up terms added by a taxonomy reload"""
+        extractor = SkillExtractor(taxonomy)
+        assert extractor.extract("Go and Golang") == []
+
+        taxonomy.path.write_text(json.dumps({'skills': [
+            {'id': 9, 'name': 'Go', 'aliases': ['golang'], 'ambiguous': ['go']}
+        ]}))
+        taxonomy.reload()
+        assert extractor.extract("Go and Golang") == ['Go']
+
+    def test_fallback_parse_uses_taxonomy(self):
+        """Test the fallback parser reports canonical skill names with their IDs"""
+        parser = ResumeParser(api_key=None)
+        parsed = parser.attach_skill_ids(parser.fallback_parse("Digital marketing lead. Skills: nodejs, PostgreSQL"))
+
+        assert parsed['skills'] == ['Digital Marketing', 'Node.js', 'PostgreSQL']
+        assert len(parsed['skill_ids']) == 3
+
+
+class TestSkillIdMatching:
+    """Test the matcher scores skills by taxonomy ID"""
+
+    def test_aliases_match(self):
+        """Test a resume listing 'nodejs' meets a job requiring 'Node.js'"""
+        resume = {'skills': ['nodejs', 'Python'], 'experience_years': 3, 'location': ''}
+        job = {'required_skills': ['Node.js', 'Golang'], 'preferred_skills': ['python3'],
+               'experience_years': 0, 'location': ''}
+
+        details = JobMatcher.score_jobs_batch(resume, [job])[0]
+
+        assert details['skill_match_percentage'] == pytest.approx(50.0)
+        assert details['matched_required_skills'] == ['node.js']
+        assert details['matched_preferred_skills'] == ['python3']
+        assert details['missing_skills'] == ['golang']
+
+    def test_stored_ids_are_used(self):
+        """Test payload ID arrays take precedence over re-normalising the strings"""
+        job = {'required_skills': ['Legacy Name'], 'required_skill_ids': [999], 'location': ''}
+        candidate = {'skills': ['Whatever'], 'skill_ids': [999], 'location': ''}
+
+        assert JobMatcher.score_candidates_batch(job, [candidate])[0]['skill_match_percentage'] == 100
+
+
+class TestSemanticSkillMatching:
+    """Test matching through the precomputed skill-embedding matrix"""
+
+    @pytest.fixture
+    def embeddings(self, taxonomy, tmp_path, monkeypatch):
+        """Index where JavaScript sits next to Node.js and React next to React Native"""
+        basis = {'Node.js': [1, 0, 0, 0], 'JavaScript': [0.9, 0.3, 0, 0], 'React': [0, 0, 1, 0],
+                 'React Native': [0, 0, 0.8, 0.6]}
+
+        def encode(names):
+            return [basis.get(name, [0, 1, 0, 0] if name == 'Java' else [0, 0, 0, 1]) for name in names]
+
+        index = SkillEmbeddingIndex(path=str(tmp_path / 'skills.npy'), threshold=0.9, taxonomy=taxonomy)
+        index.build(encode, batch_size=3)
+        monkeypatch.setattr(services.job_matcher, 'skill_taxonomy', taxonomy)
+        monkeypatch.setattr(services.job_matcher, 'skill_embeddings', index)
+        return index
+
+    def test_build_and_neighbours(self, embeddings):
+        """Test the memmapped matrix is normalised and neighbours respect the threshold"""
+        assert embeddings.enabled
+        assert embeddings.similarity(1, 1) == pytest.approx(1.0)
+        assert embeddings.neighbours([1, 7, 12345]) == {1: {1, 5}, 7: {7}, 12345: {12345}}
+        assert embeddings.expand([5]) == {1, 5}
+
+    def test_scorers_match_similar_skills(self, embeddings):
+        """Test both batch scorers count similar skills as matched and agree with the per-pair code"""
+        matcher = JobMatcher(vector_service=None)
+        resume = {'skills': ['JavaScript', 'React'], 'experience_years': 2, 'location': ''}
+        job = {'required_skills': ['node', 'React Native', 'Java'], 'experience_years': 0, 'location': ''}
+
+        details = matcher.score_jobs_batch(resume, [job])[0]
+        assert details['matched_required_skills'] == ['node']
+        assert details['missing_skills'] == ['react native', 'java']
+        assert details == matcher._calculate_detailed_match(resume, job)
+
+        candidate = matcher.score_candidates_batch(job, [resume])[0]
+        assert candidate['skill_match_percentage'] == pytest.approx(100 / 3)
+        assert candidate == matcher._calculate_candidate_job_match(resume, job)
+
+    def test_missing_file_matches_exactly(self, taxonomy, tmp_path):
+        """Test an unbuilt index leaves every skill matching only itself"""
+        index = SkillEmbeddingIndex(path=str(tmp_path / 'missing.npy'), taxonomy=taxonomy)
+
+        assert not index.enabled
+        assert index.expand([1, 2]) == {1, 2}
@@ -0,0 +1,306 @@
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+from qdrant_client.models import (
+    CreateAlias, CreateAliasOperation, DeleteAlias, DeleteAliasOperation, Distance,
+    FieldCondition, Filter, IsEmptyCondition, MatchAny, MatchValue, PayloadField, PayloadSchemaType,
+    PointStruct, Range, SearchParams, VectorParams
+)
+from services import vector_store
+from services.vector_store import InProcessVectorStore, ShardedVectorStore, ShardPolicy
+from services.vector_service import VectorService
+from models import Job
+
+
+@pytest.fixture
+def store():
+    """Empty in-process store with a small cosine collection"""
+    store = InProcessVectorStore()
+    store.create_collection('items', VectorParams(size=3, distance=Distance.COSINE))
+    store.upsert('items', [
+        PointStruct(id=1, vector=[1.0, 0.0, 0.0], payload={'city': 'Nairobi', 'salary': 100, 'tags': ['python', 'sql']}),
+        PointStruct(id=2, vector=[0.9, 0.1, 0.0], payload={'city': 'Mombasa', 'salary': 300, 'deadline': None}),
+        PointStruct(id=3, vector=[0.0, 1.0, 0.0], payload={'city': 'Nairobi', 'salary': 200, 'deadline': 50}),
+        PointStruct(id=4, vector=[0.0, 0.0, 1.0], payload={'city': 'Kisumu', 'tags': ['go']})
+    ])
+    return store
+
+
+class TestInProcessVectorStore:
+    """Test the in-process vector backend"""
+
+    def test_search_orders_by_similarity(self, store):
+        """Test cosine search returns nearest points first"""
+        hits = store.search('items', [1.0, 0.0, 0.0], limit=3)
+
+        assert [hit.id for hit in hits] == [1, 2, 3]
+        assert hits[0].score == pytest.approx(1.0)
+
+    def test_payload_filters(self, store):
+        """Test must/should/range/array conditions follow Qdrant semantics"""
+        nairobi = Filter(must=[FieldCondition(key='city', match=MatchValue(value='Nairobi'))])
+        assert {hit.id for hit in store.search('items', [1.0, 1.0, 1.0], query_filter=nairobi)} == {1, 3}
+
+        salary = Filter(must=[FieldCondition(key='salary', range=Range(gte=200))])
+        assert {hit.id for hit in store.search('items', [1.0, 1.0, 1.0], query_filter=salary)} == {2, 3}
+
+        tags = Filter(must=[FieldCondition(key='tags', match=MatchAny(any=['sql', 'go']))])
+        assert {hit.id for hit in store.search('items', [1.0, 1.0, 1.0], query_filter=tags)} == {1, 4}
+
+        # Missing or null deadline, or one that hasn't passed
+        deadline = Filter(should=[
+            IsEmptyCondition(is_empty=PayloadField(key='deadline')),
+            FieldCondition(key='deadline', range=Range(gte=100))
+        ])
+        assert {hit.id for hit in store.search('items', [1.0, 1.0, 1.0], query_filter=deadline)} == {1, 2, 4}
+
+    def test_indexed_filters_agree_with_payload_scan(self):
+        """Test payload-indexed fields filter exactly like the payload scan, through updates and deletes"""
+        rng = np.random.default_rng(1)
+        indexed, scanned = InProcessVectorStore(), InProcessVectorStore()
+        for target in (indexed, scanned):
+            target.create_collection('items', VectorParams(size=2, distance=Distance.COSINE))
+        for field, schema in (('status', PayloadSchemaType.KEYWORD), ('deadline', PayloadSchemaType.FLOAT),
+                              ('skill_ids', PayloadSchemaType.INTEGER)):
+            indexed.create_payload_index('items', field, schema)
+
+        def payload(i):
+            return {'status': ['active', 'closed'][i % 2] if i % 5 else None,
+                    'deadline': float(rng.integers(0, 100)) if i % 3 else None,
+                    'skill_ids': rng.integers(0, 8, size=i % 4).tolist()}
+
+        points = [PointStruct(id=i, vector=[1.0, float(i)], payload=payload(i)) for i in range(200)]
+        for target in (indexed, scanned):
+            target.upsert('items', points)
+            target.set_payload('items', {'status': 'active'}, points=[1, 2, 3])
+            target.overwrite_payload('items', {'deadline': 10}, points=[4])
+            target.delete('items', points_selector=list(range(150, 180)))
+
+        filters = [
+            Filter(must=[FieldCondition(key='status', match=MatchValue(value='active'))], should=[
+                IsEmptyCondition(is_empty=PayloadField(key='deadline')),
+                FieldCondition(key='deadline', range=Range(gte=50))
+            ]),
+            Filter(must=[FieldCondition(key='skill_ids', match=MatchAny(any=[1, 6]))],
+                   must_not=[FieldCondition(key='skill_ids', range=Range(lt=2))]),
+            Filter(must_not=[FieldCondition(key='status', match=MatchValue(value='closed'))])
+        ]
+        for query_filter in filters:
+            assert indexed.count('items', query_filter).count == scanned.count('items', query_filter).count
+            assert ({hit.id for hit in indexed.search('items', [1.0, 1.0], query_filter=query_filter, limit=200)} ==
+                    {hit.id for hit in scanned.search('items', [1.0, 1.0], query_filter=query_filter, limit=200)})
+
+    def test_tombstones_are_compacted(self):
+        """Test replaced points stop taking rows once deletes pass the vacuum ratio"""
+        store = InProcessVectorStore(vacuum_min_deleted=10)
+        store.create_collection('items', VectorParams(size=2, distance=Distance.COSINE))
+        store.create_payload_index('items', 'status', PayloadSchemaType.KEYWORD)
+        for version in range(5):
+            store.upsert('items', [PointStruct(id=i, vector=[1.0, float(version)], payload={'status': f"v{version}"})
+                                   for i in range(40)])
+
+        collection = store._get('items')
+        assert collection.size <= 40 * 1.25 and collection.points_count == 40
+        latest = Filter(must=[FieldCondition(key='status', match=MatchValue(value='v4'))])
+        assert store.count('items', latest).count == 40
+        assert store.retrieve('items', [7], with_vectors=True)[0].vector == pytest.approx([0.243, 0.970], abs=1e-3)
+
+    def test_search_groups_keeps_best_per_group(self, store):
+        """Test grouped search returns one best point per payload value"""
+        result = store.search_groups('items', [1.0, 0.0, 0.0], group_by='city', limit=2)
+
+        assert [(group.id, [hit.id for hit in group.hits]) for group in result.groups] == [
+            ('Nairobi', [1]), ('Mombasa', [2])
+        ]
+
+    def test_payload_updates_and_delete(self, store):
+        """Test set/overwrite payload and delete"""
+        store.set_payload('items', {'status': 'closed'}, points=[1])
+        store.overwrite_payload('items', {'city': 'Nakuru'}, points=[2])
+        store.delete('items', points_selector=[4])
+
+        records = {record.id: record.payload for record in store.retrieve('items', [1, 2, 4])}
+        assert records[1]['status'] == 'closed' and records[1]['city'] == 'Nairobi'
+        assert records[2] == {'city': 'Nakuru'}
+        assert 4 not in records
+        assert store.count('items').count == 3
+
+        with pytest.raises(ValueError):
+            store.set_payload('items', {'status': 'closed'}, points=[99])
+
+    def test_aliases_switch_atomically(self, store):
+        """Test alias operations apply together or not at all"""
+        store.create_collection('items_v2', VectorParams(size=3, distance=Distance.COSINE))
+        store.update_collection_aliases(change_aliases_operations=[
+            CreateAliasOperation(create_alias=CreateAlias(collection_name='items', alias_name='live'))
+        ])
+
+        with pytest.raises(ValueError):
+            store.update_collection_aliases(change_aliases_operations=[
+                DeleteAliasOperation(delete_alias=DeleteAlias(alias_name='live')),
+                CreateAliasOperation(create_alias=CreateAlias(collection_name='missing', alias_name='live'))
+            ])
+
+        assert store.count('live').count == 4
+
+    def test_scroll_pages_through_all_points(self, store):
+        """Test scroll visits every point once, in ID order"""
+        seen, offset = [], None
+        while True:
+            records, offset = store.scroll('items', limit=3, offset=offset)
+            seen.extend(record.id for record in records)
+            if offset is None:
+                break
+
+        assert seen == [1, 2, 3, 4]
+
+    def test_save_and_load(self, store, tmp_path):
+        """Test a saved store reloads with identical search results"""
+        store.path = str(tmp_path)
+        store.save()
+
+        reloaded = InProcessVectorStore(path=str(tmp_path))
+
+        assert reloaded.count('items').count == 4
+        assert ([hit.id for hit in reloaded.search('items', [0.5, 0.5, 0.0])] ==
+                [hit.id for hit in store.search('items', [0.5, 0.5, 0.0])])
+
+    def test_sharded_store_routes_and_merges(self, store):
+        """Test sharded search matches the unsharded store and points move with their shard value"""
+        sharded = ShardedVectorStore(InProcessVectorStore(), {'items': ShardPolicy('city', ['Nairobi', 'Mombasa'])})
+        sharded.create_collection('items', VectorParams(size=3, distance=Distance.COSINE))
+        sharded.upsert('items', [PointStruct(id=record.id, vector=record.vector, payload=record.payload)
+                                 for record in store.retrieve('items', [1, 2, 3, 4], with_vectors=True)])
+
+        assert sharded.store.count('items__nairobi').count == 2
+        assert sharded.store.count('items__other').count == 1
+        assert sharded.count('items').count == 4
+
+        for query in ([1.0, 0.0, 0.0], [0.2, 0.5, 0.9]):
+            assert ([hit.id for hit in sharded.search('items', query, limit=3, offset=1)] ==
+                    [hit.id for hit in store.search('items', query, limit=3, offset=1)])
+        nairobi = Filter(must=[FieldCondition(key='city', match=MatchValue(value='Nairobi'))])
+        assert ShardPolicy('city', ['Nairobi', 'Mombasa']).route(nairobi) == ['nairobi']
+        assert {hit.id for hit in sharded.search('items', [1.0, 1.0, 1.0], query_filter=nairobi)} == {1, 3}
+
+        sharded.set_payload('items', {'city': 'Mombasa'}, points=[1])
+        assert sharded.store.count('items__mombasa').count == 2
+        assert sharded.retrieve('items', [1])[0].payload['city'] == 'Mombasa'
+
+    def test_sharded_upsert_only_clears_other_shards_on_request(self, monkeypatch):
+        """Test plain upserts write one shard; shard_may_change also removes the point elsewhere"""
+        sharded = ShardedVectorStore(InProcessVectorStore(), {'items': ShardPolicy('city', ['Nairobi'])})
+        sharded.create_collection('items_v1', VectorParams(size=3, distance=Distance.COSINE))
+        deletes = []
+        monkeypatch.setattr(sharded.store, 'delete', lambda name, *args, **kwargs: deletes.append(name))
+
+        sharded.upsert('items_v1', [PointStruct(id=1, vector=[1.0, 0.0, 0.0], payload={'city': 'Nairobi'})])
+        assert deletes == []
+
+        monkeypatch.undo()
+        sharded.upsert('items_v1', [PointStruct(id=1, vector=[1.0, 0.0, 0.0], payload={'city': 'Kisumu'})],
+                       shard_may_change=True)
+        assert sharded.store.count('items_v1__nairobi').count == 0
+        assert sharded.count('items_v1').count == 1
+
+        # Physical shard names are passed through, not sharded again
+        assert sharded.count('items_v1__other').count == 1
+        assert sharded._policy('items_v1__other') is None and sharded._policy('items_v2024_01') is not None
+
+    @pytest.mark.skipif(vector_store.hnswlib is None, reason='hnswlib not installed')
+    def test_hnsw_agrees_with_exact_search(self):
+        """Test the HNSW path finds (nearly) the same neighbours as exact search"""
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(600, 16))
+
+        store = InProcessVectorStore(hnsw_threshold=500)
+        store.create_collection('big', VectorParams(size=16, distance=Distance.COSINE))
+        store.upsert('big', [PointStruct(id=i, vector=vector.tolist()) for i, vector in enumerate(vectors)])
+        store.delete('big', points_selector=[0, 1, 2])
+
+        recall = []
+        for query in rng.normal(size=(20, 16)):
+            approximate = {hit.id for hit in store.search('big', query.tolist(), limit=10)}
+            exact = {hit.id for hit in store.search('big', query.tolist(), limit=10,
+                                                    search_params=SearchParams(exact=True))}
+            assert not approximate & {0, 1, 2}
+            recall.append(len(approximate & exact) / 10)
+
+        assert np.mean(recall) >= 0.9
+
+
+class TestVectorServiceInProcess:
+    """Test VectorService against the in-process backend"""
+
+    def test_job_search_skips_closed_and_expired(self, monkeypatch):
+        """Test closed and past-deadline jobs never come back from search"""
+        monkeypatch.setenv('EMBEDDING_DIMENSION', '3')
+        service = VectorService()
+        service.client = InProcessVectorStore()
+        service.initialize_collections()
+
+        jobs = [
+            Job({'id': 'open'}),
+            Job({'id': 'closed', 'status': 'closed'}),
+            Job({'id': 'expired', 'application_deadline': datetime.utcnow() - timedelta(days=1)}),
+            Job({'id': 'upcoming', 'application_deadline': datetime.utcnow() + timedelta(days=1)})
+        ]
+        for job in jobs:
+            vectors = {name: [1.0, 0.0, 0.0] for name in service.JOB_VECTORS}
+            service.store_job_vector(job.id, vectors, job.to_vector_metadata())
+
+        hits = service.search_similar_jobs([1.0, 0.0, 0.0], limit=10)
+
+        assert {hit['job_id'] for hit in hits} == {'open', 'upcoming'}
+
+    def test_point_ids_are_deterministic(self, monkeypatch):
+        """Test re-storing a job replaces its point and each resume gets its own point"""
+        monkeypatch.setenv('EMBEDDING_DIMENSION', '3')
+        service = VectorService()
+        service.client = InProcessVectorStore()
+        service.initialize_collections()
+
+        first = service.store_job_vector('job-1', {name: [1.0, 0.0, 0.0] for name in service.JOB_VECTORS},
+                                         Job({'id': 'job-1', 'title': 'Old'}).to_vector_metadata())
+        second = service.store_job_vector('job-1', {name: [0.0, 1.0, 0.0] for name in service.JOB_VECTORS},
+                                          Job({'id': 'job-1', 'title': 'New'}).to_vector_metadata())
+        items = [{'job_id': 'job-1', 'embedding': {name: [0.0, 0.0, 1.0] for name in service.JOB_VECTORS},
+                  'metadata': Job({'id': 'job-1'}).to_vector_metadata()}]
+        bulk = service.store_job_vectors_bulk(items)[0]['vector_id']
+
+        assert first == second == bulk == service.job_vector_id('job-1') == VectorService.job_vector_id('job-1')
+        assert service.client.count(service.job_collection).count == 1
+        assert service.get_job_vector(first) == pytest.approx([0.0, 0.0, 1.0])
+
+        resume_ids = {service.store_resume_vector('user-1', [1.0, 0.0, 0.0], {}, resume_id)
+                      for resume_id in ('r1', 'r2', 'r1')}
+        assert resume_ids == {service.resume_vector_id('user-1', 'r1'), service.resume_vector_id('user-1', 'r2')}
+        assert service.resume_vector_id('user-2', 'r1') not in resume_ids
+        assert service.client.count(service.resume_collection).count == 2
+
+    def test_export_import_round_trip(self, monkeypatch, tmp_path):
+        """Test an exported collection reloads with the same vectors and payloads"""
+        monkeypatch.setenv('EMBEDDING_DIMENSION', '3')
+        service = VectorService()
+        service.client = InProcessVectorStore()
+        service.initialize_collections()
+
+        rng = np.random.default_rng(0)
+        for job_id in ('a', 'b', 'c'):
+            vectors = {name: rng.normal(size=3).tolist() for name in service.JOB_VECTORS}
+            service.store_job_vector(job_id, vectors, Job({'id': job_id}).to_vector_metadata())
+
+        manifest = service.export_collection('jobs', tmp_path, page_size=2)
+        assert manifest['count'] == 3 and manifest['vectors'] == sorted(service.JOB_VECTORS)
+
+        restored = VectorService()
+        restored.client = InProcessVectorStore()
+        assert restored.import_collection(tmp_path)['imported'] == 3
+
+        ids = [service.job_vector_id(job_id) for job_id in ('a', 'b', 'c')]
+        original = service.client.retrieve('jobs', ids, with_vectors=True)
+        reloaded = restored.client.retrieve('jobs', ids, with_vectors=True)
+        assert [point.payload for point in reloaded] == [point.payload for point in original]
+        for before, after in zip(original, reloaded):
+            for name in service.JOB_VECTORS:
+                assert np.allclose(before.vector[name], after.vector[name])
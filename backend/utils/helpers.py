@@ -1,5 +1,8 @@
 from typing import Any, Dict, Optional
 from datetime import datetime
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 def format_error_response(message: str, status_code: int = 400,
@@ -47,3 +50,14 @@ def paginate_results(query, page: int, per_page: int) -> Dict:
             'total_items': pagination.total
         }
     }
+
+
+def enqueue_task(name: str, *args) -> bool:
+    """Queue a Celery task by name; a broker failure is logged, never raised to the request"""
+    try:
+        from celery_app import celery
+        celery.send_task(name, args=list(args))
+        return True
+    except Exception as e:
+        logger.warning(f"Could not queue {name}: {e}")
+        return False